@@ -0,0 +1,54 @@
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.core.engine import Grid
+
+import numpy as np
+from src.utils.constants import CALL_CHANNEL_SIZE
+
+
+class AudioChannels:
+    """월드 공용 울음소리 채널.
+
+    말하기(speak) 채널에는 이번 턴에 소리가 난 그리드만 (CALL_CHANNEL_SIZE,) 배열로 기록하고,
+    턴이 끝나면 swap() 으로 듣기(listen) 채널과 통째로 교체한다.
+    조용한 그리드는 공용 읽기 전용 SILENCE 배열을 돌려주므로 빈 그리드에 대한 할당이 없다.
+    """
+
+    SILENCE = np.zeros(CALL_CHANNEL_SIZE, dtype=np.int32)
+    SILENCE.flags.writeable = False
+
+    def __init__(self):
+        self.speak: dict['Grid', np.ndarray] = {}
+        self.listen: dict['Grid', np.ndarray] = {}
+
+    def emit(self, grid: 'Grid', call: int):
+        """grid 의 말하기 채널에서 call 번 소리를 1 증가"""
+        channel = self.speak.get(grid)
+        if channel is None:
+            channel = self.speak[grid] = np.zeros(CALL_CHANNEL_SIZE, dtype=np.int32)
+        channel[call] += 1
+
+    def heard(self, grid: 'Grid') -> np.ndarray:
+        """grid 에서 지난 턴에 들린 소리 (복사 없이 채널 배열을 그대로 반환)"""
+        return self.listen.get(grid, self.SILENCE)
+
+    def get_state(self) -> dict:
+        """체크포인트용: 채널별 (소리가 난 그리드 좌표 (y, x) 배열, 채널 값 배열)"""
+        state = {}
+        for name, channel in (('speak', self.speak), ('listen', self.listen)):
+            grids = list(channel)
+            state[name] = {
+                'cells' : np.array([(grid.pos.y, grid.pos.x) for grid in grids], dtype=np.int64).reshape(len(grids), 2),
+                'values': np.array([channel[grid] for grid in grids], dtype=np.int32).reshape(len(grids), CALL_CHANNEL_SIZE),
+            }
+        return state
+
+    def set_state(self, state: dict, grid_array: list[list['Grid']]):
+        for name in ('speak', 'listen'):
+            cells, values = state[name]['cells'], state[name]['values']
+            setattr(self, name, {grid_array[y][x]: value for (y, x), value in zip(cells.tolist(), values)})
+
+    def swap(self):
+        """말하기 채널 값을 듣기 채널로 옮기고 말하기 채널을 비운다"""
+        self.listen = self.speak
+        self.speak = {}
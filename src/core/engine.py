@@ -1,31 +1,107 @@
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.simulation.parallel import Domain
+
+from src.core.store         import CreatureStore, IdBlocks
+from src.core.spatial       import SpatialHash, VisionIndex
+from src.core.audio         import AudioChannels
 from src.data.logger        import WorldLog
+from src.data.checkpoint    import pack_ragged, unpack_ragged, read_checkpoint, write_checkpoint
+from src.data.genome_store  import genome_digest
+from src.entities.brain     import BrainEngine
+from src.entities.senses    import VISION_SENSES, sense_vision_batch
+from src.entities.similarity import SimilarityIndex
+from src.entities.genome    import Genome
 from src.entities.organism  import Corpse, Creature
 from src.entities.environment import OrganicMatterSource
 from src.utils.datatypes    import Vector2, Traits, Genes
 from src.utils.constants    import *
 from src.utils.math_utils   import get_grid_coords
 from src.utils.noise_fields import generate_noise_field
+from src.utils.rng          import RandomStreams
+from src.utils.trait_computer import compute_biological_traits
 
+import heapq
 import numpy as np
 
 class World:
     
-    def __init__(self):
+    def __init__(self, fields: tuple[np.ndarray, np.ndarray] | None = None, domain: 'Domain | None' = None, ids: IdBlocks | None = None,
+                 seed: int = 0, populate: bool = True):
+        """
+        fields: 테두리를 포함한 (지형 고도, 유기물) 배열. 없으면 seed 로 새로 생성
+        domain: 병렬 실행 시 이 월드가 소유하는 그리드 영역. None 이면 월드 전체를 단독으로 처리하고 초기 생물과 로그도 직접 만든다
+        ids:    생물 ID 발급기 (병렬 실행 시 작업자별 블록)
+        seed:   모든 난수 스트림의 시드
+        populate: False 이면 초기 생물을 만들지 않고 기존 로그 파일도 비우지 않음 (체크포인트 복원용)
+        """
         self.time = 0
 
         self.solar_conversion_bonus = 50000
 
+        self.rng = RandomStreams(seed)
+        terrain_noise, organics_noise = fields if fields is not None else self.generate_fields(self.rng)
+
+        self.world = [[
+            Grid(xGrid, yGrid, terrain_noise[yGrid, xGrid], organics_noise[yGrid, xGrid])
+            for xGrid in range(WORLD_WIDTH_SCALE+4)]
+            for yGrid in range(WORLD_HIGHT_SCALE+4)
+        ]
+        
+        self.domain = domain
+        self.ids = ids if ids is not None else IdBlocks()
+        self.store = CreatureStore()
+        self.spatial = SpatialHash(self.store)
+        self.similarity = SimilarityIndex()
+        self.audio = AudioChannels()
+        self.brain_engine = BrainEngine()
+        self.logs = WorldLog(self.world, self.store, log_dir="logs" if domain is None else None, reset=populate)
+
+        # 생물/사체/울음소리가 있어 이번 턴에 처리해야 하는 그리드
+        self.active_grids: set['Grid'] = set()
+        self._sweep_heap: list[tuple[int, int]] | None = None
+        self._sweep_pos: tuple[int, int] = (-1, -1)
+
+        # 시야 반경 1~4 그리드 질의용 (외곽 테두리 그리드는 시야에서 제외)
+        self.vision = VisionIndex(self.world, bounds=(2, WORLD_HIGHT_SCALE+2, 2, WORLD_WIDTH_SCALE+2))
+
+        if domain is not None or not populate:
+            return      # 병렬 실행: 초기 생물은 조정자가 나눠 보냄 / 복원: 체크포인트의 생물을 씀
+
+        for lineage, (pos, genome_bytes) in enumerate(self.initial_creatures(self.rng)):
+            gridPos = get_grid_coords(pos)
+            creature = Creature(pos, genome_bytes, self, self.world[gridPos.y][gridPos.x], 0, lineage)
+            self.place(creature, self.world[gridPos.y][gridPos.x])
+            self.logs.register_creature({creature})
+
+    @staticmethod
+    def initial_creatures(rng: RandomStreams) -> list[tuple[Vector2, bytes]]:
+        """초기 생물의 (위치, 유전자) 목록 (단일/병렬 실행 공통). 목록 순번이 그 생물의 계보 키가 된다."""
+        generator = rng.stream('spawn')
+        xs = generator.integers(GRID_WIDTH_SCALE*2, GRID_WIDTH_SCALE*(WORLD_WIDTH_SCALE+2), CREATURES_SIZE)
+        ys = generator.integers(GRID_HIGHT_SCALE*2, GRID_HIGHT_SCALE*(WORLD_HIGHT_SCALE+2), CREATURES_SIZE)
+        genomes = generator.integers(0, 256, (CREATURES_SIZE, 3000), dtype=np.uint8)
+        return [
+            (Vector2(x, y), genome.tobytes())
+            for x, y, genome in zip(xs.tolist(), ys.tolist(), genomes)
+        ]
+
+    @classmethod
+    def generate_fields(cls, rng: RandomStreams) -> tuple[np.ndarray, np.ndarray]:
+        """테두리를 포함한 지형 고도와 유기물 분포 배열을 생성"""
+        generator = rng.stream('world')
+
         # === 원본 노이즈 생성 ===
         terrain_noise = generate_noise_field(
             shape=(WORLD_WIDTH_SCALE, WORLD_HIGHT_SCALE),
             scale=20,
-            seeds=np.random.randint(100)
+            seeds=int(generator.integers(100))
         )
 
         organics_noise = generate_noise_field(
             shape=(WORLD_WIDTH_SCALE, WORLD_HIGHT_SCALE),
             scale=WORLD_WIDTH_SCALE / 1,
-            seeds=[np.random.randint(100) for _ in range(NUM_ORGANIC)]
+            seeds=[int(generator.integers(100)) for _ in range(NUM_ORGANIC)]
         )
 
         # === 초기화 및 기본 복사 ===
@@ -46,28 +122,11 @@ class World:
         terrain_noise = terrain_with_border
         organics_noise = organics_with_border
         
-        terrain_noise = self.save_altitude_from_noise(terrain_noise)
-
-        self.world = [[
-            Grid(xGrid, yGrid, terrain_noise[yGrid, xGrid], organics_noise[yGrid, xGrid])
-            for xGrid in range(WORLD_WIDTH_SCALE+4)]
-            for yGrid in range(WORLD_HIGHT_SCALE+4)
-        ]
-        
-        self.logs = WorldLog(self.world)
-
-        self.build_vision_refs(max_radius=4)  # 시야 반경 1~4까지 지원
+        terrain_noise = cls.save_altitude_from_noise(terrain_noise)
+        return terrain_noise, organics_noise
 
-        for _ in range(CREATURES_SIZE):
-            pos = Vector2(np.random.randint(GRID_WIDTH_SCALE*2, GRID_WIDTH_SCALE*(WORLD_WIDTH_SCALE+2)), 
-                          np.random.randint(GRID_HIGHT_SCALE*2, GRID_HIGHT_SCALE*(WORLD_HIGHT_SCALE+2)))
-            gridPos = get_grid_coords(pos)
-            creature = Creature(pos, np.random.randint(0, 256, 3000, dtype=np.uint8).tobytes(), self, self.world[gridPos.y][gridPos.x], 0)
-            self.world[gridPos.y][gridPos.x].creatures.add(creature)
-            self.logs.register_creature({creature})
-
-    
-    def save_altitude_from_noise(self, terrain_noise: np.ndarray, save_path: str = "logs/terrain_altitude.npy"):
+    @staticmethod
+    def save_altitude_from_noise(terrain_noise: np.ndarray, save_path: str = "logs/terrain_altitude.npy"):
         """
         [-1.0, 1.0] 범위의 노이즈를 0~20 사이의 정수 고도값으로 변환하여 저장
         """
@@ -75,34 +134,259 @@ class World:
         np.save(save_path, altitude)
         return altitude
 
-    def build_vision_refs(self, max_radius: int):
-        """모든 Grid에 대해 시야 반경별 creatures 참조 리스트 생성"""
-        for y in range(2, WORLD_HIGHT_SCALE+2):
-            for x in range(2, WORLD_WIDTH_SCALE+2):
-                grid = self.world[y][x]
-                grid.vision_refs = []  # radius: List[Set[Creature]]
-
-                for r in range(1, max_radius + 1):
-                    refs = set()
-                    for dy in range(-r, r + 1):
-                        ny = y + dy
-                        if not (2 <= ny < WORLD_HIGHT_SCALE+2):
-                            continue
-                        for dx in range(-r, r + 1):
-                            nx = x + dx
-                            if not (2 <= nx < WORLD_WIDTH_SCALE+2):
-                                continue
-                            neighbor = self.world[ny][nx]
-                            refs.update(neighbor.creatures)
-                    grid.vision_refs.append(refs)
-
-    def Trun(self):
-        for yGrid in self.world:
-            for grid in yGrid:
-                grid.process_creatures(self)
-                grid.turn()
-                #grid.organics.regenerate()
-        self.logs.log_turn()
+    def population(self) -> int:
+        return len(self.store) - int(np.count_nonzero(self.store.ghost[:self.store.used] & self.store.alive[:self.store.used]))
+
+    def place(self, creature: Creature, grid: 'Grid'):
+        """생물을 grid 에 배치하고 공간 인덱스에 등록"""
+        grid.creatures.add(creature)
+        creature.grid = grid
+        self.activate(grid)
+        self.spatial.insert(creature)
+        self.vision.add(grid)
+
+    def detach(self, creature: Creature):
+        """생물을 그리드와 공간 인덱스에서 빼고 저장소 행을 반납 (죽음/도메인 이동)"""
+        creature.grid.creatures.discard(creature)
+        self.spatial.remove(creature)
+        self.vision.remove(creature.grid)
+        creature.release()
+
+    def creatures_by_id(self) -> dict[int, Creature]:
+        return {creature.id: creature for creature in map(self.store.creatures.__getitem__, self.store.live_rows())}
+
+    def export_creatures(self, creatures: list[Creature]) -> dict:
+        """생물 상태를 열 단위로 내보냄 (도메인 간 이동, halo 복사, 체크포인트에 사용).
+        죽어서 행을 반납한 개체는 마지막 상태의 사본에서 읽는다."""
+        store = self.store
+        if all(creature._store is store for creature in creatures):
+            rows = np.fromiter((creature._row for creature in creatures), dtype=np.int64, count=len(creatures))
+            columns = {name: getattr(store, name)[rows].copy() for name, _ in CreatureStore.STATE_COLUMNS}
+        else:
+            columns = {
+                name: np.array([getattr(creature._store, name)[creature._row] for creature in creatures], dtype=dtype)
+                for name, dtype in CreatureStore.STATE_COLUMNS
+            }
+        return {
+            'columns'    : columns,
+            'genomes'    : [creature.genome.genome_bytes for creature in creatures],
+            'brain_nodes': [creature.brain_nodes for creature in creatures],
+            'cry_volume' : np.array([creature.cry_volume for creature in creatures], dtype=bool).reshape(len(creatures), CRY_VOLUME_SIZE),
+            'attention'  : np.array([
+                creature.attention_creature.id if creature.attention_creature is not None else -1
+                for creature in creatures
+            ], dtype=np.int64),
+        }
+
+    def import_creatures(self, payload: dict, ghost: bool = False,
+                         parsed: dict[int, tuple[Genome, Traits]] | None = None) -> list[Creature]:
+        """export_creatures 로 내보낸 생물들을 이 월드에 되살려 배치.
+        parsed 는 ID 별 (Genome, Traits) 캐시로, 같은 개체를 반복해서 받을 때 유전자 해석을 건너뛴다.
+        새로 해석할 유전자는 IMPORT_PARSE_BATCH 개씩 나눠 해석하고, 내용이 같은 유전자(변이 없이 복제된 자손)는
+        한 번만 해석해 Genome/Traits 를 공유한다."""
+        columns = payload['columns']
+        ids = columns['id'].tolist()
+        parsed = parsed if parsed is not None else {}
+
+        by_digest: dict[bytes, tuple[Genome, Traits]] = {}
+        missing = [i for i, creature_id in enumerate(ids) if creature_id not in parsed]
+        for start in range(0, len(missing), IMPORT_PARSE_BATCH):
+            batch = missing[start:start + IMPORT_PARSE_BATCH]
+            digests = [genome_digest(payload['genomes'][i]) for i in batch]
+            new = {digest: payload['genomes'][i] for i, digest in zip(batch, digests) if digest not in by_digest}
+            for digest, genome in zip(new, Genome.parse_batch(list(new.values()))):
+                by_digest[digest] = (genome, compute_biological_traits(genome.traits))
+            for i, digest in zip(batch, digests):
+                parsed[ids[i]] = by_digest[digest]
+
+        creatures = []
+        for i, creature_id in enumerate(ids):
+            genome, traits = parsed[creature_id]
+            creature = Creature.restore(self, genome, {name: values[i] for name, values in columns.items()}, traits)
+
+            self.store.ghost[creature._row] = ghost
+            self.store.alive[creature._row] = True
+            creature.brain_nodes = np.array(payload['brain_nodes'][i], dtype=np.float64)
+            creature.cry_volume = payload['cry_volume'][i].tolist()
+            self.place(creature, creature.grid)
+            creatures.append(creature)
+
+        # 주의 대상은 이 월드에 있는 개체만 연결 (없으면 자기 자신)
+        known = self.creatures_by_id()
+        for creature, target in zip(creatures, payload['attention'].tolist()):
+            creature.attention_creature = known.get(target, creature)
+        return creatures
+
+    def save_checkpoint(self, path: str):
+        """월드 전체 상태를 path 에 기록 (단일 프로세스 월드용, 턴 사이에 호출).
+        생물 상태는 저장소 열과 이어붙인 유전자/뇌 노드 버퍼로, 그리드 상태는 배열로 저장한다."""
+        store = self.store
+        rows = store.live_rows()
+        creatures = [store.creatures[row] for row in rows]
+        # 죽었지만 살아있는 생물의 주의 대상으로 남아 있는 개체 (마지막 상태의 사본)
+        targets = {
+            creature.attention_creature.id: creature.attention_creature for creature in creatures
+            if creature.attention_creature._store is not store
+        }
+
+        grids = [grid for row in self.world for grid in row]
+        corpses = [(grid, corpse) for grid in grids for corpse in grid.corpses]
+        sounds = [(grid.pos.y, grid.pos.x, call) for grid in grids for call in grid.crying_sound_set]
+
+        write_checkpoint(path, {
+            'time'          : self.time,
+            'solar_conversion_bonus': self.solar_conversion_bonus,
+            'rng'           : self.rng.get_state(),
+            'ids'           : self.ids.get_state(),
+            'log'           : self.logs.position(),
+            'terrain'       : np.array([[grid.terrain for grid in row] for row in self.world]),
+            'organics'      : np.array([[grid.organics for grid in row] for row in self.world], dtype=np.float64),
+            'corpse_cells'  : np.array([
+                (grid.pos.y, grid.pos.x, corpse.position.x, corpse.position.y) for grid, corpse in corpses
+            ], dtype=np.int64).reshape(len(corpses), 4),
+            'corpse_energy' : np.array([corpse.energy for _, corpse in corpses], dtype=np.float64),
+            'sounds'        : np.array(sounds, dtype=np.int64).reshape(len(sounds), 3),
+            'active_grids'  : np.array([(grid.pos.y, grid.pos.x) for grid in self.active_grids], dtype=np.int64).reshape(-1, 2),
+            'audio'         : self.audio.get_state(),
+            'store_layout'  : store.layout(),
+            'rows'          : rows,
+            'creatures'     : self._pack_creatures(creatures),
+            'attention_targets': self._pack_creatures(list(targets.values())),
+        })
+
+    def _pack_creatures(self, creatures: list[Creature]) -> dict:
+        """체크포인트용 생물 묶음: export_creatures 결과의 유전자/뇌 노드를 이어붙인 버퍼로 바꾼 것"""
+        payload = self.export_creatures(creatures)
+        brain_nodes, brain_node_lengths = pack_ragged([nodes.ravel() for nodes in payload['brain_nodes']])
+        return {
+            'columns'           : payload['columns'],
+            'genomes'           : np.frombuffer(b"".join(payload['genomes']), dtype=np.uint8),
+            'genome_lengths'    : np.fromiter(map(len, payload['genomes']), dtype=np.int64, count=len(creatures)),
+            'brain_nodes'       : brain_nodes,
+            'brain_node_lengths': brain_node_lengths,
+            'cry_volume'        : payload['cry_volume'],
+            'attention'         : payload['attention'],
+        }
+
+    @staticmethod
+    def _unpack_creatures(packed: dict) -> dict:
+        """_pack_creatures 의 역변환 (import_creatures 에 넘길 묶음)"""
+        genomes = packed['genomes'].tobytes()
+        bounds = np.concatenate([[0], np.cumsum(packed['genome_lengths'])]).astype(np.int64).tolist()
+        return {
+            'columns'    : packed['columns'],
+            'genomes'    : [genomes[start:end] for start, end in zip(bounds[:-1], bounds[1:])],
+            'brain_nodes': [
+                nodes.reshape(-1, 3) if len(nodes) else nodes
+                for nodes in unpack_ragged(packed['brain_nodes'], packed['brain_node_lengths'])
+            ],
+            'cry_volume' : packed['cry_volume'],
+            'attention'  : packed['attention'],
+        }
+
+    @classmethod
+    def load_checkpoint(cls, path: str) -> 'World':
+        """save_checkpoint 로 기록한 월드를 되살림. 로그는 체크포인트 시점 뒤의 기록을 잘라내고 이어서 쓴다."""
+        state = read_checkpoint(path)
+        organics = state['organics']
+        world = cls(
+            fields=(state['terrain'], np.zeros(organics.shape)),
+            ids=IdBlocks.from_state(state['ids']),
+            seed=state['rng']['seed'],
+            populate=False,
+        )
+        world.time = state['time']
+        world.solar_conversion_bonus = state['solar_conversion_bonus']
+        world.rng.set_state(state['rng'])
+        world.logs.resume(state['log'])
+        world.audio.set_state(state['audio'], world.world)
+
+        for y, row in enumerate(world.world):
+            for x, grid in enumerate(row):
+                grid.organics = organics[y, x].tolist()
+        for (grid_y, grid_x, x, y), energy in zip(state['corpse_cells'].tolist(), state['corpse_energy'].tolist()):
+            grid = world.world[grid_y][grid_x]
+            grid.corpses.add(Corpse(grid, Vector2(x, y), energy))
+        for grid_y, grid_x, call in state['sounds'].tolist():
+            world.world[grid_y][grid_x].crying_sound_set.add(call)
+
+        store = world.store
+        store.restore_layout(state['store_layout'], state['rows'])
+        creatures = world.import_creatures(cls._unpack_creatures(state['creatures']))
+
+        # 죽은 주의 대상은 잠시 배치했다가 떼어내 마지막 상태의 사본으로 만들고, 행 배치는 저장 당시대로 되돌림
+        layout = store.layout()
+        targets = {target.id: target for target in world.import_creatures(cls._unpack_creatures(state['attention_targets']))}
+        for target in targets.values():
+            world.detach(target)
+        store.used, store.free_rows = layout['used'], layout['free_rows']
+        for creature, target in zip(creatures, state['creatures']['attention'].tolist()):
+            if target in targets:
+                creature.attention_creature = targets[target]
+
+        # 생물 배치로 활성화된 그리드 대신 저장 당시의 활성 그리드를 그대로 사용
+        world.active_grids = {world.world[y][x] for y, x in state['active_grids'].tolist()}
+        return world
+
+    def activate(self, grid: 'Grid'):
+        """grid 를 처리 대상에 추가.
+        진행 중인 순회에서 아직 지나지 않은 위치라면 이번 턴에도 처리되도록 순회 힙에 넣는다
+        (전체 그리드를 (y, x) 순서로 훑던 것과 같은 결과를 유지하기 위함).
+        병렬 실행에서는 이 월드가 소유한 그리드만 처리한다."""
+        if grid in self.active_grids:
+            return
+        if self.domain is not None and not self.domain.owns(grid.pos.x, grid.pos.y):
+            return
+        self.active_grids.add(grid)
+        key = (grid.pos.y, grid.pos.x)
+        if self._sweep_heap is not None and key > self._sweep_pos:
+            heapq.heappush(self._sweep_heap, key)
+
+    def deactivate_if_idle(self, grid: 'Grid'):
+        """생물/사체/울음소리가 하나도 없으면 처리 대상에서 뺌 (로그 수집도 활성 그리드만 훑으므로 이 조건을 유지해야 함)"""
+        if not (grid.creatures or grid.corpses or grid.crying_sound_set):
+            self.active_grids.discard(grid)
+
+    def active_sweep(self):
+        """활성 그리드를 (y, x) 순서로 순회"""
+        self._sweep_heap = [(grid.pos.y, grid.pos.x) for grid in self.active_grids]
+        heapq.heapify(self._sweep_heap)
+        try:
+            while self._sweep_heap:
+                self._sweep_pos = heapq.heappop(self._sweep_heap)
+                yield self.world[self._sweep_pos[0]][self._sweep_pos[1]]
+        finally:
+            self._sweep_heap = None
+            self._sweep_pos = (-1, -1)
+
+    def think(self):
+        """뇌를 가진 모든 생물의 감각 → 뇌 연산 → 행동 단계를 일괄 수행"""
+        thinkers = [
+            creature for creature in map(self.store.creatures.__getitem__, self.store.owned_rows())
+            if creature.traits.brain_max_nodeInx
+        ]
+        seeing = [creature for creature in thinkers if VISION_SENSES & creature.traits.brain_input_key_set]
+        vision = sense_vision_batch(self, seeing)
+        vision_of = {creature: vision.detections(i, self.store) for i, creature in enumerate(seeing)}
+
+        sensed = [creature.sense(vision_of.get(creature)) for creature in thinkers]
+
+        self.brain_engine.run(thinkers, [inputs for inputs, _ in sensed])
+
+        for creature, (_, visual_creatures) in zip(thinkers, sensed):
+            creature.act(visual_creatures)
+
+    def Trun(self, metabolize: bool = True):
+        """한 턴 진행. 병렬 작업자는 경계 띠를 내보내기 전에 기초 대사를 먼저 차감하므로 metabolize=False 로 부른다"""
+        if metabolize:
+            self.store.metabolize()
+        self.think()
+        for grid in self.active_sweep():
+            grid.process_creatures(self)
+            #grid.organics.regenerate()
+        self.audio.swap()
+        if self.domain is None:
+            self.logs.log_turn(self.active_grids)    # 병렬 실행에서는 조정자가 작업자 기록을 모아서 기록
         #print(self.time)
         self.time += 1
 
@@ -111,7 +395,6 @@ class Grid:
         self.pos = Vector2(x, y)
         self.creatures = set()
         self.corpses = set()
-        self.vision_refs = [[] for _ in range(4)]  # 시야 반경별 참조 리스트 초기화
 
         self.terrain = terrain_noise
 
@@ -122,20 +405,15 @@ class Grid:
         #     for i in range(NUM_ORGANIC)
         # ])
 
-        self.crying_sound = [[0 for _ in range(1000)] for _ in range(2)]
-        self.crying_sound_set = set()
+        self.crying_sound_set = set()   # 이번 턴에 이 그리드에서 난 울음소리 번호 (소리 값은 world.audio)
 
-    def turn(self):
-        self.crying_sound[1] = self.crying_sound[0] #말하기 채널 값을 듣기 채널로 이동.
-        self.crying_sound[0] = [0]*1000             #말하기 채널 초기화.
-        
     def process_creatures(self, world: World):
         self.crying_sound_set = set()
         creature_spawn_queue = set()
         creature_remove_queue = set()
         corpse_remove_queue = set()
 
-        for creature in list(self.creatures):  # 안전한 복사 반복
+        for creature in sorted(self.creatures, key=Creature.sort_key):  # 안전한 복사 반복 (ID 순서로 처리 순서 고정)
             result = creature.update()
 
             # 죽음
@@ -153,6 +431,8 @@ class Grid:
                 self.creatures.discard(creature)
                 world.world[new_grid.y][new_grid.x].creatures.add(creature)
                 creature.grid = world.world[new_grid.y][new_grid.x]  # 업데이트 필수
+                world.activate(creature.grid)
+                world.vision.move(self, creature.grid)
 
         for corpse in list(self.corpses):
             result = corpse.decay()
@@ -161,7 +441,7 @@ class Grid:
                 corpse_remove_queue.add(corpse)
 
         for creature in creature_remove_queue:
-            self.creatures.discard(creature)
+            world.detach(creature)
 
         
         for corpse in corpse_remove_queue:
@@ -169,7 +449,7 @@ class Grid:
 
         for offspring in creature_spawn_queue:
             c = get_grid_coords(offspring.position)
-            world.world[c.y][c.x].creatures.add(offspring)
-            offspring.grid = world.world[c.y][c.x]
+            world.place(offspring, world.world[c.y][c.x])
 
-        world.logs.register_creature(creature_spawn_queue)
\ No newline at end of file
+        world.logs.register_creature(creature_spawn_queue)
+        world.deactivate_if_idle(self)
\ No newline at end of file
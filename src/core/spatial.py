@@ -0,0 +1,156 @@
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.core.engine import Grid
+    from src.core.store import CreatureStore
+    from src.entities.organism import Creature
+
+import numpy as np
+from src.utils.constants import SPATIAL_CELL_SIZE
+from src.utils.datatypes import Vector2
+
+
+class SpatialHash:
+    """균일 셀 해시 기반 근접 탐색 인덱스.
+
+    월드 좌표를 cell_size 단위 셀로 나누어 셀마다 생물 집합을 유지한다.
+    생물의 탄생/죽음/이동 시 해당 셀만 갱신하며, 반경 질의는 반경에 걸치는 셀만
+    확인하므로 그리드(GRID_WIDTH_SCALE) 경계를 넘는 탐색도 주변 개체 수에 비례한 비용으로 처리된다.
+    """
+
+    def __init__(self, store: 'CreatureStore', cell_size: int = SPATIAL_CELL_SIZE):
+        self.store = store
+        self.cell_size = cell_size
+        self.cells: dict[tuple[int, int], set['Creature']] = {}
+        self.cell_of: dict['Creature', tuple[int, int]] = {}
+
+    def __len__(self):
+        return len(self.cell_of)
+
+    def __contains__(self, creature: 'Creature'):
+        return creature in self.cell_of
+
+    def _cell(self, x, y) -> tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, creature: 'Creature'):
+        pos = creature.position
+        cell = self._cell(pos.x, pos.y)
+        self.cells.setdefault(cell, set()).add(creature)
+        self.cell_of[creature] = cell
+
+    def remove(self, creature: 'Creature'):
+        cell = self.cell_of.pop(creature, None)
+        if cell is None:
+            return
+        members = self.cells[cell]
+        members.discard(creature)
+        if not members:
+            del self.cells[cell]
+
+    def move(self, creature: 'Creature'):
+        """위치가 바뀐 생물의 셀을 갱신 (셀이 그대로면 아무 일도 하지 않음)"""
+        old = self.cell_of.get(creature)
+        if old is None:
+            return
+        pos = creature.position
+        new = self._cell(pos.x, pos.y)
+        if new == old:
+            return
+        members = self.cells[old]
+        members.discard(creature)
+        if not members:
+            del self.cells[old]
+        self.cells.setdefault(new, set()).add(creature)
+        self.cell_of[creature] = new
+
+    def _candidates(self, origin: Vector2, radius: float) -> list['Creature']:
+        """반경의 경계 상자와 겹치는 셀에 속한 생물 목록"""
+        x0, y0 = self._cell(origin.x - radius, origin.y - radius)
+        x1, y1 = self._cell(origin.x + radius, origin.y + radius)
+
+        candidates = []
+        if (x1 - x0 + 1) * (y1 - y0 + 1) <= len(self.cells):
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    members = self.cells.get((cx, cy))
+                    if members:
+                        candidates.extend(members)
+        else:
+            # 반경이 매우 크면 비어있지 않은 셀만 훑는 편이 빠르다
+            for (cx, cy), members in self.cells.items():
+                if x0 <= cx <= x1 and y0 <= cy <= y1:
+                    candidates.extend(members)
+        return candidates
+
+    def distances_sq(self, origin: Vector2, candidates: list['Creature']) -> np.ndarray:
+        rows = np.fromiter((c._row for c in candidates), dtype=np.int64, count=len(candidates))
+        dx = self.store.x[rows] - origin.x
+        dy = self.store.y[rows] - origin.y
+        return dx * dx + dy * dy
+
+    def query_radius(self, origin: Vector2, radius: float, exclude: 'Creature' = None) -> list['Creature']:
+        """origin 에서 radius 이내(경계 포함)의 모든 생물을 반환"""
+        candidates = [c for c in self._candidates(origin, radius) if c is not exclude]
+        if not candidates:
+            return []
+        within = np.flatnonzero(self.distances_sq(origin, candidates) <= radius * radius)
+        return [candidates[i] for i in within]
+
+    def nearest_of(self, origin: Vector2, candidates: list['Creature'], radius: float) -> 'Creature | None':
+        """candidates 중 origin 에서 radius 이내 가장 가까운 생물 (거리가 같으면 계보 키 순, 없으면 None)"""
+        if not candidates:
+            return None
+        rows = np.fromiter((c._row for c in candidates), dtype=np.int64, count=len(candidates))
+        dists_sq = self.distances_sq(origin, candidates)
+        i = int(np.lexsort((self.store.lineage[rows], dists_sq))[0])
+        return candidates[i] if dists_sq[i] <= radius * radius else None
+
+    def nearest(self, origin: Vector2, radius: float, exclude: 'Creature' = None) -> 'Creature | None':
+        """origin 에서 radius 이내 가장 가까운 생물을 반환 (없으면 None)"""
+        candidates = [c for c in self._candidates(origin, radius) if c is not exclude]
+        if not candidates:
+            return None
+        dists_sq = self.distances_sq(origin, candidates)
+        i = int(np.argmin(dists_sq))
+        return candidates[i] if dists_sq[i] <= radius * radius else None
+
+
+class VisionIndex:
+    """그리드 단위 시야 질의용 인덱스.
+
+    그리드별 생물 수를 배열로 유지하고, 반경 r 그리드 이내의 생물은
+    점유된 그리드의 creatures 집합을 그대로 이어서 돌려준다.
+    생물의 탄생/죽음/그리드 이동 때마다 해당 칸의 개수만 갱신하므로 항상 최신 상태이며,
+    빈 주변 영역에 대한 질의는 창(window) 하나를 확인하는 비용만 든다.
+    """
+
+    def __init__(self, grid_array: list[list['Grid']], bounds: tuple[int, int, int, int]):
+        self.grid_array = grid_array
+        self.counts = np.zeros((len(grid_array), len(grid_array[0])), dtype=np.int32)
+        self.y_min, self.y_max, self.x_min, self.x_max = bounds   # 시야가 닿는 그리드 범위 [min, max)
+
+    def add(self, grid: 'Grid'):
+        self.counts[grid.pos.y, grid.pos.x] += 1
+
+    def remove(self, grid: 'Grid'):
+        self.counts[grid.pos.y, grid.pos.x] -= 1
+
+    def move(self, old: 'Grid', new: 'Grid'):
+        self.counts[old.pos.y, old.pos.x] -= 1
+        self.counts[new.pos.y, new.pos.x] += 1
+
+    def occupied_grids(self, grid: 'Grid', radius: int) -> list['Grid']:
+        """grid 를 중심으로 반경 radius 그리드 이내에서 생물이 있는 그리드 목록"""
+        y0 = max(grid.pos.y - radius, self.y_min)
+        y1 = min(grid.pos.y + radius + 1, self.y_max)
+        x0 = max(grid.pos.x - radius, self.x_min)
+        x1 = min(grid.pos.x + radius + 1, self.x_max)
+        if y0 >= y1 or x0 >= x1:
+            return []
+        ys, xs = np.nonzero(self.counts[y0:y1, x0:x1])
+        return [self.grid_array[y0 + y][x0 + x] for y, x in zip(ys.tolist(), xs.tolist())]
+
+    def creatures_around(self, grid: 'Grid', radius: int):
+        """grid 를 중심으로 반경 radius 그리드 이내의 모든 생물을 순회"""
+        for neighbor in self.occupied_grids(grid, radius):
+            yield from neighbor.creatures
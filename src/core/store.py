@@ -0,0 +1,188 @@
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.entities.organism import Creature
+    from src.utils.datatypes import Traits
+
+import numpy as np
+from src.utils.constants import ID_BLOCK_SIZE
+
+
+class CreatureStore:
+    """월드 전체 생물 상태를 열(column) 단위 NumPy 배열로 보관하는 저장소.
+
+    Creature 는 이 저장소의 한 행(row)을 가리키는 가벼운 뷰이며,
+    대사/이동/로그처럼 전체 개체에 같은 연산을 적용하는 단계는 열 전체에 대해 한 번에 수행한다.
+    """
+
+    # 동적 상태 열: (열 이름, dtype)
+    STATE_COLUMNS = (
+        ('id',               np.int64),
+        ('lineage',          np.int64),     # 작업자 분할과 무관한 개체 식별 키 (난수 스트림, 처리 순서에 사용)
+        ('x',                np.int64),
+        ('y',                np.int64),
+        ('energy',           np.float64),
+        ('health',           np.int64),
+        ('grid_x',           np.int32),
+        ('grid_y',           np.int32),
+        ('birth_turn',       np.int64),
+        ('move_speed',       np.float64),
+        ('move_dir_x',       np.float64),
+        ('move_dir_y',       np.float64),
+        ('attack_intent',    np.bool_),
+        ('reproduce_intent', np.bool_),
+        ('eat_intent',       np.bool_),
+        ('alive',            np.bool_),
+        ('ghost',            np.bool_),     # 다른 도메인 소유 개체의 사본 (병렬 실행 시 halo 영역)
+    )
+
+    # 자주 쓰이는 특성 열: (열 이름, Traits 속성명, dtype)
+    TRAIT_COLUMNS = (
+        ('size',             'size',             np.float64),
+        ('BMR',              'BMR',              np.float64),
+        ('speed',            'speed',            np.float64),
+        ('move_cost',        'move_cost',        np.float64),
+        ('attack_range',     'attack_range',     np.float64),
+        ('lifespan',         'lifespan',         np.float64),
+        ('energy_reserve',   'energy_reserve',   np.float64),
+        ('max_health',       'health',           np.float64),
+        ('food_intake',      'food_intake',      np.int8),
+    )
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = max(1, capacity)
+        self.used = 0                       # 한 번이라도 사용된 행의 수 (상한)
+        self.count = 0                      # 살아있는 행의 수
+        self.free_rows: list[int] = []
+        self.creatures: list['Creature | None'] = [None] * self.capacity
+
+        for name, dtype in self.STATE_COLUMNS:
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+        for name, _, dtype in self.TRAIT_COLUMNS:
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self):
+        return self.count
+
+    def column_names(self) -> list[str]:
+        return [name for name, _ in self.STATE_COLUMNS] + [name for name, _, _ in self.TRAIT_COLUMNS]
+
+    def _grow(self):
+        """용량을 두 배로 늘린다. 기존 배열을 새 배열로 교체하므로 열 참조는 매번 새로 읽어야 한다."""
+        new_capacity = self.capacity * 2
+        for name in self.column_names():
+            old = getattr(self, name)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, name, new)
+        self.creatures.extend([None] * (new_capacity - self.capacity))
+        self.capacity = new_capacity
+
+    def allocate(self, creature: 'Creature', traits: 'Traits') -> int:
+        """새 행을 할당하고 특성 열을 채운 뒤 행 번호를 반환"""
+        if self.free_rows:
+            row = self.free_rows.pop()
+        else:
+            if self.used == self.capacity:
+                self._grow()
+            row = self.used
+            self.used += 1
+
+        for name, _ in self.STATE_COLUMNS:
+            getattr(self, name)[row] = 0
+        for name, attr, _ in self.TRAIT_COLUMNS:
+            getattr(self, name)[row] = getattr(traits, attr)
+
+        self.alive[row] = True
+        self.creatures[row] = creature
+        self.count += 1
+        return row
+
+    def snapshot(self, row: int) -> 'CreatureStore':
+        """한 행의 값을 복사한 1행짜리 저장소를 반환"""
+        detached = CreatureStore(capacity=1)
+        for name in self.column_names():
+            getattr(detached, name)[0] = getattr(self, name)[row]
+        detached.used = detached.count = 1
+        detached.creatures[0] = self.creatures[row]
+        return detached
+
+    def release(self, row: int) -> 'CreatureStore':
+        """행을 반납하고, 죽은 개체가 계속 참조될 수 있도록 마지막 상태의 사본을 반환"""
+        detached = self.snapshot(row)
+        detached.alive[0] = False
+        self.alive[row] = False
+        self.creatures[row] = None
+        self.free_rows.append(row)
+        self.count -= 1
+        return detached
+
+    def layout(self) -> dict:
+        """체크포인트용 행 배치 정보"""
+        return {'used': self.used, 'free_rows': list(self.free_rows)}
+
+    def restore_layout(self, layout: dict, rows: np.ndarray):
+        """체크포인트 복원 준비: 이후의 allocate 가 rows 를 차례로 받고,
+        그 다음부터는 저장 당시의 빈 행 목록을 쓰도록 설정 (저장 전과 같은 행 번호를 유지)"""
+        while self.capacity < layout['used']:
+            self._grow()
+        self.used = layout['used']
+        self.free_rows = list(layout['free_rows']) + rows[::-1].tolist()
+
+    def live_rows(self) -> np.ndarray:
+        """살아있는 행 번호 배열"""
+        return np.flatnonzero(self.alive[:self.used])
+
+    def owned_rows(self) -> np.ndarray:
+        """살아있고 이 월드가 직접 처리하는(ghost 가 아닌) 행 번호 배열"""
+        n = self.used
+        return np.flatnonzero(self.alive[:n] & ~self.ghost[:n])
+
+    def metabolize(self):
+        """직접 처리하는 모든 개체에서 기초 대사량만큼 에너지를 차감"""
+        n = self.used
+        self.energy[:n] -= np.where(self.alive[:n] & ~self.ghost[:n], self.BMR[:n], 0)
+
+
+class IdBlocks:
+    """전역적으로 겹치지 않는 생물 ID 발급기.
+
+    ID 공간을 block_size 크기의 블록으로 나누고, 작업자 worker 는 전체 workers 개 중
+    worker, worker+workers, worker+2*workers ... 번째 블록만 차례로 사용한다.
+    단일 프로세스(workers=1)에서는 0 부터 연속된 ID 가 된다.
+    """
+
+    def __init__(self, worker: int = 0, workers: int = 1, block_size: int = ID_BLOCK_SIZE):
+        self.worker = worker
+        self.workers = workers
+        self.block_size = block_size
+        self.issued = 0                     # 이 작업자가 발급한 ID 수
+
+    def get_state(self) -> dict:
+        return {'worker': self.worker, 'workers': self.workers, 'block_size': self.block_size, 'issued': self.issued}
+
+    @classmethod
+    def from_state(cls, state: dict) -> 'IdBlocks':
+        ids = cls(state['worker'], state['workers'], state['block_size'])
+        ids.issued = state['issued']
+        return ids
+
+    def next(self) -> int:
+        block, offset = divmod(self.issued, self.block_size)
+        self.issued += 1
+        return (block * self.workers + self.worker) * self.block_size + offset
+
+
+class StoreColumn:
+    """Creature 속성을 CreatureStore 의 한 열에 연결하는 디스크립터"""
+
+    def __init__(self, column: str, cast=float):
+        self.column = column
+        self.cast = cast
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return self.cast(getattr(obj._store, self.column)[obj._row])
+
+    def __set__(self, obj, value):
+        getattr(obj._store, self.column)[obj._row] = value
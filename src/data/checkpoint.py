@@ -0,0 +1,62 @@
+import os
+import msgpack
+import numpy as np
+import zstandard as zstd
+
+CHECKPOINT_VERSION = 4
+NDARRAY_EXT = 1     # msgpack 확장 타입 번호: [dtype, shape] 헤더 + 원시 버퍼
+
+
+def _encode(obj):
+    """msgpack 이 모르는 값 변환: NumPy 배열은 원시 버퍼 그대로, NumPy 스칼라는 파이썬 값으로"""
+    if isinstance(obj, np.ndarray):
+        array = np.ascontiguousarray(obj)
+        header = msgpack.packb([array.dtype.str, list(array.shape)])
+        return msgpack.ExtType(NDARRAY_EXT, header + array.tobytes())
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"checkpoint 에 저장할 수 없는 값: {type(obj)!r}")
+
+
+def _decode(code, data):
+    if code != NDARRAY_EXT:
+        return msgpack.ExtType(code, data)
+    unpacker = msgpack.Unpacker()
+    unpacker.feed(data)
+    dtype, shape = unpacker.unpack()
+    # frombuffer 결과는 읽기 전용이므로 복사해서 바로 수정 가능한 배열로 돌려줌
+    return np.frombuffer(data, dtype=np.dtype(dtype), offset=unpacker.tell()).reshape(shape).copy()
+
+
+def pack_ragged(arrays: list) -> tuple[np.ndarray, np.ndarray]:
+    """길이가 제각각인 1차원 배열/바이트열 목록을 (이어붙인 배열, 길이 배열) 로 변환"""
+    lengths = np.fromiter((len(a) for a in arrays), dtype=np.int64, count=len(arrays))
+    if not arrays:
+        return np.zeros(0), lengths
+    return np.concatenate(arrays), lengths
+
+
+def unpack_ragged(flat: np.ndarray, lengths: np.ndarray) -> list[np.ndarray]:
+    """pack_ragged 의 역변환"""
+    return np.split(flat, np.cumsum(lengths)[:-1]) if len(lengths) else []
+
+
+def write_checkpoint(path: str, state: dict, level: int = 3):
+    """state 를 msgpack + zstd 로 기록. 임시 파일에 쓴 뒤 교체하므로 기록 중 중단되어도 이전 체크포인트가 남는다."""
+    temp_path = f"{path}.tmp"
+    packed = msgpack.packb({'version': CHECKPOINT_VERSION, 'state': state}, default=_encode)
+    cctx = zstd.ZstdCompressor(level=level, threads=-1)
+    with open(temp_path, "wb") as f:
+        with cctx.stream_writer(f, size=len(packed), closefd=False) as writer:
+            writer.write(packed)
+    os.replace(temp_path, path)
+
+
+def read_checkpoint(path: str) -> dict:
+    """write_checkpoint 로 기록한 state 를 읽음"""
+    with open(path, "rb") as f:
+        packed = zstd.ZstdDecompressor().stream_reader(f).readall()
+    checkpoint = msgpack.unpackb(packed, ext_hook=_decode, strict_map_key=False)
+    if checkpoint['version'] != CHECKPOINT_VERSION:
+        raise ValueError(f"지원하지 않는 checkpoint 버전: {checkpoint['version']}")
+    return checkpoint['state']
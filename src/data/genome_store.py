@@ -0,0 +1,134 @@
+import hashlib
+import os
+import threading
+import numpy as np
+
+# 유전자 저장소 (로그 디렉터리 안의 세 파일)
+#   genomes.bin       : 유전자 바이트열을 이어붙인 원본. 같은 유전자는 한 번만 기록된다.
+#   genome_hashes.bin : 내용 해시 표. 원본에 기록된 유전자마다 (blake2b 해시, 오프셋, 길이) 레코드 하나
+#   genome_index.bin  : ID*itemsize 위치마다 고정 폭 레코드 (원본 오프셋, 길이, 기록 여부)
+BLOB_FILENAME = "genomes.bin"
+HASH_FILENAME = "genome_hashes.bin"
+INDEX_FILENAME = "genome_index.bin"
+
+GENOME_INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('length', '<u4'),
+    ('stored', '<u4'),      # 1 이면 기록된 ID (병렬 실행에서는 발급만 되고 태어나지 않은 ID 자리가 비어 있음)
+])
+GENOME_HASH_DTYPE = np.dtype([
+    ('digest', 'V16'),
+    ('offset', '<u8'),
+    ('length', '<u8'),
+])
+
+
+def genome_digest(genome) -> bytes:
+    return hashlib.blake2b(genome, digest_size=16).digest()
+
+
+class GenomeStore:
+    """(기록 스레드) 유전자 저장소에 덧붙이는 기록 도구.
+    내용 해시 표를 메모리에 들고 있어, 변이 없이 복제된 유전자는 원본에 다시 쓰지 않고 색인만 기록한다."""
+
+    def __init__(self, log_dir: str, reset: bool = True):
+        self.blob_path = os.path.join(log_dir, BLOB_FILENAME)
+        self.hash_path = os.path.join(log_dir, HASH_FILENAME)
+        self.index_path = os.path.join(log_dir, INDEX_FILENAME)
+        if reset:
+            for path in self.files():
+                open(path, "wb").close()
+        self.reload()
+
+    def files(self) -> tuple[str, ...]:
+        return (self.blob_path, self.hash_path, self.index_path)
+
+    def reload(self):
+        """파일의 해시 표로 메모리의 해시 표를 다시 만듦 (체크포인트에서 이어갈 때 잘라낸 파일 기준으로)"""
+        table = (np.fromfile(self.hash_path, dtype=GENOME_HASH_DTYPE)
+                 if os.path.exists(self.hash_path) else np.zeros(0, dtype=GENOME_HASH_DTYPE))
+        self.hashes: dict[bytes, tuple[int, int]] = {
+            digest: (offset, length)
+            for digest, offset, length in zip(
+                table['digest'].tolist(), table['offset'].tolist(), table['length'].tolist()
+            )
+        }
+
+    def append(self, ids: list[int], genomes: list[bytes]):
+        """ID 와 유전자 바이트열을 기록. 원본과 해시 표를 먼저 쓰고 색인은 마지막에 써서,
+        읽는 쪽이 색인에서 본 ID 의 유전자는 항상 원본에 완전히 기록되어 있게 한다."""
+        if not ids:
+            return
+        locations, new_hashes = [], []
+        with open(self.blob_path, "ab") as f_blob:
+            for genome in genomes:
+                digest = genome_digest(genome)
+                location = self.hashes.get(digest)
+                if location is None:
+                    location = self.hashes[digest] = (f_blob.tell(), len(genome))
+                    new_hashes.append((digest, *location))
+                    f_blob.write(genome)
+                locations.append(location)
+
+        entries = np.zeros(len(ids), dtype=GENOME_INDEX_DTYPE)
+        entries['offset'], entries['length'] = np.array(locations, dtype=np.int64).T
+        entries['stored'] = 1
+
+        if new_hashes:
+            with open(self.hash_path, "ab") as f_hash:
+                np.array(new_hashes, dtype=GENOME_HASH_DTYPE).tofile(f_hash)
+
+        # ID 가 연속된 구간마다 한 번에 기록 (병렬 실행에서는 작업자 블록마다 ID 구간이 나뉨)
+        ids = np.asarray(ids, dtype=np.int64)
+        order = np.argsort(ids, kind='stable')
+        ids, entries = ids[order], entries[order]
+        runs = np.flatnonzero(np.diff(ids) != 1) + 1
+        with open(self.index_path, "r+b") as f_index:
+            for run_ids, run_entries in zip(np.split(ids, runs), np.split(entries, runs)):
+                f_index.seek(int(run_ids[0]) * GENOME_INDEX_DTYPE.itemsize)
+                f_index.write(run_entries.tobytes())
+
+
+class GenomeStoreReader:
+    """유전자 저장소를 np.memmap 으로 읽는 도구. get() 은 원본을 복사하지 않는 memoryview 를 돌려준다.
+    refresh() 는 파일 크기가 바뀌었을 때만 다시 매핑하므로 요청마다 불러도 stat 몇 번이면 된다.
+    시뮬레이션이 새로 시작되어 파일이 줄어든 경우에도 다시 매핑해 잘린 영역을 읽지 않게 한다."""
+
+    def __init__(self, log_dir: str):
+        self.log_dir = log_dir
+        self.index = np.zeros(0, dtype=GENOME_INDEX_DTYPE)
+        self.blob = np.zeros(0, dtype=np.uint8)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _map(path: str, dtype: np.dtype, mapped: np.ndarray) -> np.ndarray:
+        try:
+            count = os.path.getsize(path) // dtype.itemsize
+        except FileNotFoundError:
+            count = 0
+        if count == len(mapped):
+            return mapped
+        return np.memmap(path, dtype=dtype, mode='r', shape=(count,)) if count else np.zeros(0, dtype=dtype)
+
+    def refresh(self):
+        with self._lock:
+            # 원본을 색인보다 나중에 매핑해, 색인에 보이는 유전자가 매핑된 원본 범위 안에 있게 함
+            self.index = self._map(os.path.join(self.log_dir, INDEX_FILENAME), GENOME_INDEX_DTYPE, self.index)
+            self.blob = self._map(os.path.join(self.log_dir, BLOB_FILENAME), np.dtype(np.uint8), self.blob)
+
+    def ids(self) -> np.ndarray:
+        """기록된 ID 목록"""
+        return np.flatnonzero(self.index['stored'])
+
+    def get(self, object_id: int) -> memoryview | None:
+        """ID 의 유전자 바이트열 (기록되지 않은 ID 면 None)"""
+        index, blob = self.index, self.blob
+        if not 0 <= object_id < len(index) or not index['stored'][object_id]:
+            return None
+        offset, length = int(index['offset'][object_id]), int(index['length'][object_id])
+        if offset + length > len(blob):
+            return None
+        return memoryview(blob[offset:offset + length])
+
+    def __len__(self) -> int:
+        return len(self.index)
@@ -0,0 +1,90 @@
+import atexit
+import queue
+import threading
+import time
+
+
+class LogWriter:
+    """로그 작업(인코딩, 파일 기록, 스프라이트 생성, 압축)을 별도 스레드에서 순서대로 실행하는 기록기.
+
+    시뮬레이션은 submit() 으로 작업을 넘기고 바로 다음 턴으로 진행한다.
+    대기열은 max_pending 개로 제한되어, 기록이 시뮬레이션을 따라가지 못하면 submit() 이 자리가 날 때까지 기다린다 (backpressure).
+    작업 중 발생한 예외는 다음 submit()/flush() 에서 다시 발생한다.
+    """
+
+    def __init__(self, max_pending: int = 32):
+        self.queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self.error: BaseException | None = None
+
+        # 지표
+        self.submitted = 0          # 넘겨받은 작업 수
+        self.completed = 0          # 끝난 작업 수
+        self.blocked = 0            # 대기열이 가득 차서 기다린 submit 횟수
+        self.blocked_seconds = 0.0  # submit 이 기다린 총 시간
+        self.busy_seconds = 0.0     # 기록 스레드가 작업에 쓴 총 시간
+        self.max_depth = 0          # 관측된 최대 대기열 길이
+
+        self.closed = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)     # 종료 시 남은 기록을 마저 씀
+
+    def submit(self, task, *args):
+        """task(*args) 를 기록 스레드에 넘김"""
+        self._raise_error()
+        try:
+            self.queue.put_nowait((task, args))
+        except queue.Full:
+            start = time.perf_counter()
+            self.queue.put((task, args))
+            self.blocked += 1
+            self.blocked_seconds += time.perf_counter() - start
+        self.submitted += 1
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def flush(self):
+        """넘긴 작업이 모두 끝날 때까지 기다림"""
+        self.queue.join()
+        self._raise_error()
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.queue.put(None)
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def stats(self) -> dict:
+        return {
+            'depth'          : self.queue.qsize(),
+            'max_depth'      : self.max_depth,
+            'capacity'       : self.queue.maxsize,
+            'submitted'      : self.submitted,
+            'completed'      : self.completed,
+            'blocked'        : self.blocked,
+            'blocked_seconds': self.blocked_seconds,
+            'busy_seconds'   : self.busy_seconds,
+        }
+
+    def _raise_error(self):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise RuntimeError("로그 기록 스레드에서 오류 발생") from error
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.queue.task_done()
+                return
+            task, args = item
+            start = time.perf_counter()
+            try:
+                task(*args)
+            except BaseException as e:
+                self.error = e
+            finally:
+                self.busy_seconds += time.perf_counter() - start
+                self.completed += 1
+                self.queue.task_done()
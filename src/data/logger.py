@@ -1,59 +1,161 @@
 import os
+import atexit
 import json
-import base64
 import zstandard as zstd
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 import numpy as np
 
-from src.utils.creature_sprite_tool import generate_creature_sheet, reset_creature_sheet
+from src.data.genome_store import GenomeStore
+from src.data.log_writer import LogWriter
+from src.data.turn_codec import TurnEncoder
+from src.data.turn_index import INDEX_DTYPE, INDEX_FILENAME, chunk_filename
+from src.utils.creature_sprite_tool import CreatureAtlas
+
+
+@dataclass
+class TurnRecord:
+    """한 턴의 로그 내용. 병렬 실행에서는 작업자별 기록을 merge 로 합쳐 한 번에 기록한다."""
+    columns : dict[str, np.ndarray]                     # LOG_COLUMNS 별 생물 값
+    sounds  : dict[tuple[int, int], list[int]]          # (y, x) → 울음소리 번호 목록
+    corpses : dict[tuple[int, int], list[list]]         # (y, x) → [[x, y, energy], ...]
+
+    LOG_COLUMNS = ('id', 'x', 'y', 'health', 'energy', 'grid_x', 'grid_y')
+
+    @classmethod
+    def merge(cls, records: list['TurnRecord']) -> 'TurnRecord':
+        merged = cls(
+            columns={name: np.concatenate([r.columns[name] for r in records]) for name in cls.LOG_COLUMNS},
+            sounds={},
+            corpses={},
+        )
+        for record in records:
+            merged.sounds.update(record.sounds)
+            merged.corpses.update(record.corpses)
+        return merged
+
 
 class WorldLog:
-    def __init__(self, grid_array, log_dir="logs", flush_interval=100):
+    """턴 로그와 유전자 정적 데이터 기록기.
+
+    collect_turn() 은 grid_array/store 에서 한 턴의 기록을 모으고, write_turn() 은 그것을
+    열 단위 이진 형식(src.data.turn_codec)으로 인코딩해 현재 청크 파일에 zstd 프레임 하나로 덧붙인다.
+    keyframe_interval 턴마다 전체 상태를, 그 사이에는 지난 턴과 달라진 부분만 기록한다.
+    키프레임부터 다음 키프레임 전까지의 턴들을 zstd 프레임 하나로 묶어 현재 청크 파일에 덧붙이므로,
+    압축은 여러 턴의 문맥을 활용하면서도 키프레임 단위로 필요한 부분만 해제할 수 있다.
+    청크는 flush_interval 턴마다 바뀌며, 턴별 프레임 위치는 compressed/turn_index.bin 에 기록된다.
+    log_dir 이 None 이면 수집만 하는 용도(병렬 작업자)로 파일을 건드리지 않으며,
+    grid_array/store 없이 shape 만 주면 다른 곳에서 모은 기록을 쓰는 용도(병렬 조정자)가 된다.
+    reset=False 이면 기존 로그 파일을 비우지 않는다 (체크포인트에서 이어서 기록할 때 resume 과 함께 사용).
+    새로 태어난 생물의 유전자는 청크가 끝날 때 유전자 저장소(src.data.genome_store)에 원본 바이트열로 기록된다.
+
+    파일 기록(인코딩, 유전자 정보, 스프라이트 시트, 압축)은 LogWriter 스레드가 맡고, write_turn() 은
+    그 턴의 기록을 넘기기만 한다. 파일 내용이 필요한 곳(체크포인트 등)에서는 먼저 flush() 를 호출한다.
+    """
+
+    def __init__(self, grid_array, store, log_dir="logs", flush_interval=100, shape=None, reset=True,
+                 keyframe_interval=20, max_pending=32, compression_level=5):
         self.grid_array = grid_array
+        self.store = store
+        self.height, self.width = shape if shape is not None else (len(grid_array), len(grid_array[0]))
         self.turn_count = 0
         self.flush_interval = flush_interval
+        self.encoder = TurnEncoder(self.height, self.width, keyframe_interval)
+        self.compressor = zstd.ZstdCompressor(level=compression_level)
+        self._group: list[tuple[int, bytes]] = []      # (기록 스레드) 아직 프레임으로 쓰지 않은 (턴, 인코딩 결과)
+
+        self.static_creature_data = []      # [(id, 유전자 바이트열)]
 
         self.log_dir = log_dir
-        self.raw_log_file = os.path.join(self.log_dir, "turn_logs.jsonl")
-        self.static_file = os.path.join(self.log_dir, "static_data.jsonl")
-        self.offsets_file = os.path.join(self.log_dir, "offsets.bin")
+        self.writer = None
+        if log_dir is None:
+            return
+        self.writer = LogWriter(max_pending)
+        atexit.register(self.close)     # 종료 시 묶고 있던 턴까지 기록
+        self.genome_store = GenomeStore(self.log_dir, reset)
+        self.atlas = CreatureAtlas(os.path.join(self.log_dir, "creature_atlas"), reset)
         self.compressed_dir = os.path.join(self.log_dir, "compressed")
         self.index_path = os.path.join(self.compressed_dir, "index.jsonl")
+        self.turn_index_path = os.path.join(self.compressed_dir, INDEX_FILENAME)
         os.makedirs(self.compressed_dir, exist_ok=True)
+        if not reset:
+            return
 
-        open(self.raw_log_file, "w").close()
-        open(self.static_file, "w").close()
         open(self.index_path, "w").close()
-        open(self.offsets_file, "wb").close()
+        open(self.turn_index_path, "wb").close()
 
-        self.static_creature_data = []
+    def _chunk_path(self, turn: int) -> str:
+        """turn 이 들어가는 청크 파일 (이름의 숫자는 그 청크가 끝나는 턴 수)"""
+        return os.path.join(self.compressed_dir, chunk_filename((turn // self.flush_interval + 1) * self.flush_interval))
 
-        reset_creature_sheet()
+    def _log_files(self) -> tuple[str, ...]:
+        return (self._chunk_path(self.turn_count), *self.genome_store.files(), *self.atlas.files(), self.index_path, self.turn_index_path)
 
-    def register_creature(self, creatures):
-        """새로운 생물체의 유전자 정보를 누적"""
-        self.static_creature_data.extend([
-            base64.b64encode(creature.genome.genome_bytes).decode('utf-8')
-            for creature in creatures
-        ])
+    def flush(self):
+        """기록 스레드에 넘긴 작업이 모두 파일에 반영될 때까지 기다림"""
+        if self.writer is not None:
+            self.writer.flush()
+
+    def close(self):
+        if self.writer is None or self.writer.closed:
+            return
+        self.writer.submit(self._end_group)
+        self.writer.close()
+        atexit.unregister(self.close)
 
-    def write_static_data(self):
-        """누적된 유전자 정보를 static_data.jsonl에 append하고, offsets.bin에도 오프셋 기록"""
-        generate_creature_sheet(lines=self.static_creature_data)
+    def writer_stats(self) -> dict:
+        """기록 대기열 지표 (대기열 길이, 기다린 횟수/시간, 기록 스레드 작업 시간 등)"""
+        return self.writer.stats() if self.writer is not None else {}
 
-        if self.static_creature_data:
-            with open(self.static_file, "a", encoding="utf-8") as f_data, \
-                open(self.offsets_file, "ab") as f_offset:
+    def position(self) -> dict:
+        """체크포인트용 기록 위치 (턴 번호, 아직 쓰지 않은 유전자 정보, 각 로그 파일 크기)"""
+        if self.writer is not None:
+            self.writer.submit(self._end_group)     # 묶고 있던 턴을 파일에 반영
+        self.flush()
+        return {
+            'turn_count'  : self.turn_count,
+            'pending'     : [[creature_id, genome] for creature_id, genome in self.static_creature_data],
+            'file_sizes'  : [
+                os.path.getsize(path) if os.path.exists(path) else 0 for path in self._log_files()
+            ] if self.log_dir is not None else [],
+        }
 
-                for genome_str in self.static_creature_data:
-                    # 현재 오프셋 저장 (byte 위치)
-                    offset = f_data.tell()
-                    f_offset.write(offset.to_bytes(8, byteorder="little"))
+    def resume(self, position: dict):
+        """position() 시점으로 되돌림. 그 뒤에 기록된 내용은 로그 파일에서 잘라낸다."""
+        self.turn_count = position['turn_count']
+        self.static_creature_data = [(creature_id, genome) for creature_id, genome in position['pending']]
+        if self.log_dir is None:
+            return
+        for path, size in zip(self._log_files(), position['file_sizes']):
+            open(path, "ab").close()
+            os.truncate(path, min(size, os.path.getsize(path)))
+        self.genome_store.reload()
+        self.atlas.reload()
 
-                    # 유전자 데이터 한 줄로 기록
-                    f_data.write(json.dumps(genome_str) + "\n")
+    def register_creature(self, creatures):
+        """새로운 생물체의 유전자 정보를 누적"""
+        self.register_genomes(
+            [creature.id for creature in creatures],
+            [creature.genome.genome_bytes for creature in creatures],
+        )
 
-            self.static_creature_data.clear()
+    def register_genomes(self, ids: list[int], genomes: list[bytes]):
+        """ID 와 유전자 바이트열로 직접 누적 (병렬 조정자가 작업자에게서 받은 탄생 정보)"""
+        self.static_creature_data.extend(zip(ids, genomes))
+
+    def take_registered(self) -> list[tuple[int, bytes]]:
+        """누적된 (id, 유전자 바이트열) 목록을 꺼내고 비운다"""
+        registered, self.static_creature_data = self.static_creature_data, []
+        return registered
+
+    def write_static_data(self, entries: list[tuple[int, bytes]] | None = None):
+        """유전자 정보를 스프라이트 아틀라스와 유전자 저장소에 기록
+        (병렬 실행에서는 ID 가 작업자 블록 단위로 발급되므로 등록 순서와 ID 순서가 다를 수 있음)
+        entries 를 주지 않으면 지금까지 누적된 정보를 꺼내서 쓴다."""
+        entries = entries if entries is not None else self.take_registered()
+        ids = [creature_id for creature_id, _ in entries]
+        genomes = [genome for _, genome in entries]
+        self.atlas.add(genomes, ids)
+        self.genome_store.append(ids, genomes)
 
     def fast_round_scalar(self, v: float, scale: int = 10000) -> float:
         return int(v * scale) / scale
@@ -61,59 +163,87 @@ class WorldLog:
     def fast_round_array(self, v_array: np.ndarray, scale: int = 10000) -> np.ndarray:
         return np.floor(v_array * scale + 0.5) / scale
 
-    def log_turn(self):
-        """매 턴마다 로그를 기록 (리스트 기반 구조)"""
-        turn_log = [
-            self.turn_count,  # turn number
-            [  # grids
-                [  # each row
-                    [  # each grid: [organics, creatures]
-                        list(grid.crying_sound_set), #[int]
-                        [  # creatures
-                            [  # each creature: [id, x, y, health, energy]
-                                creature.id,
-                                creature.position.x,
-                                creature.position.y,
-                                creature.health,
-                                creature.energy,
-                            ] for creature in grid.creatures
-                        ],
-                        [   #corpses
-                            [  # each creature: [x, y, energy]
-                                corpse.position.x,
-                                corpse.position.y,
-                                corpse.energy
-                            ] for corpse in grid.corpses
-                        ]
-                    ] for grid in row
-                ] for row in self.grid_array
-            ]
-        ]
-
-        with open(self.raw_log_file, "a", encoding="utf-8") as f:
-            f.write(json.dumps(turn_log, separators=(",", ":")) + "\n")
+    def collect_turn(self, grids=None) -> TurnRecord:
+        """저장소의 열과 그리드에서 이번 턴의 기록을 모음 (ghost 개체 제외).
+        grids 는 울음소리/사체를 찾아볼 그리드들로, 주지 않으면 grid_array 전체를 훑는다.
+        World 는 울음소리나 사체가 남은 그리드를 활성 상태로 두므로 world.active_grids 를 넘기면 충분하다."""
+        store = self.store
+        rows = store.owned_rows()
+        grids = grids if grids is not None else (grid for row in self.grid_array for grid in row)
+        sounds, corpses = {}, {}
+        for grid in grids:
+            if grid.crying_sound_set:
+                sounds[(grid.pos.y, grid.pos.x)] = list(grid.crying_sound_set)
+            if grid.corpses:
+                corpses[(grid.pos.y, grid.pos.x)] = [
+                    [corpse.position.x, corpse.position.y, corpse.energy]
+                    for corpse in grid.corpses
+                ]
+        return TurnRecord(
+            columns={name: getattr(store, name)[rows] for name in TurnRecord.LOG_COLUMNS},
+            sounds=sounds,
+            corpses=corpses,
+        )
 
+    def log_turn(self, grids=None):
+        """매 턴마다 로그를 기록 (grids 는 collect_turn 과 같음)"""
+        self.write_turn(self.collect_turn(grids))
+
+    def write_turn(self, record: TurnRecord):
+        """모아 둔 한 턴의 기록을 기록 스레드에 넘김.
+        record 는 이후 수정되지 않는 값이어야 한다 (collect_turn/merge 결과는 모두 새로 만든 배열)."""
+        turn = self.turn_count
         self.turn_count += 1
 
+        entries = None
         if self.turn_count % self.flush_interval == 0:
-            self.write_static_data()
-            self.compress_log()
+            entries = self.take_registered()
+        self.writer.submit(self._write_turn, turn, record, entries)
+
+    def _write_turn(self, turn: int, record: TurnRecord, entries: list[tuple[int, bytes]] | None):
+        """(기록 스레드) 한 턴을 인코딩해 묶음에 추가. 키프레임이 오면 이전 묶음을 프레임으로 쓴다.
+        청크의 마지막 턴이면 묶음을 쓰고 유전자 정보를 기록한 뒤 index.jsonl 에 완성된 청크를 올린다."""
+        if turn % self.flush_interval == 0:
+            self.encoder.reset()        # 청크는 항상 키프레임으로 시작
+        payload = self.encoder.encode(turn, record)
+        if self.encoder.last_keyframe:
+            self._write_group()
+        self._group.append((turn, payload))
 
-    def compress_log(self):
-        """로그 파일 압축"""
-        filename = f"turn_logs_{self.turn_count:08d}.zst"
-        compressed_file = os.path.join(self.compressed_dir, filename)
+        if entries is not None:
+            self._write_group()
+            self.write_static_data(entries)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(os.path.basename(self._chunk_path(turn))) + "\n")
 
-        # 압축 수행
-        cctx = zstd.ZstdCompressor(level=5)
-        with open(self.raw_log_file, "rb") as in_f, open(compressed_file, "wb") as out_f:
-            out_f.write(cctx.compress(in_f.read()))
+    def _end_group(self):
+        """(기록 스레드) 묶고 있던 턴을 지금 쓰고, 다음 턴부터 새 키프레임으로 시작"""
+        self._write_group()
+        self.encoder.reset()
 
-        # 원본 로그 초기화
-        open(self.raw_log_file, "w").close()
+    def _write_group(self):
+        """(기록 스레드) 묶음을 zstd 프레임 하나로 청크에 덧붙이고 묶음의 각 턴 위치를 turn_index.bin 에 기록.
+        청크 파일이 비어 있으면 스키마 헤더 프레임부터 쓴다."""
+        if not self._group:
+            return
+        first = self._group[0][0]
+        path = self._chunk_path(first)
+        with open(path, "wb" if first % self.flush_interval == 0 else "ab") as f:
+            if f.tell() == 0:
+                f.write(self.compressor.compress(self.encoder.header()))
+            offset = f.tell()
+            frame = self.compressor.compress(b"".join(payload for _, payload in self._group))
+            f.write(frame)
 
-        with open(self.index_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(filename) + "\n")
+        entries = np.zeros(len(self._group), dtype=INDEX_DTYPE)
+        entries['chunk'] = (first // self.flush_interval + 1) * self.flush_interval
+        entries['offset'] = offset
+        entries['length'] = len(frame)
+        entries['keyframe'][0] = 1
+        with open(self.turn_index_path, "r+b" if os.path.exists(self.turn_index_path) else "wb") as f:
+            f.seek(first * INDEX_DTYPE.itemsize)
+            f.write(entries.tobytes())
+        self._group = []
 
     def decompress_zstd_file(file_path: str) -> bytes:
         """Zstandard 압축 파일을 해제하여 원본 바이트 데이터를 반환"""
@@ -0,0 +1,258 @@
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.data.logger import TurnRecord
+
+import msgpack
+import numpy as np
+
+# 열 단위 이진 턴 로그 형식
+#   파일(청크) = 스키마 헤더 1개 + 턴 객체 N개, 모두 msgpack 객체를 그대로 이어붙인 스트림
+#   키프레임  = ['K', 턴 번호, [생물 열 버퍼...], [사체 열 버퍼...], [울음소리 열 버퍼...]]
+#   델타      = ['D', 턴 번호, [태어난 생물 열 버퍼...], 사라진 ID 버퍼, [[바뀐 위치, 값] 열별...], [사체...], [울음소리...]]
+#   각 버퍼는 헤더에 적힌 dtype 의 원시 리틀엔디언 배열이다.
+#   키프레임의 생물 표와 디코딩 결과는 (grid 인덱스, id) 순, 사체/울음소리 표는 grid 인덱스(y*width+x) 순으로 정렬된다.
+#   델타의 "바뀐 위치" 는 지난 턴과 이번 턴에 모두 있는 생물을 id 순으로 늘어놓았을 때의 순번이다.
+TURN_FORMAT = "columnar-turn"
+TURN_FORMAT_VERSION = 2
+
+KEYFRAME = 'K'
+DELTA = 'D'
+
+CREATURE_COLUMNS = (
+    ('id',      '<i8'),
+    ('x',       '<i4'),
+    ('y',       '<i4'),
+    ('health',  '<i8'),
+    ('energy',  '<f8'),
+    ('grid',    '<i4'),
+)
+CORPSE_COLUMNS = (
+    ('grid',    '<i4'),
+    ('x',       '<i4'),
+    ('y',       '<i4'),
+    ('energy',  '<f8'),
+)
+SOUND_COLUMNS = (
+    ('grid',    '<i4'),
+    ('call',    '<i2'),
+)
+TABLES = (('creatures', CREATURE_COLUMNS), ('corpses', CORPSE_COLUMNS), ('sounds', SOUND_COLUMNS))
+
+# 델타 프레임에서 바뀐 값만 기록하는 열: (열 이름, 값 dtype, 'delta' 는 지난 턴과의 차이 / 'value' 는 새 값)
+# 위치는 정수 좌표라 차이도 손실 없이 작은 정수가 된다. 에너지는 실수 오차가 쌓이지 않도록 새 값을 그대로 쓴다.
+DELTA_COLUMNS = (
+    ('x',       '<i4', 'delta'),
+    ('y',       '<i4', 'delta'),
+    ('health',  '<i8', 'delta'),
+    ('energy',  '<f8', 'value'),
+    ('grid',    '<i4', 'value'),
+)
+DELTA_INDEX_DTYPE = '<u4'
+DEATH_DTYPE = '<i8'
+
+
+def encode_header(height: int, width: int, keyframe_interval: int) -> bytes:
+    """청크 맨 앞에 오는 스키마 헤더"""
+    return msgpack.packb({
+        'format'            : TURN_FORMAT,
+        'version'           : TURN_FORMAT_VERSION,
+        'shape'             : [height, width],
+        'keyframe_interval' : keyframe_interval,
+        'tables'            : {name: [list(column) for column in columns] for name, columns in TABLES},
+        'delta_columns'     : [list(column) for column in DELTA_COLUMNS],
+    })
+
+
+def _pack_columns(columns: tuple, values: dict[str, np.ndarray], order: np.ndarray | None = None) -> list[bytes]:
+    return [
+        (np.asarray(values[name]) if order is None else np.asarray(values[name])[order]).astype(dtype, copy=False).tobytes()
+        for name, dtype in columns
+    ]
+
+
+def _unpack_columns(columns: list, buffers: list[bytes]) -> dict[str, np.ndarray]:
+    return {name: np.frombuffer(buffer, dtype=dtype) for (name, dtype), buffer in zip(columns, buffers)}
+
+
+def _by_grid(table: dict[str, np.ndarray]) -> np.ndarray:
+    """생물 표의 (grid, id) 순 정렬 순서"""
+    return np.lexsort((table['id'], table['grid']))
+
+
+def _record_tables(record: 'TurnRecord', width: int) -> tuple[dict, dict, dict]:
+    """TurnRecord 를 (id 순 생물 표, grid 순 사체 표, grid 순 울음소리 표) 로 변환"""
+    columns = record.columns
+    order = np.argsort(columns['id'], kind="stable")
+    creatures = {name: np.asarray(columns[name])[order] for name, _ in CREATURE_COLUMNS if name != 'grid'}
+    creatures['grid'] = columns['grid_y'][order].astype(np.int64) * width + columns['grid_x'][order]
+
+    corpse_cells = [(y * width + x, corpse) for (y, x), corpses in record.corpses.items() for corpse in corpses]
+    corpse_values = np.array([corpse for _, corpse in corpse_cells], dtype=np.float64).reshape(len(corpse_cells), 3)
+    corpse_grid = np.array([cell for cell, _ in corpse_cells], dtype=np.int64)
+    order = np.argsort(corpse_grid, kind="stable")
+    corpses = {
+        'grid'  : corpse_grid[order],
+        'x'     : corpse_values[order, 0],
+        'y'     : corpse_values[order, 1],
+        'energy': corpse_values[order, 2],
+    }
+
+    sound_cells = sorted((y * width + x, call) for (y, x), calls in record.sounds.items() for call in calls)
+    sounds = {
+        'grid'  : np.array([cell for cell, _ in sound_cells], dtype=np.int64),
+        'call'  : np.array([call for _, call in sound_cells], dtype=np.int64),
+    }
+    return creatures, corpses, sounds
+
+
+class TurnEncoder:
+    """턴 기록을 키프레임/델타 객체로 인코딩.
+
+    keyframe_interval 턴마다, 그리고 처음이나 reset() 뒤 첫 턴에는 전체 상태를 담은 키프레임을 쓰고,
+    그 사이에는 지난 턴 대비 태어난 생물, 사라진 ID, 바뀐 열 값만 기록한다.
+    새 청크를 시작할 때 reset() 하면 청크 하나만으로 모든 턴을 복원할 수 있다.
+    """
+
+    def __init__(self, height: int, width: int, keyframe_interval: int = 20):
+        self.height = height
+        self.width = width
+        self.keyframe_interval = keyframe_interval
+        self.previous: dict[str, np.ndarray] | None = None     # 지난 턴의 id 순 생물 표
+        self.last_keyframe = False                              # 마지막으로 인코딩한 턴이 키프레임인지
+
+    def header(self) -> bytes:
+        """청크 맨 앞에 쓰는 스키마 헤더"""
+        return encode_header(self.height, self.width, self.keyframe_interval)
+
+    def reset(self):
+        """다음 턴을 키프레임으로 인코딩"""
+        self.previous = None
+
+    def encode(self, turn: int, record: 'TurnRecord') -> bytes:
+        creatures, corpses, sounds = _record_tables(record, self.width)
+        previous, self.previous = self.previous, creatures
+        corpse_buffers = _pack_columns(CORPSE_COLUMNS, corpses)
+        sound_buffers = _pack_columns(SOUND_COLUMNS, sounds)
+
+        self.last_keyframe = previous is None or turn % self.keyframe_interval == 0
+        if self.last_keyframe:
+            return msgpack.packb([
+                KEYFRAME, turn,
+                _pack_columns(CREATURE_COLUMNS, creatures, _by_grid(creatures)),
+                corpse_buffers, sound_buffers,
+            ])
+
+        survived = np.isin(previous['id'], creatures['id'], assume_unique=True)
+        born = ~np.isin(creatures['id'], previous['id'], assume_unique=True)
+        changes = []
+        for name, dtype, mode in DELTA_COLUMNS:
+            old, new = previous[name][survived], creatures[name][~born]
+            changed = np.flatnonzero(old != new)
+            values = new[changed] - old[changed] if mode == 'delta' else new[changed]
+            changes.append([changed.astype(DELTA_INDEX_DTYPE).tobytes(), values.astype(dtype).tobytes()])
+
+        return msgpack.packb([
+            DELTA, turn,
+            _pack_columns(CREATURE_COLUMNS, creatures, np.flatnonzero(born)),
+            previous['id'][~survived].astype(DEATH_DTYPE).tobytes(),
+            changes,
+            corpse_buffers, sound_buffers,
+        ])
+
+
+def _apply_delta(previous: dict[str, np.ndarray], header: dict, births: dict, deaths: np.ndarray,
+                 changes: list) -> dict[str, np.ndarray]:
+    """id 순 생물 표에 델타를 적용한 다음 턴의 id 순 생물 표"""
+    keep = ~np.isin(previous['id'], deaths, assume_unique=True)
+    table = {name: values[keep] for name, values in previous.items()}   # 불리언 인덱싱은 복사본을 만든다
+    for (name, dtype, mode), (index, values) in zip(header['delta_columns'], changes):
+        index = np.frombuffer(index, dtype=DELTA_INDEX_DTYPE)
+        values = np.frombuffer(values, dtype=dtype)
+        if mode == 'delta':
+            table[name][index] += values.astype(table[name].dtype)
+        else:
+            table[name][index] = values
+
+    order = np.argsort(np.concatenate([table['id'], births['id']]), kind="stable")
+    return {name: np.concatenate([table[name], births[name].astype(table[name].dtype)])[order] for name in table}
+
+
+def decode_chunk(data: bytes, turns: set[int] | None = None) -> tuple[dict, list[dict]]:
+    """청크 바이트열을 (스키마 헤더, 턴 목록) 으로 디코딩.
+    각 턴은 {'turn': 번호, 'creatures'/'corpses'/'sounds': {열 이름: 배열}} 이다.
+    turns 를 주면 그 턴들만 돌려주며, 가장 앞선 요청 턴 이전의 마지막 키프레임부터만 델타를 적용한다."""
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(data)
+    header = next(unpacker)
+    if header.get('format') != TURN_FORMAT or header.get('version') != TURN_FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 턴 로그 형식: {header.get('format')} v{header.get('version')}")
+    tables = {name: header['tables'][name] for name, _ in TABLES}
+
+    if turns is not None and not turns:
+        return header, []
+
+    objects = list(unpacker)
+    start = 0
+    if turns is not None:
+        first = min(turns)
+        for i, (kind, turn, *_) in enumerate(objects):
+            if turn > first:
+                break
+            if kind == KEYFRAME:
+                start = i
+
+    frames = []
+    creatures = None
+    for kind, turn, *body in objects[start:]:
+        if kind == KEYFRAME:
+            creature_buffers, corpse_buffers, sound_buffers = body
+            creatures = _unpack_columns(tables['creatures'], creature_buffers)
+            creatures = {name: values[np.argsort(creatures['id'])] for name, values in creatures.items()}
+        else:
+            birth_buffers, death_buffer, changes, corpse_buffers, sound_buffers = body
+            births = _unpack_columns(tables['creatures'], birth_buffers)
+            deaths = np.frombuffer(death_buffer, dtype=DEATH_DTYPE)
+            creatures = _apply_delta(creatures, header, births, deaths, changes)
+
+        if turns is None or turn in turns:
+            order = _by_grid(creatures)
+            frames.append({
+                'turn'      : turn,
+                'creatures' : {name: values[order] for name, values in creatures.items()},
+                'corpses'   : _unpack_columns(tables['corpses'], corpse_buffers),
+                'sounds'    : _unpack_columns(tables['sounds'], sound_buffers),
+            })
+            if turns is not None and len(frames) == len(turns):
+                break
+    return header, frames
+
+
+def to_nested(frame: dict, height: int, width: int) -> list:
+    """디코딩한 턴을 예전 JSON 턴 로그와 같은 중첩 리스트로 변환 (시각화 도구 호환용)
+    [턴 번호, [[ [울음소리], [[id, x, y, health, energy], ...], [[x, y, energy], ...] ] 그리드별 ] 행별 ]"""
+    cells = np.arange(height * width + 1)
+
+    creatures = frame['creatures']
+    creature_rows = list(zip(*(creatures[name].tolist() for name in ('id', 'x', 'y', 'health', 'energy'))))
+    creature_bounds = np.searchsorted(creatures['grid'], cells).tolist()
+
+    corpses = frame['corpses']
+    corpse_rows = [list(row) for row in zip(*(corpses[name].tolist() for name in ('x', 'y', 'energy')))]
+    corpse_bounds = np.searchsorted(corpses['grid'], cells).tolist()
+
+    sounds = frame['sounds']
+    calls = sounds['call'].tolist()
+    sound_bounds = np.searchsorted(sounds['grid'], cells).tolist()
+
+    return [
+        frame['turn'],
+        [
+            [
+                [
+                    calls[sound_bounds[i]:sound_bounds[i + 1]],
+                    creature_rows[creature_bounds[i]:creature_bounds[i + 1]],
+                    corpse_rows[corpse_bounds[i]:corpse_bounds[i + 1]],
+                ] for i in range(y * width, (y + 1) * width)
+            ] for y in range(height)
+        ],
+    ]
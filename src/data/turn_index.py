@@ -0,0 +1,149 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+import zstandard as zstd
+
+from src.data.turn_codec import decode_chunk
+
+# 압축 청크 turn_logs_XXXXXXXX.zst 는 zstd 프레임을 이어붙인 파일이다.
+#   첫 프레임 = 스키마 헤더, 이후 키프레임 묶음(키프레임 + 다음 키프레임 전까지의 델타)마다 프레임 하나
+# turn_index.bin 은 턴 번호 위치마다 고정 폭 레코드 하나: 청크 번호(파일 이름의 숫자), 프레임 오프셋/길이, 키프레임 여부
+INDEX_DTYPE = np.dtype([
+    ('chunk',    '<u8'),
+    ('offset',   '<u8'),
+    ('length',   '<u4'),
+    ('keyframe', '<u4'),
+])
+INDEX_FILENAME = "turn_index.bin"
+
+
+def chunk_filename(chunk: int) -> str:
+    return f"turn_logs_{chunk:08d}.zst"
+
+
+def decompress_frames(data: bytes) -> bytes:
+    """이어붙인 zstd 프레임 전체를 해제"""
+    reader = zstd.ZstdDecompressor().stream_reader(io.BytesIO(data), read_across_frames=True)
+    return reader.readall()
+
+
+class FrameCache:
+    """해제한 zstd 프레임을 담는 크기 제한 LRU. 여러 요청 스레드가 함께 쓰는 프로세스 공용 캐시.
+
+    키는 (청크, 오프셋, 길이) 처럼 내용이 바뀌지 않는 위치 정보여야 한다.
+    해제는 잠금 밖에서 하므로 같은 프레임을 동시에 처음 요청하면 중복 해제될 수 있지만 결과는 같다.
+    """
+
+    def __init__(self, max_bytes: int = 256 << 20):
+        self.max_bytes = max_bytes
+        self.frames: OrderedDict[tuple, bytes] = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple, load) -> bytes:
+        """key 의 해제된 바이트열. 없으면 load() 로 만들어 넣는다."""
+        with self._lock:
+            data = self.frames.get(key)
+            if data is not None:
+                self.frames.move_to_end(key)
+                self.hits += 1
+                return data
+
+        data = load()
+        with self._lock:
+            self.misses += 1
+            if key not in self.frames:
+                self.frames[key] = data
+                self.size += len(data)
+                while self.size > self.max_bytes and len(self.frames) > 1:
+                    _, evicted = self.frames.popitem(last=False)
+                    self.size -= len(evicted)
+                    self.evictions += 1
+        return data
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'entries'  : len(self.frames),
+                'bytes'    : self.size,
+                'max_bytes': self.max_bytes,
+                'hits'     : self.hits,
+                'misses'   : self.misses,
+                'evictions': self.evictions,
+            }
+
+
+class TurnLogReader:
+    """turn_index.bin 으로 필요한 턴의 프레임만 읽어 해제하는 읽기 도구 (cache 를 주면 해제한 프레임을 재사용)
+
+    색인은 np.memmap 으로 읽고 파일 크기가 바뀌었을 때만 다시 매핑한다. 기록기는 같은 파일을 제자리에서 고쳐 쓰므로
+    크기가 같은 동안에는 기존 매핑으로 새 레코드가 보인다."""
+
+    def __init__(self, compressed_dir: str, cache: FrameCache | None = None):
+        self.compressed_dir = compressed_dir
+        self.index_path = os.path.join(compressed_dir, INDEX_FILENAME)
+        self.cache = cache
+        self._index = np.zeros(0, dtype=INDEX_DTYPE)
+        self._lock = threading.Lock()
+
+    def index(self) -> np.ndarray:
+        try:
+            count = os.path.getsize(self.index_path) // INDEX_DTYPE.itemsize
+        except FileNotFoundError:
+            count = 0
+        with self._lock:
+            if count != len(self._index):
+                self._index = np.memmap(self.index_path, dtype=INDEX_DTYPE, mode='r', shape=(count,)) if count else np.zeros(0, dtype=INDEX_DTYPE)
+            return self._index
+
+    def turn_count(self) -> int:
+        return os.path.getsize(self.index_path) // INDEX_DTYPE.itemsize if os.path.exists(self.index_path) else 0
+
+    def _frame(self, f, chunk: int, offset: int, length: int) -> bytes:
+        """청크 파일 f 의 offset 에 있는 zstd 프레임 하나를 해제"""
+        def load():
+            f.seek(offset)
+            return zstd.ZstdDecompressor().decompress(f.read(length))
+        if self.cache is None:
+            return load()
+        return self.cache.get((chunk, offset, length), load)
+
+    def iter_turns(self, first: int, last: int):
+        """first ~ last 턴(포함)을 차례로 디코딩해 (스키마 헤더, 턴) 을 내보냄.
+        청크마다 헤더 프레임과, 구간 앞의 가장 가까운 키프레임부터 last 까지의 프레임만 읽는다."""
+        index = self.index()
+        last = min(last, len(index) - 1)
+        turn = max(first, 0)
+        while turn <= last:
+            chunk = int(index['chunk'][turn])
+            chunk_start = int(np.searchsorted(index['chunk'], chunk, side='left'))
+            chunk_end = int(np.searchsorted(index['chunk'], chunk, side='right')) - 1
+            end = min(last, chunk_end)
+
+            keyframes = np.flatnonzero(index['keyframe'][chunk_start:turn + 1])
+            start = chunk_start + (int(keyframes[-1]) if len(keyframes) else 0)
+
+            # 같은 묶음의 턴들은 같은 프레임을 가리키므로 서로 다른 프레임만 순서대로 읽음
+            entries = index[start:end + 1]
+            frames = list(dict.fromkeys(zip(entries['offset'].tolist(), entries['length'].tolist())))
+            with open(os.path.join(self.compressed_dir, chunk_filename(chunk)), "rb") as f:
+                data = self._frame(f, chunk, 0, int(index['offset'][chunk_start])) + b"".join(
+                    self._frame(f, chunk, offset, length) for offset, length in frames
+                )
+
+            header, decoded = decode_chunk(data, turns=set(range(turn, end + 1)))
+            for frame in decoded:
+                yield header, frame
+            turn = end + 1
+
+    def read_turns(self, first: int, last: int) -> tuple[dict | None, list[dict]]:
+        """first ~ last 턴(포함)을 (스키마 헤더, 턴 목록) 으로 반환"""
+        header, frames = None, []
+        for header, frame in self.iter_turns(first, last):
+            frames.append(frame)
+        return header, frames
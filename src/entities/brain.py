@@ -1,5 +1,5 @@
 import numpy as np
-from src.utils.constants import THRESHOLD_WEIGHT
+from src.utils.constants import THRESHOLD_WEIGHT, BRAIN_CONVERGENCE_TOLERANCE
 
 class _ActivationFunctions:
     @staticmethod
@@ -42,6 +42,160 @@ def brain_calculation(nodes : np.ndarray, synapses : list[list]):
     result[:, 0] = 0
 
     return result
+
+
+class _BlockCSR:
+    """블록 대각 희소 행렬 (CSR). 행은 받는 노드, 열은 보내는 노드.
+    생물 순서대로 노드가 이어 붙어 있으므로 앞쪽 n 행만 잘라 계산할 수 있다."""
+
+    def __init__(self, rows: np.ndarray, cols: np.ndarray, data: np.ndarray, n_rows: int):
+        order = np.argsort(rows, kind='stable')
+        self.rows    = rows[order]
+        self.indices = cols[order]
+        self.data    = data[order]
+        self.indptr  = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n_rows), out=self.indptr[1:])
+
+    def matvec(self, x: np.ndarray, n_rows: int) -> np.ndarray:
+        """앞쪽 n_rows 행에 대해서만 행렬-벡터 곱을 계산"""
+        nnz = self.indptr[n_rows]
+        return np.bincount(self.rows[:nnz], weights=self.data[:nnz] * x[self.indices[:nnz]], minlength=n_rows)
+
+
+class BrainEngine:
+    """모든 생물의 뇌를 하나의 블록 대각 희소 구조로 묶어 한 번에 계산하는 엔진.
+
+    일반 시냅스와 역치 시냅스(cns[3])는 별도 행렬로 분리되며, 한 사이클은
+    희소 행렬-벡터 곱 두 번과 전체 노드에 대한 시그모이드 한 번으로 끝난다.
+    연산 횟수(brain_compute_cycles)가 큰 생물부터 노드를 배치하므로,
+    각 사이클에서 아직 연산이 남은 생물은 항상 앞쪽 구간(prefix)을 이룬다.
+
+    노드 상태는 미리 할당된 두 버퍼를 번갈아 쓰며 갱신한다. tolerance 가 주어지면
+    역치 시냅스가 없는 생물 중 한 사이클 동안 활성값 변화가 모두 tolerance 미만인 생물을
+    고정점에 도달한 것으로 보고 남은 사이클을 생략한다. 역치 시냅스가 있으면 역치 누적값(2열)이
+    매 사이클 계속 변해 고정점이 없으므로 항상 모든 사이클을 계산한다.
+    고정점에 도달한 생물의 결과는 도달한 사이클의 상태로 고정되므로, 같은 묶음에 어떤 생물이 함께 있는지
+    (작업자 분할, 다시 패킹하는 시점)와 관계없이 생물마다 같은 결과가 나온다.
+    고정점에 도달한 생물이 노드의 절반을 넘으면 남은 생물만 다시 패킹하며, 그 전까지는 함께 계산된다.
+    생략한 사이클 수는 skipped_cycles 에 기록된다.
+    """
+
+    def __init__(self, tolerance: float | None = BRAIN_CONVERGENCE_TOLERANCE):
+        self.tolerance = tolerance
+        self.skipped_cycles = 0
+        self._buffers = [np.zeros((0, 3)), np.zeros((0, 3))]
+
+    def _reserve(self, n_nodes: int) -> tuple[np.ndarray, np.ndarray]:
+        """노드 상태 버퍼 두 개를 최소 n_nodes 크기로 확보"""
+        if len(self._buffers[0]) < n_nodes:
+            capacity = max(n_nodes, 2 * len(self._buffers[0]))
+            self._buffers = [np.zeros((capacity, 3)), np.zeros((capacity, 3))]
+        return self._buffers[0], self._buffers[1]
+
+    def run(self, creatures: list, inputs: list[dict[int, float]]) -> int:
+        """creatures[i].brain_nodes 를 inputs[i] 를 입력으로 하여 각자의 사이클 수만큼 갱신.
+        수렴으로 생략한 사이클 수를 반환한다."""
+        self.skipped_cycles = 0
+        remaining = [c.traits.brain_compute_cycles for c in creatures]
+        pending = [i for i in range(len(creatures)) if remaining[i] > 0]
+
+        # 수렴한 생물이 많아지면 남은 생물만 다시 패킹하여 계산을 이어간다.
+        while pending:
+            pending = self._run_pass(creatures, inputs, remaining, pending)
+
+        return self.skipped_cycles
+
+    def _run_pass(self, creatures: list, inputs: list[dict[int, float]], remaining: list[int], pending: list[int]) -> list[int]:
+        """pending 생물을 패킹하여 사이클을 수행하고, 다시 패킹해 이어서 계산할 생물 목록을 반환"""
+        pending = sorted(pending, key=lambda i: -remaining[i])
+        group   = [creatures[i] for i in pending]
+
+        sizes   = np.array([len(c.brain_nodes) for c in group], dtype=np.int64)
+        offsets = np.zeros(len(group) + 1, dtype=np.int64)
+        np.cumsum(sizes, out=offsets[1:])
+        n_nodes = int(offsets[-1])
+
+        current, following = self._reserve(n_nodes)
+        np.concatenate([c.brain_nodes for c in group], out=current[:n_nodes])
+
+        # === 시냅스 패킹 ===
+        synapses = np.concatenate([c.brain_synapses for c in group])
+        synapse_owner = np.repeat(np.arange(len(group)), [len(c.brain_synapses) for c in group])
+        shift    = offsets[:-1][synapse_owner]
+        src      = synapses[:, 0].astype(np.int64) + shift
+        dst      = synapses[:, 2].astype(np.int64) + shift
+        weight   = synapses[:, 1]
+        is_threshold = synapses[:, 3] != 0
+        # 수렴 판정 대상: 역치 시냅스가 없는 생물 (tolerance 가 없으면 없음)
+        watched = (np.bincount(synapse_owner[is_threshold], minlength=len(group)) == 0
+                   if self.tolerance is not None else np.zeros(len(group), dtype=bool))
+
+        normal    = _BlockCSR(dst[~is_threshold], src[~is_threshold], weight[~is_threshold], n_nodes)
+        threshold = _BlockCSR(dst[is_threshold], src[is_threshold], weight[is_threshold] * THRESHOLD_WEIGHT, n_nodes)
+
+        # === 입력: 매 사이클 같은 값이므로 한 번만 펼쳐 둔다 ===
+        group_inputs = [inputs[i] for i in pending]
+        input_idx = np.fromiter(
+            (k + off for d, off in zip(group_inputs, offsets[:-1].tolist()) for k in d.keys()),
+            dtype=np.int64)
+        input_val = np.fromiter((v for d in group_inputs for v in d.values()), dtype=np.float64)
+        base_input = np.zeros(n_nodes)
+        base_input[input_idx] = input_val
+        first_input = current[:n_nodes, 0].copy()     # 첫 사이클은 저장된 0열 위에 입력을 덮어쓴다
+        first_input[input_idx] = input_val
+
+        # === 사이클 수행 ===
+        neg_remaining = -np.array([remaining[i] for i in pending], dtype=np.int64)
+        frozen        = np.zeros(len(group), dtype=bool)
+        fixed_points: dict[int, tuple[np.ndarray, int]] = {}      # 묶음 안 순번 → (고정점 상태, 도달한 사이클 수)
+        frozen_nodes  = 0
+        done          = 0
+        n             = n_nodes
+        for cycle in range(int(-neg_remaining[0])):
+            active = int(np.searchsorted(neg_remaining, -cycle))   # 내림차순 정렬이므로 앞쪽 active 개가 남은 생물
+            if offsets[active] < n:
+                # 연산이 끝난 생물의 상태는 두 버퍼 모두에 남겨 둔다
+                following[offsets[active]:n] = current[offsets[active]:n]
+            n = int(offsets[active])
+
+            activation = current[:n, 1]
+            np.add(current[:n, 2], threshold.matvec(activation, n), out=following[:n, 2])
+            pre = (first_input if cycle == 0 else base_input)[:n] + normal.matvec(activation, n)
+            following[:n, 1] = _ActivationFunctions.sigmoid(pre + following[:n, 2])
+            following[:n, 0] = 0
+
+            if watched[:active].any():
+                delta = np.abs(following[:n, 1] - current[:n, 1])
+                converged = (np.maximum.reduceat(delta, offsets[:active]) < self.tolerance) & watched[:active]
+                if converged.any():
+                    # 고정점에 도달한 생물도 다시 패킹할 때까지는 함께 계산되지만, 결과는 지금 상태로 고정
+                    for i in np.flatnonzero(converged).tolist():
+                        fixed_points[i] = (following[offsets[i]:offsets[i + 1]].copy(), cycle + 1)
+                    watched[:active] &= ~converged
+                    frozen[:active] |= converged
+                    frozen_nodes += int(sizes[:active][converged].sum())
+
+            current, following = following, current
+            done = cycle + 1
+
+            if frozen_nodes * 2 > n:
+                break
+
+        # === 결과 반영 ===
+        final = current[:n_nodes].copy()
+        for i, c in enumerate(group):
+            c.brain_nodes = fixed_points[i][0] if frozen[i] else final[offsets[i]:offsets[i + 1]]
+
+        following_pending = []
+        for i, idx in enumerate(pending):
+            if frozen[i]:
+                self.skipped_cycles += remaining[idx] - fixed_points[i][1]
+            remaining[idx] = 0 if frozen[i] else max(0, remaining[idx] - done)
+            if remaining[idx]:
+                following_pending.append(idx)
+        return following_pending
+
+
 # TODO 역치 한계값 조정 필요 -> 오버플로우 발생. 대안 1. 가중값에 역치를 나눠 역치가 커질수록 가중값이 작아지도록 설정.
 if __name__ == '__main__':
     import time
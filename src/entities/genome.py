@@ -49,16 +49,143 @@ class Genome:
         for _ in range(repeat)
     ]
 
-    def __init__(self, genome_bytes_bytes: bytes):
+    # 명령 바이트 하위 7비트(0~127) → (GENE_DEFINITIONS 내 속성 번호, 데이터 형식)
+    attribute_slot_table = np.array([
+        (index, fmt)
+        for index, (repeat, _, fmt, *_) in enumerate(GENE_DEFINITIONS)
+        for _ in range(repeat)
+    ], dtype=np.int64)
+
+    # decode_attributes 가 한 번에 처리하는 최대 바이트 수 (중간 배열 크기 상한)
+    DECODE_BATCH_BYTES = 1 << 20
+
+    # 돌연변이 종류
+    MUTATION_FLIP_BIT, MUTATION_RANDOM_BYTE, MUTATION_INSERT_BYTE, MUTATION_DELETE_BYTE = range(4)
+
+    def __init__(self, genome_bytes_bytes: bytes, attributes: dict = None):
         self.genome_bytes = genome_bytes_bytes  # 유전자 시퀀스 (바이트열)
-        # 속성 초기화: 형식에 따라 0 또는 빈 리스트
-        self.attributes = {name : 0 if fmt == 0 else [] for _, name, fmt, *_ in self.GENE_DEFINITIONS}
         self.traits = None
-        # 초기 선택 속성
-        self.current_attr_index, self.data_format = self.attribute_name_list[0]
-        self.parse_genome_bytes()
+        if attributes is None:
+            self.parse_genome_bytes()
+        else:
+            self.attributes = attributes        # parse_batch 에서 이미 해석된 속성
         self.finalize_attributes()
 
+    @classmethod
+    def parse_batch(cls, genome_bytes_list: list[bytes]) -> list['Genome']:
+        """여러 유전자 바이트열을 한 번에 해석하여 Genome 목록을 반환"""
+        return [
+            cls(genome_bytes, attributes)
+            for genome_bytes, attributes in zip(genome_bytes_list, cls.decode_attributes(genome_bytes_list))
+        ]
+
+    @classmethod
+    def decode_attributes(cls, genome_bytes_list: list[bytes]) -> list[dict]:
+        """유전자 바이트열 묶음을 속성 딕셔너리 목록으로 변환 (NumPy 일괄 처리)
+
+        중간 배열이 묶음 크기에 비례해 커지지 않도록 DECODE_BATCH_BYTES 바이트 안팎씩 나눠 처리한다.
+        """
+        results = []
+        begin = 0
+        while begin < len(genome_bytes_list):
+            end, size = begin, 0
+            while end < len(genome_bytes_list) and (end == begin or size + len(genome_bytes_list[end]) <= cls.DECODE_BATCH_BYTES):
+                size += len(genome_bytes_list[end])
+                end += 1
+            results.extend(cls._decode_chunk(genome_bytes_list[begin:end]))
+            begin = end
+        return results
+
+    @classmethod
+    def _decode_chunk(cls, genome_bytes_list: list[bytes]) -> list[dict]:
+        """decode_attributes 의 한 묶음 처리
+
+        바이트열을 속성 전환 명령 단위의 구간(segment)으로 나눈 뒤 형식별로 축약한다.
+        각 유전체의 첫 구간은 명령 없이 시작하며 초기 선택 속성(attribute_name_list[0])에 속한다.
+        구간은 명령 바이트(또는 유전체 첫 바이트)부터 다음 구간 시작 전까지의 연속된 바이트이며,
+        데이터 바이트는 최상위 비트가 0 이므로 원본 바이트 값이 곧 데이터 값이다.
+
+        - 형식 0: 같은 속성에 속한 모든 구간의 데이터 합
+        - 형식 1: 전환 시점의 마지막 항목이 0이 아닐 때만 새 항목이 생기므로,
+                  각 구간은 '앞선 값이 0이 아닌 구간 수' 번째 항목에 누적된다
+        - 형식 2: 전환 명령마다 구간의 데이터 바이트로 이루어진 하위 바이트열 하나
+                  (원본을 잘라 만들며, 리스트와 같이 길이/인덱스로 값을 읽음)
+        """
+        names = [name for _, name, *_ in cls.GENE_DEFINITIONS]
+        results = [
+            {name : 0 if fmt == 0 else [] for _, name, fmt, *_ in cls.GENE_DEFINITIONS}
+            for _ in genome_bytes_list
+        ]
+
+        lengths = np.fromiter(map(len, genome_bytes_list), dtype=np.int64, count=len(genome_bytes_list))
+        joined = b''.join(genome_bytes_list)
+        raw = np.frombuffer(joined, dtype=np.uint8)
+        if raw.size == 0:
+            return results
+        genome_start = np.cumsum(lengths) - lengths
+
+        # 구간 시작: 명령 바이트(최상위 비트 1)와 각 유전체의 첫 바이트
+        is_command = raw >= 0b10000000
+        starts = is_command.copy()
+        starts[genome_start[lengths > 0]] = True
+        segment_pos = np.flatnonzero(starts).astype(np.int32)
+        segment_end = np.append(segment_pos[1:], np.int32(raw.size))
+
+        segment_command = is_command[segment_pos]
+        segment_owner = (np.searchsorted(genome_start, segment_pos, side='right') - 1).astype(np.int32)
+        segment_slot = np.where(segment_command, raw[segment_pos] & 0b01111111, 0)
+        segment_attr, segment_fmt = cls.attribute_slot_table[segment_slot].T
+        segment_key = segment_owner * len(names) + segment_attr.astype(np.int32)
+        segment_begin = segment_pos + segment_command    # 명령 바이트 다음부터가 데이터
+
+        # 구간별 데이터 합계 (명령 바이트는 0 으로 두고 구간 단위로 합산)
+        data = np.where(is_command, np.uint8(0), raw)
+        segment_sum = np.add.reduceat(data, segment_pos, dtype=np.int64)
+
+        # 형식 0: 속성별 합계
+        fmt0 = segment_fmt == 0
+        totals = np.bincount(segment_key[fmt0], weights=segment_sum[fmt0], minlength=len(lengths) * len(names))
+        totals = totals.astype(np.int64).reshape(len(lengths), len(names)).tolist()
+        for attributes, row in zip(results, totals):
+            for index, (_, name, fmt, *_) in enumerate(cls.GENE_DEFINITIONS):
+                if fmt == 0:
+                    attributes[name] = row[index]
+
+        # 형식 1: (유전체, 속성) 그룹 안에서 항목 번호를 매겨 합산
+        fmt1 = np.flatnonzero(segment_fmt == 1)
+        if fmt1.size:
+            fmt1 = fmt1[np.argsort(segment_key[fmt1], kind='stable')]
+            keys = segment_key[fmt1]
+            group_start = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            group_of = np.cumsum(np.r_[True, keys[1:] != keys[:-1]]) - 1
+
+            nonzero = (segment_sum[fmt1] != 0).astype(np.int64)
+            preceding = np.cumsum(nonzero) - nonzero
+            element = preceding - preceding[group_start][group_of]
+
+            group_size = np.maximum.reduceat(element, group_start) + 1
+            group_base = np.cumsum(group_size) - group_size
+            values = np.bincount(group_base[group_of] + element, weights=segment_sum[fmt1], minlength=int(group_size.sum()))
+            values = values.astype(np.int64).tolist()
+
+            for key, base, size in zip(keys[group_start].tolist(), group_base.tolist(), group_size.tolist()):
+                genome_index, attr_index = divmod(key, len(names))
+                results[genome_index][names[attr_index]] = values[base:base + size]
+
+        # 형식 2: 구간마다 데이터 바이트 하위 바이트열
+        fmt2 = np.flatnonzero(segment_fmt == 2)
+        if fmt2.size:
+            fmt2 = fmt2[np.argsort(segment_key[fmt2], kind='stable')]
+            keys = segment_key[fmt2]
+            sublists = list(map(joined.__getitem__, map(
+                slice, segment_begin[fmt2].tolist(), segment_end[fmt2].tolist())))
+            bounds = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1], True]).tolist()
+            for begin, end in zip(bounds[:-1], bounds[1:]):
+                genome_index, attr_index = divmod(int(keys[begin]), len(names))
+                results[genome_index][names[attr_index]] = sublists[begin:end]
+
+        return results
+
     def finalize_attributes(self):
         """최종적인 속성 정규화"""
         self.traits = Genes(*(
@@ -68,49 +195,9 @@ class Genome:
 
     def parse_genome_bytes(self):
         """유전자 바이트열을 속성으로 변환"""
-        for byte in self.genome_bytes:
-            is_command = (byte >> 7) & 0b1       # 최상위 1비트: 명령 여부
-            data = byte & 0b01111111             # 나머지 7비트: 데이터 값
-
-            if is_command:
-                self._set_current_attribute(data)   # 속성 전환
-            else:
-                self._accumulate_gene_data(data)    # 데이터 적용
-
-    def _set_current_attribute(self, index):
-        """속성 전환 명령 처리"""
-        self.current_attr_index, self.data_format = self.attribute_name_list[index]
-        attr = self.attributes[self.current_attr_index]
-
-        # 포맷 1: 리스트일 경우 새로운 항목 초기화
-        if self.data_format == 1 and (not attr or attr[-1] != 0):
-            attr.append(0)
-        # 포맷 2: 중첩 리스트일 경우 빈 리스트 추가
-        elif self.data_format == 2:
-            attr.append([])
-
-    def _accumulate_gene_data(self, data):
-        """현재 선택된 속성에 값 적용"""
-        attr = self.attributes[self.current_attr_index]
-
-        if self.data_format == 0:
-            # 평균 방식으로 단일 값 누적
-            self.attributes[self.current_attr_index] = attr + data
-
-        elif self.data_format == 1:
-            # 리스트 마지막 항목에 누적하거나 새로 추가
-            if attr:
-                attr[-1] += data
-            else:
-                attr.append(data)
-
-        elif self.data_format == 2:
-            # 중첩 리스트에 값 추가
-            if not attr:
-                attr.append([])
-            attr[-1].append(data)
-
-    def crossover(self, partner_genome_bytes: bytes, mutation_rate, num_cuts: int = 3) -> bytes:
+        self.attributes = self.decode_attributes([self.genome_bytes])[0]
+
+    def crossover(self, partner_genome_bytes: bytes, mutation_rate, num_cuts: int = 3, rng: np.random.Generator = None) -> bytes:
         """다중 절단 교차 방식으로 자식 유전자 생성 (길이 패딩 없이)
 
         Args:
@@ -120,55 +207,93 @@ class Genome:
         Returns:
             Genome: 교차된 자식 Genome 객체
         """
-        parent1 = list(self.genome_bytes)
-        parent2 = list(partner_genome_bytes)
-        min_len = min(len(parent1), len(parent2))
+        return self.crossover_batch(partner_genome_bytes, mutation_rate, num_cuts, 1, rng)[0]
 
-        # 절단 지점 생성
-        if num_cuts >= min_len:
-            num_cuts = max(1, min_len - 1)  # 과도한 절단 방지
+    def crossover_batch(self, partner_genome_bytes: bytes, mutation_rate, num_cuts: int, count: int,
+                        rng: np.random.Generator = None) -> list[bytes]:
+        """같은 두 부모로부터 자식 유전자 count 개를 한 번에 생성
 
-        cut_points = sorted(np.random.choice(range(1, min_len), num_cuts, replace=False))
-        cut_points = [0] + cut_points + [min_len]
+        자식마다 공통 길이 구간 [1, min_len) 에서 서로 다른 절단 지점 num_cuts 개를 뽑고,
+        절단 지점 누적합의 홀짝으로 부모1/부모2 를 고르는 마스크를 만들어 uint8 배열에서 조립한다.
+        부모1 의 남은 바이트를 붙인 뒤 돌연변이는 묶음 전체에 한 번에 적용한다.
+        rng 를 주지 않으면 새 생성기를 사용한다 (시뮬레이션에서는 world.rng 의 스트림을 넘김).
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        parent1 = np.frombuffer(self.genome_bytes, dtype=np.uint8)
+        parent2 = np.frombuffer(partner_genome_bytes, dtype=np.uint8)
+        min_len = min(len(parent1), len(parent2))
+
+        children = np.broadcast_to(parent1, (count, len(parent1))).copy()
+        if min_len > 1:
+            # 절단 지점 생성
+            if num_cuts >= min_len:
+                num_cuts = max(1, min_len - 1)  # 과도한 절단 방지
 
-        # 교차 조합
-        child = []
-        use_parent1 = True
-        for i in range(len(cut_points) - 1):
-            start, end = cut_points[i], cut_points[i + 1]
-            source = parent1 if use_parent1 else parent2
-            child.extend(source[start:end])
-            use_parent1 = not use_parent1
+            # 자식마다 1 ~ min_len-1 중 서로 다른 num_cuts 개 (난수 키의 하위 num_cuts 개)
+            keys = rng.random((count, min_len - 1))
+            cut_points = np.argpartition(keys, num_cuts - 1, axis=1)[:, :num_cuts] + 1
 
-        # 남은 바이트 붙이기 (랜덤한 부모 선택)
-        child.extend(parent1[min_len:])
+            # 교차 조합: 지나온 절단 지점 수가 홀수인 구간은 부모2 에서 가져옴
+            toggles = np.zeros((count, min_len), dtype=np.int32)
+            np.put_along_axis(toggles, cut_points, 1, axis=1)
+            from_parent2 = (np.cumsum(toggles, axis=1) & 1).astype(bool)
+            children[:, :min_len] = np.where(from_parent2, parent2[:min_len], parent1[:min_len])
 
-        return self.apply_mutation(child, mutation_rate)
+        # 남은 바이트(부모1)는 broadcast 사본에 이미 들어있음
+        return self.mutate_batch(children, mutation_rate, rng)
 
-    def apply_mutation(self, gene_sequence, mutation_rate):
+    def apply_mutation(self, gene_sequence, mutation_rate, rng: np.random.Generator = None):
         """유전자에 확률적으로 돌연변이 적용하여 새 바이트열 반환"""
-        i = 0
-        while i < len(gene_sequence):
-            if np.random.random() < mutation_rate:
-                mutation_type = np.random.choice([
-                    "flip_bit",      # 임의의 비트 반전
-                    "random_byte",   # 바이트 무작위 교체
-                    "insert_byte",   # 바이트 삽입
-                    "delete_byte"    # 바이트 삭제
-                ])
-                if mutation_type == "flip_bit":
-                    bit = 1 << np.random.randint(0, 8)
-                    gene_sequence[i] ^= bit
-                elif mutation_type == "random_byte":
-                    gene_sequence[i] = np.random.randint(0, 256)
-                elif mutation_type == "insert_byte":
-                    gene_sequence.insert(i, np.random.randint(0, 256))
-                    i += 1  # 삽입된 바이트 건너뛰기
-                elif mutation_type == "delete_byte" and len(gene_sequence) > 1:
-                    del gene_sequence[i]
-                    i -= 1  # 삭제 후 위치 보정
-            i += 1
-        return bytes(gene_sequence)
+        sequence = np.asarray(gene_sequence, dtype=np.uint8)
+        return self.mutate_batch(sequence[np.newaxis, :], mutation_rate, rng)[0]
+
+    def mutated_copies(self, mutation_rate, count: int, rng: np.random.Generator = None) -> list[bytes]:
+        """자신의 유전자에 독립적으로 돌연변이를 적용한 사본 count 개를 한 번에 생성"""
+        parent = np.frombuffer(self.genome_bytes, dtype=np.uint8)
+        return self.mutate_batch(np.broadcast_to(parent, (count, len(parent))), mutation_rate, rng)
+
+    @classmethod
+    def mutate_batch(cls, sequences: np.ndarray, mutation_rate, rng: np.random.Generator = None) -> list[bytes]:
+        """같은 길이의 유전자 묶음(2차원 uint8 배열)에 돌연변이를 일괄 적용하여 바이트열 목록 반환
+
+        원본 바이트마다 mutation_rate 확률로 네 가지 돌연변이 중 하나가 균등하게 선택된다.
+        - 비트 반전 / 무작위 교체: 배열 연산으로 제자리 적용
+        - 삽입: 원본 바이트 앞에 무작위 바이트 하나 추가 (원본 바이트는 그대로 유지)
+        - 삭제: 원본 바이트 제거. 단, 유전자가 비지 않도록 모두 삭제되는 행은 마지막으로 삭제된 바이트를 남김
+        삽입/삭제는 바이트별 출력 개수(0, 1, 2)로 표현해 np.repeat 한 번으로 결과를 조립한다.
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        count, length = sequences.shape
+        if count == 0 or length == 0:
+            return [bytes(row) for row in sequences]
+
+        mutated = rng.random((count, length)) < mutation_rate
+        mutation_type = np.where(mutated, rng.integers(0, 4, (count, length)), -1)
+        random_bytes = rng.integers(0, 256, (count, length), dtype=np.uint8)
+
+        children = np.array(sequences, dtype=np.uint8)
+        flip = mutation_type == cls.MUTATION_FLIP_BIT
+        children[flip] ^= (1 << rng.integers(0, 8, int(flip.sum()))).astype(np.uint8)
+        replace = mutation_type == cls.MUTATION_RANDOM_BYTE
+        children[replace] = random_bytes[replace]
+
+        insert = mutation_type == cls.MUTATION_INSERT_BYTE
+        delete = mutation_type == cls.MUTATION_DELETE_BYTE
+
+        # 모든 바이트가 삭제되는 행은 마지막 삭제를 취소 (길이 1 에서는 삭제하지 않음)
+        emptied = np.flatnonzero(delete.all(axis=1))
+        if emptied.size:
+            delete[emptied, length - 1] = False
+
+        repeats = 1 + insert.astype(np.int64) - delete
+        output = np.repeat(children.ravel(), repeats.ravel())
+        first_copy = np.cumsum(repeats.ravel()) - repeats.ravel()
+        inserted = insert.ravel()
+        output[first_copy[inserted]] = random_bytes.ravel()[inserted]
+
+        buffer = output.tobytes()
+        ends = np.cumsum(repeats.sum(axis=1)).tolist()
+        return [buffer[begin:end] for begin, end in zip([0] + ends[:-1], ends)]
 
 
 
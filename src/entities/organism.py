@@ -3,93 +3,150 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from src.core.engine import World, Grid
 
-from src.entities.brain     import brain_calculation
 from src.entities.genome    import Genome
 from src.entities.senses    import sense_environment
 from src.entities.actions   import actions_environment
+from src.core.store         import StoreColumn
 from src.utils.constants    import *
 from src.utils.datatypes    import Color, Vector2, Genes, Traits
 from src.utils.trait_computer import compute_biological_traits
-from src.utils.math_utils   import find_closest_point, get_grid_coords, find_creatures_within, find_nearest_creature, gene_similarity, find_nearest_object
+from src.utils.rng          import lineage_key
+from src.utils.math_utils   import find_closest_point, get_grid_coords, find_creatures_within, find_nearest_creature, find_nearest_object
 
 import numpy as np
 
 
 class Creature:
-    _id_counter = 0  # 클래스 변수: 모든 Creature 인스턴스가 공유
+    # 상태 값은 world.store 의 열에 저장되고, Creature 는 그 중 한 행을 가리키는 뷰
+    energy          = StoreColumn('energy', float)
+    health          = StoreColumn('health', int)
+    life_start_time = StoreColumn('birth_turn', int)
+    lineage         = StoreColumn('lineage', int)
+    move_speed      = StoreColumn('move_speed', float)
+    move_dir_x      = StoreColumn('move_dir_x', float)
+    move_dir_y      = StoreColumn('move_dir_y', float)
+    attack_intent   = StoreColumn('attack_intent', bool)
+    reproduce_intent= StoreColumn('reproduce_intent', bool)
+    eat_intent      = StoreColumn('eat_intent', bool)
 
     def __init__(self, 
                  position       : Vector2, 
-                 genome_bytes   : bytes, 
+                 genome_bytes   : 'bytes | Genome', 
                  world          : 'World',
                  grid           : 'Grid',
                  start_energy   : float,
+                 lineage        : int,
                  ):
-        self.genome = Genome(genome_bytes)
-        self.traits = compute_biological_traits(self.genome.traits)
+        """lineage: 계보 키. 초기 생물은 생성 순번, 자식은 rng.lineage_key(부모 계보 키, 턴, 순번)"""
+        # 번식처럼 여러 개체가 한꺼번에 태어날 때는 Genome.parse_batch 로 미리 해석된 Genome 이 전달됨
+        genome = genome_bytes if isinstance(genome_bytes, Genome) else Genome(genome_bytes)
+        self._bind(world, genome, world.ids.next())    # 고유 ID 부여
+        self.lineage = lineage
 
-        self.world          : 'World'   = world
         self.grid           : 'Grid'    = grid
         self.position       : Vector2   = position
         self.health         : int       = self.traits.health
         self.energy         : float     = self.traits.initial_offspring_energy
         self.life_start_time: int       = world.time
-        if self.traits.brain_max_nodeInx:
-            self.brain_nodes: np.ndarray= np.zeros((self.traits.brain_max_nodeInx+1, 3))
-        else:
-            self.brain_nodes: np.ndarray= np.array([])
 
         self.move_speed = 0
-        self.move_dir_x = np.random.uniform(-1, 1)
-        self.move_dir_y = np.random.uniform(-1, 1)
+        self.move_dir_x, self.move_dir_y = world.rng.stream('move_dir', lineage, world.time).uniform(-1, 1, 2)
         self.attack_intent = False
         self.reproduce_intent = True
         self.eat_intent = True
+
+    def _bind(self, world: 'World', genome: Genome, id: int, traits: Traits = None):
+        """유전자/특성을 연결하고 world.store 에 행을 할당 (생성과 복원 공통)"""
+        self.genome = genome
+        self.traits = traits if traits is not None else compute_biological_traits(genome.traits)
+        self.id = id
+
+        self.world          : 'World'   = world
+        self._store         = world.store
+        self._row           : int       = self._store.allocate(self, self.traits)
+        self._store.id[self._row] = self.id
+
+        if self.traits.brain_max_nodeInx:
+            self.brain_nodes: np.ndarray= np.zeros((self.traits.brain_max_nodeInx+1, 3))
+            self.brain_synapses: np.ndarray = np.array(self.traits.brain_synapses, dtype=np.float64)
+        else:
+            self.brain_nodes: np.ndarray= np.array([])
+
         self.cry_volume = [False]*CRY_VOLUME_SIZE
         self.attention_creature = self
 
-        self._similarity_cache: dict['Creature', float] = {}
-        
-
-        self.id = Creature._id_counter  # 고유 ID 부여
-        Creature._id_counter += 1       # 다음 ID 준비
+    @classmethod
+    def restore(cls, world: 'World', genome: Genome, state: dict, traits: Traits = None) -> 'Creature':
+        """내보낸 상태(저장소 열 이름 → 값)로 생물을 되살린다. 새 ID 발급이나 난수 사용 없이 같은 상태를 만든다."""
+        creature = cls.__new__(cls)
+        creature._bind(world, genome, int(state['id']), traits)
+        for name, value in state.items():
+            getattr(creature._store, name)[creature._row] = value
+        creature._grid = world.world[int(state['grid_y'])][int(state['grid_x'])]
+        return creature
+
+    @property
+    def position(self) -> Vector2:
+        return Vector2(int(self._store.x[self._row]), int(self._store.y[self._row]))
+
+    @position.setter
+    def position(self, value: Vector2):
+        self._store.x[self._row] = value.x
+        self._store.y[self._row] = value.y
+
+    @property
+    def grid(self) -> 'Grid':
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: 'Grid'):
+        self._grid = grid
+        self._store.grid_x[self._row] = grid.pos.x
+        self._store.grid_y[self._row] = grid.pos.y
+
+    def release(self):
+        """저장소의 행을 반납한다. 이후에는 죽기 직전 상태의 사본을 가리킨다."""
+        self._store = self._store.release(self._row)
+        self._row = 0
 
     def __hash__(self):
         return hash(self.id)
 
+    @staticmethod
+    def sort_key(creature: 'Creature') -> int:
+        """같은 그리드 안의 처리 순서 (ID 는 작업자 수에 따라 달라지므로 계보 키를 씀)"""
+        return creature.lineage
+
     def __eq__(self, other):
         return isinstance(other, Creature) and self.id == other.id
     
     
+    def sense(self, vision: tuple | None = None) -> tuple[dict[int, float], list["Creature"]]:
+        """감각 입력 노드 값과 시야에 들어온 개체 목록을 반환"""
+        return sense_environment(
+            creature= self,
+            count= self.traits.visible_entities,
+            range_level= self.traits.auditory_range,
+            attention_creature= self.attention_creature,
+            active_senses= self.traits.brain_input_key_set,
+            slot_map= self.traits.brain_input_synapses,
+            vision= vision)
+
+    def act(self, visual_creatures: list["Creature"]):
+        """뇌 연산 결과(brain_nodes)를 행동 의도로 반영"""
+        actions_environment(self, self.brain_nodes, self.traits.brain_output_synapses, visual_creatures)
+
     def update(self) -> list["Creature"] | str | None:
 
-        # 뇌
+        # 울음소리 (뇌 연산은 World.think 에서 일괄 수행)
         if self.traits.brain_max_nodeInx:
             for i in range(CRY_VOLUME_SIZE):
                 if not self.cry_volume[i]:
                     continue
                 self.grid.crying_sound_set.add(i)
-                self.grid.crying_sound[0][self.traits.calls[i]] += 1
+                self.world.audio.emit(self.grid, int(self.traits.calls[i]))
 
-            InputNodes, visual_creatures = sense_environment(
-                creature= self,
-                count= self.traits.visible_entities,
-                range_level= self.traits.auditory_range,
-                attention_creature= self.attention_creature,
-                active_senses= self.traits.brain_input_key_set,
-                slot_map= self.traits.brain_input_synapses)
-
-
-            for _ in range(self.traits.brain_compute_cycles):
-                for k, v in InputNodes.items():
-                    self.brain_nodes[k][0] = v
-
-                self.brain_nodes = brain_calculation(self.brain_nodes, self.traits.brain_synapses)
-
-            actions_environment(self, self.brain_nodes, self.traits.brain_output_synapses, visual_creatures)
-        
-        # 에너지
-        self.energy -= self.traits.BMR
+        # 에너지 (기초 대사량은 World.Trun 에서 열 단위로 차감)
         if self.eat_intent:
             if self.traits.food_intake == 0: #태양에너지.
                 if (self.grid.organics[self.traits.food_intake] > self.traits.intake_rates 
@@ -107,8 +164,8 @@ class Creature:
                     self.energy     += self.traits.actual_intake
                     self.grid.organics[self.traits.food_intake] -= self.traits.intake_rates
 
-        # 근접
-        attack_creatures    = find_creatures_within(self, self.grid.creatures, self.traits.attack_range)
+        # 근접 (공간 해시로 인접 그리드까지 탐색)
+        attack_creatures    = self.world.spatial.query_radius(self.position, self.traits.attack_range, exclude=self)
         neighbor_creatures  = find_creatures_within(self, attack_creatures, self.traits.size/2)
 
         if self.attack_intent:
@@ -141,8 +198,8 @@ class Creature:
         if self.reproduce_intent: # 의지가 있을 때
             if self.traits.reproductive_mode: # 유성생식
                 if self.energy > self.traits.all_initial_offspring_energy: # 에너지 충분
-                    breed_creatures = find_nearest_object(self.position, attack_creatures, self.traits.size)
-                    if breed_creatures and self.get_species_similarity(breed_creatures) > 0.9: # 상대 있음, 종 유사도 0.9 초과
+                    breed_creatures = self.breed_partner(attack_creatures)
+                    if breed_creatures: # 상대 있음, 종 유사도 0.9 초과
                         if self.energy > self.traits.all_initial_offspring_energy: # 상대 에너지 충분
                             return self.mate_breed(breed_creatures)
             elif self.energy > self.traits.all_initial_offspring_energy*2: # 무성생식에 에너지 충분
@@ -155,8 +212,12 @@ class Creature:
         
 
     def move(self):
+        # 이동은 열 단위로 한꺼번에 처리하지 않고 개체별로 적용한다.
+        # 같은 턴에 앞서 처리된 개체의 공격/섭취/번식 결과(에너지, 체력, 사망)가 이동 여부와 도착 그리드를 바꾸고,
+        # 도착 그리드가 활성 그리드 순회에 바로 반영되어야 하므로 (y, x) 순서의 개체 처리 안에서 수행해야 한다.
         self.position += (Vector2(self.move_dir_x, self.move_dir_y)*self.traits.speed*self.move_speed).toInt()
         self.energy -= self.move_speed * self.traits.move_cost
+        self.world.spatial.move(self)
 
         new_grid = get_grid_coords(self.position)
         
@@ -181,44 +242,51 @@ class Creature:
             
     def self_breed(self):
         self.energy -= self.traits.all_initial_offspring_energy
-        return [Creature(
-                self.position+Vector2(
-                np.cos(theta := np.random.uniform(0, 2 * np.pi)) * self.traits.size,
-                np.sin(theta) * self.traits.size
-            ).toInt(), 
-                self.genome.apply_mutation(list(self.genome.genome_bytes), self.traits.mutation_intensity), 
-                self.world, 
-                self.grid,
-                self.traits.initial_offspring_energy) for _ in range(self.traits.offspring_count)]
+        rng = self.world.rng.stream('breed', self.lineage, self.world.time)
+        genomes = Genome.parse_batch(
+            self.genome.mutated_copies(self.traits.mutation_intensity, self.traits.offspring_count, rng)
+        )
+        return self._offspring(genomes, rng)
     
     def mate_breed(self, partner:'Creature'):
         self.energy -= self.traits.all_initial_offspring_energy/2
         partner.energy -= self.traits.all_initial_offspring_energy/2
 
+        rng = self.world.rng.stream('breed', self.lineage, self.world.time)
+        genomes = Genome.parse_batch(self.genome.crossover_batch(
+            partner.genome.genome_bytes,
+            self.traits.mutation_intensity,
+            self.traits.crossover_cut_number,
+            self.traits.offspring_count,
+            rng,
+        ))
+        return self._offspring(genomes, rng)
+
+    def _offspring(self, genomes: list[Genome], rng: np.random.Generator) -> list['Creature']:
+        """자식들을 부모 주변 size 거리의 무작위 방향에 생성"""
+        thetas = rng.uniform(0, 2 * np.pi, len(genomes))
         return [Creature(
                 self.position+Vector2(
-                np.cos(theta := np.random.uniform(0, 2 * np.pi)) * self.traits.size,
+                np.cos(theta) * self.traits.size,
                 np.sin(theta) * self.traits.size
-            ), 
-                self.genome.crossover(partner.genome.genome_bytes, self.traits.mutation_intensity, self.traits.crossover_cut_number), 
+            ).toInt(), 
+                genome, 
                 self.world, 
                 self.grid,
-                self.traits.initial_offspring_energy) for _ in range(self.traits.offspring_count)]
+                self.traits.initial_offspring_energy,
+                lineage_key(self.lineage, self.world.time, index)) for index, (genome, theta) in enumerate(zip(genomes, thetas))]
     
 
-    def get_species_similarity(self, other: 'Creature') -> float:
-        if other is self:
-            return 1.0
-
-        if other in self._similarity_cache:
-            return self._similarity_cache[other]
-        
-        self_gene_str = self.genome.genome_bytes.decode('utf-8', errors='ignore')
-        other_gene_str = other.genome.genome_bytes.decode('utf-8', errors='ignore')
+    def breed_partner(self, candidates: list['Creature']) -> 'Creature | None':
+        """짝짓기 상대: 공격 범위 안 후보 중 크기 이내에서 가장 가까운 생물이 같은 종(유사도 기준 초과)이면 그 생물.
+        가장 가까운 생물이 다른 종이면 더 먼 같은 종을 찾지 않고 짝짓기하지 않는다."""
+        partner = self.world.spatial.nearest_of(self.position, candidates, self.traits.size)
+        if partner is not None and self.get_species_similarity(partner) > SPECIES_SIMILARITY_THRESHOLD:
+            return partner
+        return None
 
-        sim = gene_similarity(self_gene_str, other_gene_str)
-        self._similarity_cache[other] = sim
-        return sim
+    def get_species_similarity(self, other: 'Creature') -> float:
+        return self.world.similarity.similarity(self, other)
 
         
 #음식 -> 시체 개편.
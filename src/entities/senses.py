@@ -1,19 +1,146 @@
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
+    from src.core.engine import World
     from src.entities.organism import Creature
 from src.utils.constants import *
 from dataclasses import dataclass
 import heapq
 import numpy as np
 
+VISION_SENSES = {'detected_pos_x', 'detected_pos_y', 'detected_size'}
+
+
+@dataclass
+class VisionBatch:
+    """시각 감지 일괄 계산 결과. 각 행은 감지 주체 한 개체이며 열은 가까운 순서.
+    counts[i] 이후의 열은 패딩(좌표/크기 0, 행 번호 -1)이다."""
+    detected_pos_x  : np.ndarray    # (n, k_max) dx / GRID_WIDTH_SCALE
+    detected_pos_y  : np.ndarray    # (n, k_max) dy / GRID_HIGHT_SCALE
+    detected_size   : np.ndarray    # (n, k_max) 상대 크기 비율
+    detected_rows   : np.ndarray    # (n, k_max) 감지된 개체의 store 행 번호
+    counts          : np.ndarray    # (n,) 감지된 개체 수
+
+    def detections(self, i: int, store) -> tuple[np.ndarray, np.ndarray, np.ndarray, list['Creature']]:
+        """i 번째 감지 주체의 (dx, dy, size, 감지된 개체 목록)"""
+        k = self.counts[i]
+        return (self.detected_pos_x[i, :k], self.detected_pos_y[i, :k], self.detected_size[i, :k],
+                [store.creatures[row] for row in self.detected_rows[i, :k].tolist()])
+
+
+def sense_vision_batch(world: 'World', creatures: list['Creature']) -> VisionBatch:
+    """creatures 전체의 시각 감지(반경 내 가장 가까운 visible_entities 개)를 한 번에 계산.
+
+    같은 그리드에서 같은 반경으로 보는 개체들을 한 묶음으로 하여, 후보 집합을 한 번만 모으고
+    (묶음 크기 × 후보 수) 정렬 키 행렬에서 argpartition 으로 개체별 상위 k 개를 고른다.
+    순서는 nearest_visible 과 같은 (거리, dx, dy, 계보 키) 이다. 한 개체 기준으로 dx/dy 순서는 후보의 x/y 순서와 같으므로,
+    후보를 (x, y, 계보 키) 순으로 매긴 순위를 거리에 붙인 정수 키 하나로 동률까지 정확히 가른다.
+    """
+    store = world.store
+    n = len(creatures)
+    ks = np.array([c.traits.visible_entities for c in creatures], dtype=np.int64)
+    k_max = int(ks.max()) if n else 0
+
+    batch = VisionBatch(
+        detected_pos_x=np.zeros((n, k_max)),
+        detected_pos_y=np.zeros((n, k_max)),
+        detected_size=np.zeros((n, k_max)),
+        detected_rows=np.full((n, k_max), -1, dtype=np.int64),
+        counts=np.zeros(n, dtype=np.int64),
+    )
+
+    groups: dict[tuple[int, int, int], list[int]] = {}
+    for i, c in enumerate(creatures):
+        if c.traits.auditory_range and ks[i]:
+            groups.setdefault((c.grid.pos.y, c.grid.pos.x, c.traits.auditory_range), []).append(i)
+
+    for (gy, gx, range_level), members in groups.items():
+        grid = world.world[gy][gx]
+        if range_level == 1:
+            candidates = grid.creatures
+        else:
+            candidates = world.vision.creatures_around(grid, range_level)
+        cand_rows = np.fromiter((c._row for c in candidates), dtype=np.int64)
+        if not len(cand_rows):
+            continue
+        # 후보를 (x, y, 계보 키) 순으로 두어 열 번호가 곧 동률 순위가 되게 함 (집합 순회 순서/ID 와 무관)
+        cand_rows = cand_rows[np.lexsort((store.lineage[cand_rows], store.y[cand_rows], store.x[cand_rows]))]
+
+        members = np.array(members, dtype=np.int64)
+        rows = np.fromiter((creatures[i]._row for i in members.tolist()), dtype=np.int64, count=len(members))
+
+        dx = store.x[cand_rows][None, :] - store.x[rows][:, None]
+        dy = store.y[cand_rows][None, :] - store.y[rows][:, None]
+        key = (dx.astype(np.int64) ** 2 + dy.astype(np.int64) ** 2) * len(cand_rows) + np.arange(len(cand_rows))
+        excluded = np.iinfo(np.int64).max
+        key[cand_rows[None, :] == rows[:, None]] = excluded      # 자기 자신 제외
+
+        k_group = min(int(ks[members].max()), len(cand_rows))
+        if k_group < len(cand_rows):
+            nearest = np.argpartition(key, k_group - 1, axis=1)[:, :k_group]
+        else:
+            nearest = np.broadcast_to(np.arange(len(cand_rows)), key.shape)
+        picked_key = np.take_along_axis(key, nearest, axis=1)
+        order = np.argsort(picked_key, axis=1)
+        nearest = np.take_along_axis(nearest, order, axis=1)
+
+        valid = (np.arange(k_group)[None, :] < ks[members][:, None]) & (np.take_along_axis(picked_key, order, axis=1) != excluded)
+        counts = valid.sum(axis=1)
+        r, col = np.nonzero(valid)
+        target = members[r]
+        picked = nearest[r, col]
+
+        batch.detected_pos_x[target, col] = dx[r, picked] / GRID_WIDTH_SCALE
+        batch.detected_pos_y[target, col] = dy[r, picked] / GRID_HIGHT_SCALE
+        batch.detected_size[target, col]  = store.size[cand_rows[picked]] / store.size[rows[r]]
+        batch.detected_rows[target, col]  = cand_rows[picked]
+        batch.counts[members] = counts
+
+    return batch
+
+
+def nearest_visible(creature: 'Creature', count: int, range_level: int):
+    """한 개체의 시각 감지를 개별 계산. (dx 목록, dy 목록, size 목록, 개체 목록)을 반환"""
+    cpos = creature.position
+    if range_level == 0:
+        search_set = set()
+    elif range_level == 1:
+        search_set = creature.grid.creatures
+    else:
+        search_set = creature.world.vision.creatures_around(creature.grid, range_level)
+
+    # (거리, dx, dy, 계보 키) 순: 같은 위치의 개체끼리도 계보 키로 갈려 생물 객체끼리 비교하지 않음
+    candidates = (
+        (
+            (dx := other.position.x - cpos.x) ** 2 +
+            (dy := other.position.y - cpos.y) ** 2,
+            dx,
+            dy,
+            other.lineage,
+            other
+        )
+        for other in search_set
+        if other is not creature
+    )
+
+    top_n = heapq.nsmallest(count, candidates)
+
+    if top_n:
+        _, dxs, dys, _, creatures = zip(*top_n)
+        return ([dx/GRID_WIDTH_SCALE for dx in dxs], [dy/GRID_HIGHT_SCALE for dy in dys],
+                [other.traits.size/creature.traits.size for other in creatures], list(creatures))
+    return [], [], [], []
+
+
 def sense_environment(
     creature: 'Creature',
     count: int,
     range_level: int,
     attention_creature: 'Creature',
     active_senses: set[str],
-    slot_map: dict[int, tuple[str, int | None]]
+    slot_map: dict[int, tuple[str, int | None]],
+    vision: tuple | None = None,
 ) -> dict:
+    """vision 에 sense_vision_batch 로 미리 계산한 감지 결과를 넘기면 시각 감지를 다시 계산하지 않는다."""
 
     cpos = creature.position
     results = {}
@@ -34,43 +161,18 @@ def sense_environment(
         results['food_pos_y'] = [min_dy/GRID_HIGHT_SCALE]
 
     # === 2. 시각 감지 ===
-    if {'detected_pos_x', 'detected_pos_y', 'detected_size'} & active_senses:
-        if range_level == 0:
-            search_set = set()
-        elif range_level == 1:
-            search_set = creature.grid.creatures
-        else:
-            search_set = creature.grid.vision_refs[range_level - 1]
-
-        candidates = (
-            (
-                (dx := other.position.x - cpos.x) ** 2 +
-                (dy := other.position.y - cpos.y) ** 2,
-                dx/GRID_WIDTH_SCALE, 
-                dy/GRID_HIGHT_SCALE,
-                other.traits.size/creature.traits.size,
-                other
-            )
-            for other in search_set
-            if other is not creature
-        )
-
-        top_n = heapq.nsmallest(count, candidates)
-
-        if top_n:
-            _, dxs, dys, sizes, creatures = zip(*top_n)
-            results['detected_pos_x'] = list(dxs)
-            results['detected_pos_y'] = list(dys)
-            results['detected_size']  = list(sizes)
-            visual_creatures += list(creatures)
-        else:
-            results['detected_pos_x'] = []
-            results['detected_pos_y'] = []
-            results['detected_size'] = []
+    if VISION_SENSES & active_senses:
+        if vision is None:
+            vision = nearest_visible(creature, count, range_level)
+        dxs, dys, sizes, creatures = vision
+        results['detected_pos_x'] = dxs
+        results['detected_pos_y'] = dys
+        results['detected_size']  = sizes
+        visual_creatures += creatures
 
     # === 3. 청각 감지 ===
     if 'audio_heard' in active_senses:
-        results['audio_heard'] = creature.grid.crying_sound[1]  # dict[int] or list[float]
+        results['audio_heard'] = creature.world.audio.heard(creature.grid)  # np.ndarray (읽기 전용, 복사 없음)
 
     # === 4. 주의 감지 ===
     if {'focus_pos_x', 'focus_pos_y', 'focus_size', 'focus_similarity', 'focus_diet_type', 'focus_health','focus_color_saturation', 'focus_color_hue', 'focus_hunger'} & active_senses and attention_creature is not None:
@@ -100,7 +202,7 @@ def sense_environment(
             output[slot] = value
         elif isinstance(value, dict):
             output[slot] = value.get(idx, 0)
-        elif isinstance(value, (list, tuple)) and 0 <= idx < len(value):
+        elif isinstance(value, (list, tuple, np.ndarray)) and 0 <= idx < len(value):
             output[slot] = value[idx]
         else:
             output[slot] = 0
@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from src.entities.genome import Genome
+    from src.entities.organism import Creature
+
+from collections import OrderedDict
+
+import numpy as np
+from src.data.genome_store import genome_digest
+from src.utils.constants import SIMILARITY_CACHE_SIZE, SPECIES_SIMILARITY_LENGTH
+
+
+def genome_fingerprint(genome: 'Genome') -> np.ndarray:
+    """종 유사도 비교용 지문: 유전자를 UTF-8 로 해석(잘못된 바이트 무시)한 앞 SPECIES_SIMILARITY_LENGTH 글자의 코드 포인트"""
+    fingerprint = getattr(genome, '_fingerprint', None)
+    if fingerprint is None:
+        text = genome.genome_bytes.decode('utf-8', errors='ignore')[:SPECIES_SIMILARITY_LENGTH]
+        fingerprint = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        genome._fingerprint = fingerprint
+    return fingerprint
+
+
+def fingerprint_digest(genome: 'Genome') -> bytes:
+    """지문의 blake2b 해시. 유사도는 지문만으로 정해지므로 앞부분이 같은 유전자끼리는 캐시 항목을 공유한다."""
+    digest = getattr(genome, '_fingerprint_digest', None)
+    if digest is None:
+        digest = genome._fingerprint_digest = genome_digest(genome_fingerprint(genome).tobytes())
+    return digest
+
+
+class SimilarityIndex:
+    """생물 간 종 유사도 계산 서비스.
+
+    유사도는 math_utils.gene_similarity 와 같은 값(앞부분 글자 일치 비율)이지만,
+    유전자마다 한 번만 만든 지문 배열끼리 비교하고 여러 후보를 한 번에 계산한다.
+    결과는 지문 blake2b 해시 쌍을 키로 하는 월드 공용 LRU 캐시에 보관하므로
+    죽은 생물을 붙잡아 두지 않으며 크기도 cache_size 로 제한된다.
+    """
+
+    def __init__(self, cache_size: int = SIMILARITY_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.cache: OrderedDict[tuple[bytes, bytes], float] = OrderedDict()
+
+    @staticmethod
+    def _key(a: 'Genome', b: 'Genome') -> tuple[bytes, bytes]:
+        da, db = fingerprint_digest(a), fingerprint_digest(b)
+        return (da, db) if da <= db else (db, da)
+
+    def _remember(self, key: tuple[bytes, bytes], value: float):
+        self.cache[key] = value
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    def _compare(self, genome: 'Genome', others: list['Genome']) -> np.ndarray:
+        """genome 과 others 각각의 유사도를 한 번에 계산"""
+        base = genome_fingerprint(genome)
+        fingerprints = [genome_fingerprint(other) for other in others]
+        lengths = np.fromiter(map(len, fingerprints), dtype=np.int64, count=len(fingerprints))
+        compared = np.minimum(lengths, len(base))
+
+        stacked = np.zeros((len(others), SPECIES_SIMILARITY_LENGTH), dtype=np.uint32)
+        for row, fingerprint in enumerate(fingerprints):
+            stacked[row, :len(fingerprint)] = fingerprint
+        padded = np.zeros(SPECIES_SIMILARITY_LENGTH, dtype=np.uint32)
+        padded[:len(base)] = base
+
+        within = np.arange(SPECIES_SIMILARITY_LENGTH) < compared[:, np.newaxis]
+        same = ((stacked == padded) & within).sum(axis=1)
+        return np.divide(same, compared, out=np.zeros(len(others)), where=compared > 0)
+
+    def similarities(self, creature: 'Creature', others: list['Creature']) -> list[float]:
+        """creature 와 others 각각의 종 유사도 (캐시에 없는 쌍만 일괄 계산)"""
+        values: list[float | None] = [None] * len(others)
+        missing = []
+        for i, other in enumerate(others):
+            if other is creature:
+                values[i] = 1.0
+                continue
+            key = self._key(creature.genome, other.genome)
+            cached = self.cache.get(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                self.cache.move_to_end(key)
+                values[i] = cached
+
+        if missing:
+            computed = self._compare(creature.genome, [others[i].genome for i in missing]).tolist()
+            for i, value in zip(missing, computed):
+                values[i] = value
+                self._remember(self._key(creature.genome, others[i].genome), value)
+        return values
+
+    def similarity(self, creature: 'Creature', other: 'Creature') -> float:
+        return self.similarities(creature, [other])[0]
@@ -7,15 +7,21 @@ sys.path.append(parent_dir)
 
 
 from src.entities.genome import Genome
+from src.data.genome_store import GenomeStoreReader, genome_digest
+from src.data.turn_codec import decode_chunk, to_nested
+from src.data.turn_index import FrameCache, TurnLogReader, decompress_frames
 from src.utils.trait_computer import compute_biological_traits
 
-from flask import Flask, jsonify, send_file, send_from_directory, abort, Response
+from flask import Flask, jsonify, send_file, send_from_directory, abort, Response, request
+from werkzeug.http import is_resource_modified
 from pathlib import Path
 from dataclasses import asdict
+from datetime import datetime, timezone
 import zstandard as zstd
 import numpy as np
 import json
-import base64
+import gzip
+import hashlib
 import io
 import zipfile
 
@@ -27,9 +33,22 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 VISUALIZER_DIR = PROJECT_ROOT / 'src' / 'visualizer'
 LOGS_DIR = PROJECT_ROOT / 'logs'
 LOGS_COMPRESSED_DIR = LOGS_DIR / 'compressed'
-GENETIC_DATA_PATH = LOGS_DIR / "static_data.jsonl"
-OFFSET_INDEX_PATH = LOGS_DIR / "offsets.bin"
-CREATURE_SHEET_PATH = LOGS_DIR / "creature_sheet.png"
+CREATURE_ATLAS_DIR = LOGS_DIR / "creature_atlas"
+
+# === 해제한 로그 프레임 캐시 (프로세스 공용) ===
+FRAME_CACHE_BYTES = 256 << 20
+frame_cache = FrameCache(FRAME_CACHE_BYTES)
+turn_reader = TurnLogReader(str(LOGS_COMPRESSED_DIR), cache=frame_cache)
+
+# === 변환 결과 응답 캐시 (원본 파일의 크기/수정 시각이 같으면 재사용) ===
+RESPONSE_CACHE_BYTES = 256 << 20
+response_cache = FrameCache(RESPONSE_CACHE_BYTES)      # 크기 제한 바이트 LRU 로 재사용
+
+# === 형질 캐시 (유전체 해시 → 형질 JSON, 복제로 같은 유전체를 가진 개체는 같은 항목을 씀) ===
+TRAIT_CACHE_BYTES = 64 << 20
+trait_cache = FrameCache(TRAIT_CACHE_BYTES)
+MAX_GENE_BATCH = 4096
+genome_store = GenomeStoreReader(str(LOGS_DIR))
 
 
 # === 유틸 함수 ===
@@ -42,16 +61,94 @@ def serve_file_safe(path: Path, mimetype=None):
         abort_with_log(404, f"파일을 찾을 수 없습니다: {path}")
     return send_file(str(path), mimetype=mimetype)
 
-def load_offset_index():
-    try:
-        with open(OFFSET_INDEX_PATH, "rb") as f:
-            data = f.read()
-            return [int.from_bytes(data[i:i+8], "little") for i in range(0, len(data), 8)]
-    except FileNotFoundError:
-        print("❌ offsets.bin 파일이 존재하지 않습니다.")
-        return []
+
+def trait_document(object_id: int) -> bytes | None:
+    """ID 의 형질을 JSON 바이트열로 (유전자 정보가 없으면 None). 형질 계산은 유전체 해시로 캐시한다.
+    genome_store.refresh() 는 호출하는 쪽에서 요청마다 한 번 부른다."""
+    genome = genome_store.get(object_id)
+    if genome is None:
+        return None
+
+    def load():
+        interpreted = asdict(compute_biological_traits(Genome(bytes(genome)).traits))
+        interpreted = convert_ndarray_and_set(interpreted)
+        return json.dumps(interpreted, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    return trait_cache.get((genome_digest(genome),), load)
+
+
+def transcode_turn_chunk(data: bytes) -> bytes:
+    """열 단위 이진 턴 로그 청크를 시각화 도구가 읽는 JSON lines (턴당 한 줄, 그리드 중첩 리스트) 로 변환"""
+    header, turns = decode_chunk(data)
+    height, width = header['shape']
+    return "".join(
+        json.dumps(to_nested(frame, height, width), separators=(",", ":")) + "\n"
+        for frame in turns
+    ).encode("utf-8")
+
+
+def turn_json(header: dict, frame: dict) -> str:
+    """디코딩한 턴 하나를 시각화 도구의 턴 로그 한 줄과 같은 JSON 으로"""
+    height, width = header['shape']
+    return json.dumps(to_nested(frame, height, width), separators=(",", ":"))
 
 
+def file_signature(path: Path) -> tuple:
+    """파일 내용이 바뀌었는지 판단하는 (이름, 크기, 수정 시각)"""
+    stat = path.stat()
+    return (path.name, stat.st_size, stat.st_mtime_ns)
+
+def file_modified_at(path: Path) -> datetime:
+    return datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+
+def negotiate_encoding(available=('zstd', 'gzip')) -> str | None:
+    """Accept-Encoding 에서 받아들이는 압축 방식 (없으면 None = 압축하지 않음)"""
+    for encoding in available:
+        if request.accept_encodings[encoding]:
+            return encoding
+    return None
+
+def compress_body(data: bytes, encoding: str) -> bytes:
+    if encoding == 'zstd':
+        return zstd.ZstdCompressor(level=3).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+def cached_response(key: tuple, last_modified: datetime, content_type: str, load,
+                    compressible: bool = True, headers: dict | None = None):
+    """key 로 메모이즈한 응답.
+    ETag/Last-Modified 를 붙이고 클라이언트가 가진 것과 같으면 본문을 만들지 않고 304 를 돌려준다.
+    compressible 이면 Accept-Encoding 에 맞춰 zstd/gzip 으로 압축한 본문도 메모이즈한다.
+    파일 이름은 내용이 아니라 위치(청크 턴 범위 등)만 나타내고, 새 실행이나 체크포인트 재개가 같은 이름으로
+    다시 쓰므로 immutable 로 두지 않고 매번 조건부 요청으로 확인하게 한다(no-cache)."""
+    encoding = negotiate_encoding() if compressible else None
+    etag = hashlib.blake2b(repr(key + (encoding,)).encode(), digest_size=12).hexdigest()
+
+    response = Response(content_type=content_type, headers=headers)
+    response.set_etag(etag)
+    response.last_modified = last_modified
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.no_cache = True
+
+    if not is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        response.status_code = 304
+        return response
+
+    body = response_cache.get(key, load)
+    if encoding is not None:
+        body = response_cache.get(key + (encoding,), lambda: compress_body(body, encoding))
+        response.content_encoding = encoding
+    response.set_data(body)
+    return response
+
+def conditional_document(body: bytes) -> Response:
+    """본문 해시를 ETag 로 붙인 JSON 응답. 클라이언트가 가진 것과 같으면 304.
+    아직 기록되지 않은 ID 가 나중에 채워질 수 있으므로 매번 다시 확인하게 한다."""
+    response = Response(body, content_type='application/json')
+    response.set_etag(hashlib.blake2b(body, digest_size=12).hexdigest())
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 def convert_ndarray_and_set(obj):
     if isinstance(obj, dict):
         return {
@@ -86,58 +183,138 @@ def compressed_logs(filename):
         if not file_path.is_file():
             abort_with_log(404, f"압축 로그 파일이 존재하지 않습니다: {file_path}")
         try:
-            with open(file_path, 'rb') as f:
-                dctx = zstd.ZstdDecompressor()
-                decompressed = dctx.decompress(f.read())
-            return Response(decompressed, content_type='application/json')
+            # 기록 중인 청크는 크기가 바뀌므로 (이름, 크기, 수정 시각) 으로 구분
+            signature = file_signature(file_path)
+            last_modified = file_modified_at(file_path)
+
+            def decompressed():
+                def load():
+                    with open(file_path, 'rb') as f:
+                        return decompress_frames(f.read())
+                return frame_cache.get(signature, load)
+
+            if request.args.get('format') == 'columnar':
+                # 열 단위 이진 형식 그대로: zstd 를 받는 클라이언트에는 디스크의 프레임을 그대로 보냄
+                if negotiate_encoding(('zstd',)) == 'zstd':
+                    response = send_file(str(file_path), mimetype='application/msgpack', etag=False)
+                    response.content_encoding = 'zstd'
+                    response.vary.add('Accept-Encoding')
+                    response.set_etag(hashlib.blake2b(repr(signature + ('zstd',)).encode(), digest_size=12).hexdigest())
+                    response.cache_control.public = True
+                    response.cache_control.no_cache = True
+                    return response.make_conditional(request)
+                return cached_response(('columnar',) + signature, last_modified, 'application/msgpack',
+                                       decompressed, compressible=False)
+
+            return cached_response(('jsonl',) + signature, last_modified, 'application/json',
+                                   lambda: transcode_turn_chunk(decompressed()))
         except Exception as e:
             abort_with_log(500, f"압축 해제 실패: {e}")
 
     abort_with_log(400, f"지원하지 않는 파일 유형입니다: {filename}")
 
+@app.route('/turns/<int:turn>')
+def serve_turn(turn):
+    """턴 하나 (턴 로그 한 줄과 같은 JSON)"""
+    if turn >= turn_reader.turn_count():
+        abort_with_log(404, f"{turn} 턴의 로그가 존재하지 않습니다.")
+    for header, frame in turn_reader.iter_turns(turn, turn):
+        return Response(turn_json(header, frame), content_type='application/json')
+    abort_with_log(404, f"{turn} 턴의 로그가 존재하지 않습니다.")
+
+@app.route('/turns')
+def serve_turns():
+    """from ~ to 턴(포함)을 한 줄에 한 턴씩 JSON lines 로 스트리밍"""
+    first = request.args.get('from', default=0, type=int)
+    last = request.args.get('to', default=turn_reader.turn_count() - 1, type=int)
+    if first > last:
+        abort_with_log(400, f"잘못된 턴 범위입니다: {first} ~ {last}")
+
+    def generate():
+        for header, frame in turn_reader.iter_turns(first, last):
+            yield turn_json(header, frame) + "\n"
+
+    return Response(generate(), content_type='application/x-ndjson')
+
+@app.route('/turns/cache')
+def serve_turn_cache_stats():
+    """해제한 프레임 캐시의 적중/실패 횟수 등"""
+    return jsonify(frame_cache.stats())
+
 @app.route('/logs/<int:object_id>')
 def serve_gene(object_id):
-    global offset_index
-    if object_id >= len(offset_index):
-        offset_index = load_offset_index()
+    try:
+        genome_store.refresh()
+        document = trait_document(object_id)
+    except Exception as e:
+        abort_with_log(500, f"유전자 처리 중 오류 발생: {e}")
+    if document is None:
         abort_with_log(404, f"ID {object_id}에 해당하는 유전자 정보가 존재하지 않습니다.")
+    return conditional_document(document)
+
+@app.route('/genes')
+def serve_genes():
+    """?ids=1,2,3 의 형질을 한 번에 {"id": 형질} 로 (유전자 정보가 없는 ID 는 null)"""
+    try:
+        ids = list(dict.fromkeys(int(i) for i in request.args.get('ids', '').split(',') if i.strip()))
+    except ValueError:
+        abort_with_log(400, f"잘못된 ID 목록입니다: {request.args.get('ids')}")
+    if any(object_id < 0 for object_id in ids):
+        abort_with_log(400, f"ID 는 0 이상이어야 합니다: {request.args.get('ids')}")
+    if len(ids) > MAX_GENE_BATCH:
+        abort_with_log(400, f"한 번에 요청할 수 있는 ID 는 {MAX_GENE_BATCH}개까지입니다.")
     try:
-        offset = offset_index[object_id]
-        with open(GENETIC_DATA_PATH, "rb") as f:
-            f.seek(offset)
-            line = f.readline().decode("utf-8").strip()
-            raw_bytes = base64.b64decode(line)
-            interpreted = asdict(compute_biological_traits(Genome(raw_bytes).traits))
-            interpreted = convert_ndarray_and_set(interpreted)
-            return jsonify(interpreted)
+        genome_store.refresh()
+        documents = [(object_id, trait_document(object_id)) for object_id in ids]
     except Exception as e:
         abort_with_log(500, f"유전자 처리 중 오류 발생: {e}")
 
+    # 캐시된 형질 JSON 을 다시 파싱하지 않고 이어붙임
+    body = b"{" + b",".join(
+        b'"%d":%s' % (object_id, document if document is not None else b"null")
+        for object_id, document in documents
+    ) + b"}"
+    return conditional_document(body)
+
+@app.route('/genes/cache')
+def serve_trait_cache_stats():
+    """형질 캐시의 적중/실패 횟수 등"""
+    return jsonify(trait_cache.stats())
+
 @app.route("/logs/sheet")
 def serve_zipped_creature_sheet():
     try:
-        if not os.path.exists(CREATURE_SHEET_PATH):
-            abort_with_log(404, "시트 이미지가 존재하지 않습니다.")
-
-        # ZIP 버퍼 생성
-        zip_buffer = io.BytesIO()
-        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-            zipf.write(CREATURE_SHEET_PATH, arcname="creature_sheet.png")
-
-        zip_buffer.seek(0)
-        return send_file(
-            zip_buffer,
-            mimetype="application/zip",
-            as_attachment=True,
-            download_name="creature_sheet.zip"
+        # 저장 중인 페이지의 임시 파일은 제외
+        paths = sorted(path for path in CREATURE_ATLAS_DIR.glob("*") if path.suffix != ".tmp")
+        if not paths:
+            abort_with_log(404, "스프라이트 아틀라스가 존재하지 않습니다.")
+
+        def build_zip():
+            zip_buffer = io.BytesIO()
+            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
+                for path in paths:
+                    zipf.write(path, arcname=f"creature_atlas/{path.name}")
+            return zip_buffer.getvalue()
+
+        # 아틀라스 파일이 갱신될 때만 ZIP 을 다시 만듦 (이미 압축된 본문이므로 전송 압축은 하지 않음)
+        return cached_response(
+            ('sheet',) + tuple(file_signature(path) for path in paths), max(map(file_modified_at, paths)),
+            "application/zip", build_zip, compressible=False,
+            headers={'Content-Disposition': 'attachment; filename=creature_atlas.zip'},
         )
     except Exception as e:
         abort_with_log(500, f"시트 압축 중 오류 발생: {e}")
 
 @app.route("/logs/terrain")
 def serve_altitude():
-    data = np.load(LOGS_DIR / "terrain_altitude.npy").tolist()
-    return jsonify({"altitude": data})
+    path = LOGS_DIR / "terrain_altitude.npy"
+    if not path.is_file():
+        abort_with_log(404, f"파일을 찾을 수 없습니다: {path}")
+
+    def load():
+        return json.dumps({"altitude": np.load(path).tolist()}, separators=(",", ":")).encode("utf-8")
+
+    return cached_response(('terrain',) + file_signature(path), file_modified_at(path), 'application/json', load)
 
 @app.route('/logs/<path:filename>')
 def raw_logs(filename):
@@ -145,5 +322,4 @@ def raw_logs(filename):
 
 # === 실행 ===
 if __name__ == '__main__':
-    offset_index = load_offset_index()
     app.run(debug=True, port=5000)
@@ -0,0 +1,341 @@
+import multiprocessing as mp
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.core.engine import World
+from src.core.store import CreatureStore, IdBlocks
+from src.data.logger import TurnRecord, WorldLog
+from src.entities.organism import Creature
+from src.utils.constants import *
+from src.utils.datatypes import Vector2
+from src.utils.math_utils import get_grid_coords
+from src.utils.rng import RandomStreams
+
+
+@dataclass(frozen=True)
+class Domain:
+    """작업자 하나가 소유하는 직사각형 그리드 영역 [y0, y1) x [x0, x1)"""
+    index   : int
+    y0      : int
+    y1      : int
+    x0      : int
+    x1      : int
+    halo    : int = DOMAIN_HALO
+
+    def owns(self, x: int, y: int) -> bool:
+        return self.y0 <= y < self.y1 and self.x0 <= x < self.x1
+
+    def owns_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        return (ys >= self.y0) & (ys < self.y1) & (xs >= self.x0) & (xs < self.x1)
+
+    def halo_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """소유 영역 바깥 halo 폭 이내의 그리드인지 (이 도메인이 ghost 로 받아야 하는 영역)"""
+        h = self.halo
+        near = (ys >= self.y0 - h) & (ys < self.y1 + h) & (xs >= self.x0 - h) & (xs < self.x1 + h)
+        return near & ~self.owns_array(xs, ys)
+
+    def border_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """소유 영역 중 경계에서 halo 폭 이내의 그리드인지 (이웃 도메인의 halo 에 걸치는 띠)"""
+        h = self.halo
+        inner = (ys >= self.y0 + h) & (ys < self.y1 - h) & (xs >= self.x0 + h) & (xs < self.x1 - h)
+        return self.owns_array(xs, ys) & ~inner
+
+
+def split_domains(height: int, width: int, workers: int) -> list[Domain]:
+    """height x width 그리드를 workers 개의 직사각형 도메인으로 나눔 (도메인 경계 길이가 가장 짧은 행x열 배치)"""
+    rows = min(
+        (r for r in range(1, workers + 1) if workers % r == 0),
+        key=lambda r: (r - 1) * width + (workers // r - 1) * height,
+    )
+    cols = workers // rows
+    ys = np.linspace(0, height, rows + 1).astype(int).tolist()
+    xs = np.linspace(0, width, cols + 1).astype(int).tolist()
+    return [
+        Domain(r * cols + c, ys[r], ys[r + 1], xs[c], xs[c + 1])
+        for r in range(rows) for c in range(cols)
+    ]
+
+
+# === 열 단위 생물 묶음 (World.export_creatures 형식) ===
+def empty_payload() -> dict:
+    return {
+        'columns'    : {name: np.zeros(0, dtype=dtype) for name, dtype in CreatureStore.STATE_COLUMNS},
+        'genomes'    : [],
+        'brain_nodes': [],
+        'cry_volume' : np.zeros((0, CRY_VOLUME_SIZE), dtype=bool),
+        'attention'  : np.zeros(0, dtype=np.int64),
+    }
+
+
+def take_payload(payload: dict, mask: np.ndarray) -> dict:
+    """mask 가 참인 개체만 골라낸 묶음"""
+    index = np.flatnonzero(mask)
+    return {
+        'columns'    : {name: values[index] for name, values in payload['columns'].items()},
+        'genomes'    : [payload['genomes'][i] for i in index],
+        'brain_nodes': [payload['brain_nodes'][i] for i in index],
+        'cry_volume' : payload['cry_volume'][index],
+        'attention'  : payload['attention'][index],
+    }
+
+
+def concat_payloads(payloads: list[dict]) -> dict:
+    if not payloads:
+        return empty_payload()
+    return {
+        'columns'    : {
+            name: np.concatenate([p['columns'][name] for p in payloads])
+            for name in payloads[0]['columns']
+        },
+        'genomes'    : [genome for p in payloads for genome in p['genomes']],
+        'brain_nodes': [nodes for p in payloads for nodes in p['brain_nodes']],
+        'cry_volume' : np.concatenate([p['cry_volume'] for p in payloads]),
+        'attention'  : np.concatenate([p['attention'] for p in payloads]),
+    }
+
+
+class DomainWorker:
+    """작업자 프로세스 안에서 도메인 하나의 World 를 진행시킨다. 한 턴은 두 단계로 나뉜다.
+
+    prepare(inbox): 턴 시작 상태를 만들고 경계 띠 생물을 내보낸다.
+      - immigrants: 이 도메인으로 넘어온 생물 (소유권 이전)
+      - deltas:     지난 턴 다른 도메인에서 ghost 로 입은 체력/에너지 변화 {id: (체력, 에너지)}
+      를 반영하고 기초 대사를 차감한 뒤의 경계 띠 생물을 보낸다.
+    step(ghosts): 이웃 도메인이 같은 턴에 prepare 로 보낸 경계 띠 생물 사본을 halo 에 받아
+      (시야/공격/짝짓기 대상, 직접 처리하지 않음) 턴을 진행하고 로그 기록, 탄생 정보,
+      ghost 변화량, 떠나는 생물을 보낸다.
+
+    따라서 think() 시점의 ghost 는 소유 도메인의 같은 턴 시작 상태와 같다.
+    남는 차이는 턴 진행 중의 상호작용뿐이다: ghost 에 가한 변화는 소유 도메인에 다음 턴 시작에 반영되고,
+    경계 너머 개체가 이번 턴에 먼저 처리되어 바뀐 위치/상태는 이번 턴에는 보이지 않는다.
+    """
+
+    def __init__(self, world: World):
+        self.world = world
+        self.ghosts: dict[int, Creature] = {}
+        self.ghost_base: dict[int, tuple[int, float]] = {}
+        self.parsed: dict = {}      # ID → (Genome, Traits): 계속 halo 에 머무는 개체의 유전자 재해석 방지
+        self.attention: dict[Creature, int] = {}    # 이주해 온 생물 → 주의 대상 ID (ghost 를 받은 뒤 연결)
+
+    def populate(self, spawns: list[tuple[tuple[int, int], bytes, int]]) -> dict:
+        """초기 생물 생성 (위치, 유전자, 계보 키)"""
+        world = self.world
+        for (x, y), genome_bytes, lineage in spawns:
+            pos = Vector2(x, y)
+            gridPos = get_grid_coords(pos)
+            grid = world.world[gridPos.y][gridPos.x]
+            creature = Creature(pos, genome_bytes, world, grid, 0, lineage)
+            world.place(creature, grid)
+            world.logs.register_creature({creature})
+        return self._outbox(record=None)
+
+    def prepare(self, inbox: dict) -> dict:
+        """이주/ghost 변화량/기초 대사를 반영한 이번 턴 시작 상태의 경계 띠 생물을 내보냄"""
+        world, store, domain = self.world, self.world.store, self.world.domain
+
+        # 지난 턴의 ghost 를 먼저 치워야 같은 ID 의 개체가 이주해 올 수 있음
+        for ghost in self.ghosts.values():
+            world.detach(ghost)
+        self.ghosts.clear()
+
+        immigrants = world.import_creatures(inbox['immigrants'], parsed=self.parsed)
+        self.attention = dict(zip(immigrants, inbox['immigrants']['attention'].tolist()))
+
+        owned = world.creatures_by_id()
+        for creature_id, (health, energy) in inbox['deltas'].items():
+            creature = owned.get(creature_id)
+            if creature is not None:
+                creature.health += health
+                creature.energy += energy
+
+        store.metabolize()
+
+        rows = store.owned_rows()
+        border = domain.border_array(store.grid_x[rows], store.grid_y[rows])
+        return {'border': world.export_creatures([store.creatures[row] for row in rows[border]])}
+
+    def step(self, ghosts: dict) -> dict:
+        """같은 턴의 경계 띠 생물을 ghost 로 받아 턴을 진행"""
+        world = self.world
+
+        imported = world.import_creatures(ghosts, ghost=True, parsed=self.parsed)
+        self.ghosts = {ghost.id: ghost for ghost in imported}
+        self.ghost_base = {ghost.id: (ghost.health, ghost.energy) for ghost in imported}
+        self.parsed = {creature_id: self.parsed[creature_id] for creature_id in self.ghosts}
+        self._link_attention()
+
+        world.Trun(metabolize=False)
+        return self._outbox(record=world.logs.collect_turn(world.active_grids))
+
+    def _link_attention(self):
+        """주의 대상을 이 월드에 있는 같은 ID 의 현재 개체로 다시 연결.
+        ghost 는 매 턴 새로 만들어지므로, 지난 턴 ghost 를 가리키던 생물은 이번 턴 ghost 를 보게 된다.
+        이 월드에 없는 개체(halo 밖으로 나갔거나 죽은 개체)를 보던 경우에는 마지막으로 본 사본이 남는다."""
+        world = self.world
+        known = world.creatures_by_id()
+        for row in world.store.owned_rows().tolist():
+            creature = world.store.creatures[row]
+            target_id = self.attention.get(creature, creature.attention_creature.id)
+            target = known.get(target_id)
+            if target is not None:
+                creature.attention_creature = target
+        self.attention = {}
+
+    def _outbox(self, record: TurnRecord | None) -> dict:
+        world, store, domain = self.world, self.world.store, self.world.domain
+
+        deltas = {}
+        for creature_id, ghost in self.ghosts.items():
+            base_health, base_energy = self.ghost_base[creature_id]
+            if ghost.health != base_health or ghost.energy != base_energy:
+                deltas[creature_id] = (ghost.health - base_health, ghost.energy - base_energy)
+
+        # 소유 영역을 벗어난 생물은 내보내고 이 월드에서 제거 (죽음이 아니므로 사체를 남기지 않음)
+        rows = store.owned_rows()
+        leaving = ~domain.owns_array(store.grid_x[rows], store.grid_y[rows])
+        emigrants = [store.creatures[row] for row in rows[leaving]]
+        emigrant_payload = world.export_creatures(emigrants)
+        for creature in emigrants:
+            world.detach(creature)
+
+        return {
+            'record'    : record,
+            'births'    : world.logs.take_registered(),
+            'deltas'    : deltas,
+            'emigrants' : emigrant_payload,
+            'population': world.population(),
+        }
+
+
+def make_worker(fields, domain: Domain, workers: int, seed: int) -> DomainWorker:
+    return DomainWorker(World(fields=fields, domain=domain, ids=IdBlocks(domain.index, workers), seed=seed))
+
+
+def run_worker(connection, fields, domain: Domain, workers: int, seed: int):
+    """작업자 프로세스 진입점"""
+    node = make_worker(fields, domain, workers, seed)
+    while True:
+        command, payload = connection.recv()
+        if command == 'close':
+            break
+        connection.send(getattr(node, command)(payload))
+    connection.close()
+
+
+class ParallelWorld:
+    """월드를 직사각형 도메인으로 나눠 작업자 프로세스들이 동시에 진행시키는 조정자.
+
+    작업자끼리는 직접 통신하지 않고 모든 교환이 조정자를 거친다(star topology).
+    한 턴은 prepare → (경계 띠 생물을 이웃 도메인의 halo 로 전달) → step 순서로 진행되어,
+    think() 가 보는 ghost 는 같은 턴 시작 상태가 된다. step 뒤에는 떠나는 생물을 새 소유 도메인으로,
+    ghost 변화량을 소유 도메인으로 전달하고, 작업자별 턴 기록을 합쳐 WorldLog 에 쓴다.
+    World 와 같이 Trun()/population() 을 제공하므로 Simulator 에서 그대로 사용할 수 있다.
+    processes=False 이면 작업자를 프로세스로 띄우지 않고 이 프로세스 안에서 차례로 진행시킨다
+    (결과는 같으며, nodes 로 작업자별 World 를 직접 들여다볼 수 있어 디버깅과 테스트에 쓴다).
+    """
+
+    def __init__(self, workers: int = SIMULATION_WORKERS, seed: int = 0, processes: bool = True):
+        self.time = 0
+        height, width = WORLD_HIGHT_SCALE + 4, WORLD_WIDTH_SCALE + 4
+        rng = RandomStreams(seed)
+        fields = World.generate_fields(rng)
+
+        self.domains = split_domains(height, width, workers)
+        self.owner_map = np.empty((height, width), dtype=np.int32)
+        for domain in self.domains:
+            self.owner_map[domain.y0:domain.y1, domain.x0:domain.x1] = domain.index
+
+        self.logs = WorldLog(None, None, shape=(height, width))
+        self._population = 0
+
+        self.nodes: list[DomainWorker] = []
+        self.connections = []
+        self.processes = []
+        if processes:
+            context = mp.get_context('spawn')
+            for domain in self.domains:
+                parent, child = context.Pipe()
+                process = context.Process(target=run_worker, args=(child, fields, domain, workers, seed), daemon=True)
+                process.start()
+                self.connections.append(parent)
+                self.processes.append(process)
+        else:
+            self.nodes = [make_worker(fields, domain, workers, seed) for domain in self.domains]
+
+        # 초기 생물: 단일 프로세스 World 와 같은 위치/유전자를 소유 도메인에 나눠 보냄
+        spawns = [[] for _ in self.domains]
+        for lineage, (pos, genome_bytes) in enumerate(World.initial_creatures(rng)):
+            gridPos = get_grid_coords(pos)
+            spawns[self.owner_map[gridPos.y, gridPos.x]].append(((pos.x, pos.y), genome_bytes, lineage))
+
+        self._inboxes = self._route(self._exchange('populate', spawns))
+
+    def _exchange(self, command: str, payloads: list) -> list[dict]:
+        """모든 작업자에게 명령을 보낸 뒤 응답을 모음 (작업자들은 그 사이 동시에 진행)"""
+        if self.nodes:
+            return [getattr(node, command)(payload) for node, payload in zip(self.nodes, payloads)]
+        for connection, payload in zip(self.connections, payloads):
+            connection.send((command, payload))
+        return [connection.recv() for connection in self.connections]
+
+    def _route_ghosts(self, borders: list[dict]) -> list[dict]:
+        """경계 띠 생물 → halo 에 그 위치를 포함하는 다른 도메인"""
+        ghosts = []
+        for domain in self.domains:
+            ghosts.append(concat_payloads([
+                take_payload(border['border'], domain.halo_array(border['border']['columns']['grid_x'], border['border']['columns']['grid_y']))
+                for source, border in zip(self.domains, borders)
+                if source.index != domain.index
+            ]))
+        return ghosts
+
+    def _route(self, outboxes: list[dict]) -> list[dict]:
+        """작업자 응답을 로그에 반영하고 다음 턴에 각 작업자가 prepare 에서 받을 내용을 만든다"""
+        for outbox in outboxes:
+            self.logs.static_creature_data.extend(outbox['births'])
+        records = [outbox['record'] for outbox in outboxes if outbox['record'] is not None]
+        if records:
+            self.logs.write_turn(TurnRecord.merge(records))
+        self._population = sum(outbox['population'] for outbox in outboxes)
+
+        # 떠나는 생물 → 새 위치의 소유 도메인
+        emigrants = concat_payloads([outbox['emigrants'] for outbox in outboxes])
+        destination = self.owner_map[emigrants['columns']['grid_y'], emigrants['columns']['grid_x']]
+        immigrants = [take_payload(emigrants, destination == domain.index) for domain in self.domains]
+
+        # ghost 변화량 → 현재 소유 도메인 (이번 턴 기록과 이주 목적지 기준)
+        owner_of = {}
+        for record, domain in zip((outbox['record'] for outbox in outboxes), self.domains):
+            if record is not None:
+                owner_of.update(dict.fromkeys(record.columns['id'].tolist(), domain.index))
+        owner_of.update(zip(emigrants['columns']['id'].tolist(), destination.tolist()))
+
+        deltas = [{} for _ in self.domains]
+        for outbox in outboxes:
+            for creature_id, (health, energy) in outbox['deltas'].items():
+                owner = owner_of.get(creature_id)
+                if owner is None:
+                    continue    # 이번 턴에 죽은 개체
+                total_health, total_energy = deltas[owner].get(creature_id, (0, 0.0))
+                deltas[owner][creature_id] = (total_health + health, total_energy + energy)
+
+        return [
+            {'immigrants': immigrants[i], 'deltas': deltas[i]}
+            for i in range(len(self.domains))
+        ]
+
+    def population(self) -> int:
+        return self._population
+
+    def Trun(self):
+        ghosts = self._route_ghosts(self._exchange('prepare', self._inboxes))
+        self._inboxes = self._route(self._exchange('step', ghosts))
+        self.time += 1
+
+    def close(self):
+        self.logs.close()
+        for connection in self.connections:
+            connection.send(('close', None))
+        for process in self.processes:
+            process.join()
@@ -2,11 +2,22 @@ from src.core.engine            import World
 from src.utils.constants        import *
 from src.visualizer.CLI_viewer  import Viewer
 
-import numpy as np
 class Simulator:
-    def __init__(self, seed=1000005):
-        np.random.seed(seed)
-        self.world = World()
+    def __init__(self, seed=1000005, workers=SIMULATION_WORKERS, resume: str | None = None,
+                 checkpoint_interval=CHECKPOINT_INTERVAL, checkpoint_path=CHECKPOINT_PATH):
+        """
+        resume: 체크포인트 경로. 주면 새 월드 대신 그 시점의 월드에서 이어서 진행 (단일 프로세스)
+        checkpoint_interval 턴마다 checkpoint_path 에 체크포인트를 남긴다 (단일 프로세스 실행만 해당)
+        """
+        if resume is not None:
+            self.world = World.load_checkpoint(resume)
+        elif workers > 1:
+            from src.simulation.parallel import ParallelWorld
+            self.world = ParallelWorld(workers, seed)
+        else:
+            self.world = World(seed=seed)
+        self.checkpoint_interval = checkpoint_interval if isinstance(self.world, World) else 0
+        self.checkpoint_path = checkpoint_path
         self.viewer= Viewer(self.world)
 
     def run(self):
@@ -15,4 +26,6 @@ class Simulator:
 
     def step(self):
         self.world.Trun()
+        if self.checkpoint_interval and self.world.time % self.checkpoint_interval == 0:
+            self.world.save_checkpoint(self.checkpoint_path)
         self.viewer.step()
\ No newline at end of file
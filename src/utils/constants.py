@@ -3,6 +3,16 @@
 GRID_WIDTH_SCALE   = 4000
 GRID_HIGHT_SCALE   = 4000
 
+SPATIAL_CELL_SIZE  = 1000  # 근접 탐색용 공간 해시 셀 크기 (일반적인 attack_range 수준)
+
+SIMULATION_WORKERS = 1     # 월드를 나눠 처리할 작업자 프로세스 수 (1 이면 단일 프로세스)
+DOMAIN_HALO        = 4     # 도메인 경계 너머로 복사해 오는 그리드 폭 (최대 시야 반경)
+IMPORT_PARSE_BATCH = 4096  # 생물을 되살릴 때(체크포인트 불러오기, 도메인 이동) 한 번에 해석하는 유전자 수
+ID_BLOCK_SIZE      = 256   # 작업자별 생물 ID 블록 크기
+
+CHECKPOINT_INTERVAL = 1000                  # 체크포인트를 남기는 턴 간격 (0 이면 남기지 않음)
+CHECKPOINT_PATH     = "logs/checkpoint.zst"
+
 WORLD_WIDTH_SCALE   = 100
 WORLD_HIGHT_SCALE   = 100
 
@@ -41,6 +51,7 @@ AUDITORY_RANGE_ENERGY_COST      = 0.03		# 청각 반경당 에너지 비용
 VISIBLE_ENTITY_ENERGY_COST      = 0.02		# 감지 가능한 생물 수당 비용
 FOOD_LOCATION_ENERGY_COST       = 0.05		# 음식 위치 감지 여부에 따른 비용
 THRESHOLD_WEIGHT                = 0.001     # 역치 가중인자
+BRAIN_CONVERGENCE_TOLERANCE     = 1e-6      # 역치 시냅스가 없는 뇌의 노드 변화량이 이 값 미만이면 고정점으로 보고 남은 연산 생략 (None 이면 항상 정확히 계산)
 
 # 신체활동
 LIMB_LENGTH_ENERGY_COST         = 20		# 팔다리 길이에 따른 비용
@@ -67,5 +78,9 @@ ENERGY_RESERVE_MULTIPLIER       = 30000   # 전체적인 에너지 저장량
 
 CRUSH_DAMAGE_PER_SIZE = 100  # 압사 데미지 계수
 CRY_VOLUME_SIZE = 10 #한 개체가 낼 수 있는 소리 한계
+CALL_CHANNEL_SIZE = 1000 #그리드 울음소리 채널 크기 (울음소리 종류 수)
 RECOVERY_RATE = 1 #회복계수
-ALTITUDE_HEALTH_DECAY = 0.1  # 고도 불일치 기본 감쇠율
\ No newline at end of file
+ALTITUDE_HEALTH_DECAY = 0.1  # 고도 불일치 기본 감쇠율
+SPECIES_SIMILARITY_LENGTH = 100      # 종 유사도 비교에 쓰는 유전자 앞부분 글자 수
+SPECIES_SIMILARITY_THRESHOLD = 0.9   # 유성생식 상대로 인정하는 종 유사도 하한
+SIMILARITY_CACHE_SIZE = 65536        # 월드 공용 종 유사도 캐시 크기 (LRU)
\ No newline at end of file
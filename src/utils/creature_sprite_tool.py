@@ -1,5 +1,5 @@
-import sys, os
-import math, base64, struct, json, colorsys
+import sys, os, shutil
+import math, struct, json, colorsys
 import numpy as np
 from PIL import Image
 from dataclasses import asdict
@@ -8,6 +8,7 @@ from itertools import product
 # === 상위 폴더 import 경로 추가 ===
 PARENT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 sys.path.append(PARENT_DIR)
+from src.data.genome_store import GenomeStoreReader
 from src.entities.genome import Genome
 from src.utils.brain_constants import GENE_INDEX, INPUT_INDICES, OUTPUT_INDICES
 from src.utils.math_utils import filter_reachable_loads
@@ -15,8 +16,20 @@ from src.utils.math_utils import filter_reachable_loads
 # === 상수 설정 ===
 TILE_SIZE = 16
 SPRITE_PATH = "assets/parts_template_16x16.png"
-STATIC_PATH = "logs/static_data.jsonl"
-IMAGE_PATH   = "logs/creature_sheet.png"
+GENOME_STORE_DIR = "logs"
+ATLAS_DIR = "logs/creature_atlas"
+
+# === 아틀라스 페이지 (칸 수) / 색인 ===
+ATLAS_COLUMNS = 64
+ATLAS_ROWS = 64
+ATLAS_SLOTS = ATLAS_COLUMNS * ATLAS_ROWS
+ATLAS_INDEX_FILENAME = "index.bin"
+ATLAS_INDEX_DTYPE = np.dtype([
+    ('page',   '<u4'),
+    ('slot',   '<u4'),
+    ('size',   '<f4'),
+    ('stored', '<u4'),
+])
 
 OFFSET_Y = TILE_SIZE // 2
 
@@ -111,94 +124,143 @@ def generate_creature_image(sprite_path, body, xlegs, ylegs, mouth, tail, eye_in
 
     return canvas
 
-def reset_creature_sheet():
-    if os.path.exists(IMAGE_PATH):
-        os.remove(IMAGE_PATH)
-
-from pathlib import Path
-# === 시트 이미지 생성 ===
-def generate_creature_sheet(lines=[], tile_size=16):
-    # # === 데이터 불러오기 ===
-    # with open(STATIC_PATH, "r", encoding="utf-8") as f:
-    #     lines = f.readlines()
-    new_count = len(lines)
-
-    if Path(IMAGE_PATH).exists():
-        sheet_img = Image.open(IMAGE_PATH).convert("RGBA")
-        existing_width = sheet_img.width
-        new_width = existing_width + new_count * tile_size
-        new_height = tile_size * 2
-        new_img = Image.new("RGBA", (new_width, new_height), (0, 0, 0, 0))
-        new_img.paste(sheet_img, (0, 0))
-        start_idx = existing_width // tile_size
-        sheet_img = new_img
-        size_mode = "a"
-    else:
-        sheet_img = Image.new("RGBA", (new_count * tile_size, tile_size * 2), (0, 0, 0, 0))
-        start_idx = 0
-        size_mode = "w"
-
-    # === 크기 정보 파일 경로 및 모드 ===
-    size_path = IMAGE_PATH.replace(".png", "_size.jsonl")
-    with open(size_path, size_mode, encoding="utf-8") as size_file:
-        for i, line in enumerate(lines):
-            idx = start_idx + i
-            raw = base64.b64decode(line.strip())
-            gene = asdict(Genome(raw).traits)
-            parts = map_gene_to_parts(gene)
-            hs = gene["species_color_rgb"]
-
-            img = generate_creature_image(
-                SPRITE_PATH,
-                leg_color=(hs[0], hs[1]),
-                body_color=(hs[2], hs[3]),
-                antenna_color=(hs[4], hs[5]),
-                **parts
-            )
-
-            sheet_img.paste(img, (idx * tile_size, 0), img)
-            size_file.write(f"{gene['size']:.3f}\n")
-
-            # if i % 100 == 0:
-            #     ratio = i / new_count
-            #     percent = ratio * 100
-            #     bar_len = 50
-            #     passed = "=" * int(ratio * bar_len)
-            #     remaining = "-" * (bar_len - len(passed))
-            #     print(f"| {i}/{new_count} | {percent:.1f}% {passed}>{remaining}", end='\r')
-
-    sheet_img.save(IMAGE_PATH)
-    #print(f"✅ 저장 완료: {IMAGE_PATH} ({start_idx} → {start_idx + new_count})                           ")
+# === 스프라이트 아틀라스 ===
+def render_creatures(genomes):
+    """유전자 바이트열 목록의 (개체 이미지, 크기) 를 차례로 생성"""
+    for genome in Genome.parse_batch([bytes(genome) for genome in genomes]):
+        gene = asdict(genome.traits)
+        parts = map_gene_to_parts(gene)
+        hs = gene["species_color_rgb"]
 
+        img = generate_creature_image(
+            SPRITE_PATH,
+            leg_color=(hs[0], hs[1]),
+            body_color=(hs[2], hs[3]),
+            antenna_color=(hs[4], hs[5]),
+            **parts
+        )
+        yield img, gene['size']
 
-from PIL import Image
 
-def load_creatures_from_sheet(indices, tile_size=16):
-    """
-    생물 시트 이미지에서 여러 개체를 한 번에 불러오고, 좌표와 함께 반환
-    :param indices: 불러올 인덱스 리스트 (e.g., [0, 2, 5])
-    :param tile_size: 타일 크기 (기본값 16)
-    :return: List of (idx, image) tuples, full sheet image
+class CreatureAtlas:
+    """개체 이미지(TILE_SIZE x TILE_SIZE*2) 를 고정 크기 페이지에 기록 순서대로 채우는 스프라이트 아틀라스.
+
+    - page_XXXXX.png : ATLAS_COLUMNS x ATLAS_ROWS 칸 페이지. 다 찬 페이지는 다시 쓰지 않는다.
+    - index.bin      : ID*itemsize 위치마다 (페이지, 칸, 크기, 기록 여부)
+    - atlas.json     : 시각화 도구가 읽는 배치 정보
+
+    add() 는 현재 페이지만 다시 저장하므로 기록 비용이 전체 개체 수가 아니라 페이지 크기에 비례한다.
     """
-    sheet = Image.open(IMAGE_PATH).convert("RGBA")
-    sheet_width, sheet_height = sheet.size
-    cols = sheet_width // tile_size
 
-    results = []
-    for idx in indices:
-        cx = (idx % cols) * tile_size
-        cy = (idx // cols) * tile_size * 2  # 높이 2배
-        creature = sheet.crop((cx, cy, cx + tile_size, cy + tile_size * 2))
-        results.append((idx, creature))
+    def __init__(self, atlas_dir=ATLAS_DIR, reset=False):
+        self.atlas_dir = atlas_dir
+        self.index_path = os.path.join(atlas_dir, ATLAS_INDEX_FILENAME)
+        if reset:
+            shutil.rmtree(atlas_dir, ignore_errors=True)
+        os.makedirs(atlas_dir, exist_ok=True)
+        meta_path = os.path.join(atlas_dir, "atlas.json")
+        if not os.path.exists(meta_path):
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    'tile_size': TILE_SIZE,
+                    'columns'  : ATLAS_COLUMNS,
+                    'rows'     : ATLAS_ROWS,
+                    'index'    : [[name, dtype.str] for name, (dtype, _) in ATLAS_INDEX_DTYPE.fields.items()],
+                }, f)
+        open(self.index_path, "ab").close()
+        self.reload()
+
+    def files(self) -> tuple[str, ...]:
+        return (self.index_path,)
+
+    def reload(self):
+        """색인 파일 기준으로 다음 칸을 다시 계산 (체크포인트에서 이어갈 때 잘라낸 색인 기준으로)
+        ID 순서와 칸 순서가 다를 수 있으므로 기록된 ID 가 쓰는 마지막 칸의 다음 칸부터 채운다."""
+        index = self.index()
+        stored = index[index['stored'] != 0]
+        self.next_slot = int((stored['page'].astype(np.int64) * ATLAS_SLOTS + stored['slot']).max()) + 1 if len(stored) else 0
+        self._page = None
+        self._page_number = -1
+
+    def index(self) -> np.ndarray:
+        return np.fromfile(self.index_path, dtype=ATLAS_INDEX_DTYPE)
+
+    def page_path(self, page: int) -> str:
+        return os.path.join(self.atlas_dir, f"page_{page:05d}.png")
+
+    @staticmethod
+    def slot_box(slot: int) -> tuple[int, int, int, int]:
+        x = (slot % ATLAS_COLUMNS) * TILE_SIZE
+        y = (slot // ATLAS_COLUMNS) * TILE_SIZE * 2
+        return (x, y, x + TILE_SIZE, y + TILE_SIZE * 2)
+
+    def _open_page(self, page: int):
+        if page != self._page_number:
+            path = self.page_path(page)
+            if os.path.exists(path):
+                self._page = Image.open(path).convert("RGBA")
+            else:
+                self._page = Image.new("RGBA", (ATLAS_COLUMNS * TILE_SIZE, ATLAS_ROWS * TILE_SIZE * 2), (0, 0, 0, 0))
+            self._page_number = page
+        return self._page
+
+    def _save_page(self):
+        # 임시 파일에 쓴 뒤 교체해, 읽는 쪽이 저장 중인 페이지를 보지 않게 함
+        path = self.page_path(self._page_number)
+        self._page.save(f"{path}.tmp", format="PNG")
+        os.replace(f"{path}.tmp", path)
+
+    def add(self, genomes, ids):
+        """개체 이미지를 다음 칸부터 채우고 ID 의 (페이지, 칸, 크기) 를 색인에 기록.
+        페이지를 먼저 저장하고 색인을 나중에 써서, 색인에 보이는 ID 의 이미지는 항상 페이지 파일에 있게 한다."""
+        if not ids:
+            return
+        entries = np.zeros(len(ids), dtype=ATLAS_INDEX_DTYPE)
+        for i, (img, size) in enumerate(render_creatures(genomes)):
+            page, slot = divmod(self.next_slot, ATLAS_SLOTS)
+            if page != self._page_number and self._page is not None:
+                self._save_page()       # 다 찬 페이지의 마지막 저장
+            canvas = self._open_page(page)
+            box = self.slot_box(slot)
+            canvas.paste((0, 0, 0, 0), box)     # 이어서 기록할 때 칸에 남아 있던 이미지를 지움
+            canvas.paste(img, box[:2], img)
+            entries[i] = (page, slot, size, 1)
+            self.next_slot += 1
+        self._save_page()
+
+        with open(self.index_path, "r+b") as f:
+            for creature_id, entry in zip(ids, entries):
+                f.seek(creature_id * ATLAS_INDEX_DTYPE.itemsize)
+                f.write(entry.tobytes())
+
+    def load_sprites(self, ids):
+        """ID 목록의 개체 이미지를 [(id, image)] 로 반환 (기록되지 않은 ID 는 건너뜀)"""
+        index = self.index()
+        pages = {}
+        results = []
+        for creature_id in ids:
+            if not 0 <= creature_id < len(index) or not index['stored'][creature_id]:
+                continue
+            page = int(index['page'][creature_id])
+            if page not in pages:
+                pages[page] = Image.open(self.page_path(page)).convert("RGBA")
+            results.append((creature_id, pages[page].crop(self.slot_box(int(index['slot'][creature_id])))))
+        return results
+
 
-    return results
+def rebuild_creature_atlas(log_dir=GENOME_STORE_DIR):
+    """유전자 저장소에 기록된 모든 개체로 아틀라스를 처음부터 다시 생성"""
+    reader = GenomeStoreReader(log_dir)
+    reader.refresh()
+    ids = reader.ids().tolist()
+    atlas = CreatureAtlas(os.path.join(log_dir, "creature_atlas"), reset=True)
+    atlas.add([reader.get(i) for i in ids], ids)
 
 
 # === 실행 ===
 if __name__ == "__main__":
-    reset_creature_sheet()
-    #generate_creature_sheet()
-    #creatures = load_creatures_from_sheet([np.random.randint(30000) for _ in range(10000)])
+    rebuild_creature_atlas()
+    #creatures = CreatureAtlas().load_sprites([np.random.randint(30000) for _ in range(10000)])
     #print(len(creatures))
     # for creature in creatures:
     #     Image._show(creature[1])
\ No newline at end of file
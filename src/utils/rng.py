@@ -0,0 +1,66 @@
+import hashlib
+import struct
+
+import numpy as np
+
+
+def lineage_key(parent: int, turn: int, index: int) -> int:
+    """부모 계보 키, 태어난 턴, 한 번에 태어난 자식 중 순번으로 정해지는 자식의 계보 키 (63비트).
+    한 생물은 한 턴에 많아야 한 번 번식하므로 (부모, 턴, 순번) 이 같은 자식은 없다."""
+    digest = hashlib.blake2b(struct.pack('<QQQ', parent, turn, index), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') >> 1
+
+
+class RandomStreams:
+    """(시드, 용도, 개체 계보 키, 턴) 으로 결정되는 난수 스트림 발급기.
+
+    Philox 는 카운터 기반 생성기라 키와 카운터만 정하면 어느 위치의 난수든 바로 만들 수 있다.
+    키는 (seed, 용도), 카운터 상위 워드는 (개체 계보 키, 턴, 같은 턴 안에서의 요청 순번) 으로 두어
+    처리 순서나 작업자 분할과 관계없이 같은 개체/턴/용도에는 항상 같은 난수가 나온다.
+    카운터 최하위 워드는 스트림 안에서 난수를 뽑을 때 증가하는 부분이다.
+
+    개체는 ID 가 아닌 계보 키(CreatureStore.lineage)로 구분한다. ID 는 작업자별 블록에서 발급되어
+    작업자 수에 따라 달라지지만, 계보 키는 초기 생물의 생성 순번과 lineage_key 로만 정해진다.
+    """
+
+    # 용도별 키 번호 (순서를 바꾸면 기존 시드의 결과가 달라짐)
+    PURPOSES = {
+        'world'     : 0,    # 지형/유기물 노이즈 시드
+        'spawn'     : 1,    # 초기 생물 위치/유전자
+        'move_dir'  : 2,    # 태어난 생물의 초기 이동 방향
+        'breed'     : 3,    # 자식 배치 각도, 교차 절단 지점, 돌연변이
+    }
+
+    def __init__(self, seed: int):
+        self.seed = int(seed)
+        self._turn = None
+        self._issued: dict[tuple[str, int], int] = {}
+
+    def stream(self, purpose: str, entity: int = 0, turn: int = 0) -> np.random.Generator:
+        """purpose 용도로 entity 가 turn 에 쓰는 새 생성기.
+        같은 (용도, 개체, 턴) 으로 여러 번 요청하면 요청 순번에 따라 서로 다른 스트림을 돌려준다."""
+        if turn != self._turn:
+            self._turn = turn
+            self._issued.clear()
+        key = (purpose, entity)
+        sequence = self._issued.get(key, 0)
+        self._issued[key] = sequence + 1
+
+        bit_generator = np.random.Philox(
+            key=np.array([self.seed, self.PURPOSES[purpose]], dtype=np.uint64),
+            counter=np.array([0, sequence, entity, turn], dtype=np.uint64),
+        )
+        return np.random.Generator(bit_generator)
+
+    def get_state(self) -> dict:
+        """체크포인트용 상태 (시드, 마지막 턴, 이번 턴의 요청 순번)"""
+        return {
+            'seed'  : self.seed,
+            'turn'  : self._turn,
+            'issued': [[purpose, entity, count] for (purpose, entity), count in self._issued.items()],
+        }
+
+    def set_state(self, state: dict):
+        self.seed = int(state['seed'])
+        self._turn = state['turn']
+        self._issued = {(purpose, entity): count for purpose, entity, count in state['issued']}
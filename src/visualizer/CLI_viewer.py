@@ -46,16 +46,15 @@ class Viewer:
 
         # 100턴마다 개체 수 갱신
         if self.count % 100 == 0:
-            creature_set = set()
-            for y in range(WORLD_HIGHT_SCALE+4):
-                for x in range(WORLD_WIDTH_SCALE+4):
-                    creature_set.update(self.world.world[y][x].creatures)
-            self.creature_count = len(creature_set)
+            self.creature_count = self.world.population()
 
         # 정보 계산
         elapsed = time() - self.start_time
         speed = self.count / elapsed if elapsed > 0 else 0
 
+        # 로그 기록 대기열 상태
+        log_stats = self.world.logs.writer_stats()
+
         # 이전 출력 제거
         if self.last_rendered_lines:
             print("\033[F" * (self.last_rendered_lines+1), end="")
@@ -67,6 +66,9 @@ class Viewer:
             f"Unique Creatures: {Fore.CYAN}{self.creature_count:5}{Style.RESET_ALL}  "
             f"Speed: {Fore.YELLOW}{speed:6.2f} steps/sec{Style.RESET_ALL}  "
             f"Elapsed: {Fore.GREEN}{elapsed:6.1f}s{Style.RESET_ALL}    ",
+            f"│ Log queue: {Fore.LIGHTWHITE_EX}{log_stats.get('depth', 0):3}/{log_stats.get('capacity', 0):<3}{Style.RESET_ALL}  "
+            f"Max: {log_stats.get('max_depth', 0):3}  "
+            f"Blocked: {Fore.RED}{log_stats.get('blocked', 0):5} ({log_stats.get('blocked_seconds', 0.0):6.1f}s){Style.RESET_ALL}    ",
             f"{Fore.LIGHTBLACK_EX}└─────────────────────────────────────────────────────────────────────────────────────{Style.RESET_ALL}"
         ]
         for line in lines:
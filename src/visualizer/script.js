@@ -15,8 +15,7 @@ const CONFIG = {
   CREATURE_RADIUS: 1,
   FRAMES_PER_FILE: 100,
   LOG_DIR: "/logs/compressed/",
-  CREATURE_SHEET_DIR: "/logs/creature_sheet.png",
-  CREATURE_SIZE_DIR: "/logs/creature_sheet_size.jsonl",
+  CREATURE_ATLAS_DIR: "/logs/creature_atlas/",
   TERRAIN_ALTITUDE_DIR: "/logs/terrain",
   MAX_CACHE_FILES: 9,
   PRELOAD_LOOKAHEAD: 8,
@@ -50,8 +49,11 @@ const cache = {
 };
 
 const CreatureSheetCache = {
-  sheetImage: null,  // HTMLImageElement
-  sizeArray: [],
+  meta: null,        // atlas.json (tile_size, columns, rows, index 필드)
+  pages: new Map(),  // 페이지 번호 → HTMLImageElement (처음 필요할 때 불러옴)
+  pageArray: null,   // id → 페이지
+  slotArray: null,   // id → 페이지 안의 칸
+  sizeArray: [],     // id → 크기
   ready: false,
 };
 
@@ -198,18 +200,38 @@ function extractVisibleFromTurn(turnData) {
 
 const CreatureImageCache = new Map();
 
-function extractCreatureByIndex(index, tileSize = 16) {
+function loadAtlasPage(page) {
+  if (CreatureSheetCache.pages.has(page)) return CreatureSheetCache.pages.get(page);
+
+  const img = new Image();
+  img.crossOrigin = "anonymous";
+  img.src = `${CONFIG.CREATURE_ATLAS_DIR}page_${String(page).padStart(5, "0")}.png`;
+  img.onerror = () => console.error("이미지 로딩 실패:", img.src);
+  CreatureSheetCache.pages.set(page, img);
+  return img;
+}
+
+function extractCreatureByIndex(index) {
   if (CreatureImageCache.has(index)) return CreatureImageCache.get(index);
 
-  const sheet = CreatureSheetCache.sheetImage;
-  const cx = index * tileSize;
+  const { tile_size: tileSize, columns } = CreatureSheetCache.meta;
+  const page = CreatureSheetCache.pageArray[index];
+  const slot = CreatureSheetCache.slotArray[index];
+  if (page === undefined) return null;
+
+  // 페이지가 아직 로드되지 않았으면 이번 프레임은 건너뛰고 다음 프레임에 다시 시도
+  const sheet = loadAtlasPage(page);
+  if (!sheet.complete || sheet.naturalWidth === 0) return null;
+
+  const cx = (slot % columns) * tileSize;
+  const cy = Math.floor(slot / columns) * tileSize * 2;
 
   const canvas = document.createElement("canvas");
   canvas.width = tileSize;
   canvas.height = tileSize * 2;
 
   const ctx = canvas.getContext("2d");
-  ctx.drawImage(sheet, cx, 0, tileSize, tileSize * 2, 0, 0, tileSize, tileSize * 2);
+  ctx.drawImage(sheet, cx, cy, tileSize, tileSize * 2, 0, 0, tileSize, tileSize * 2);
 
   CreatureImageCache.set(index, canvas); // 캐시 저장
   return canvas;
@@ -519,31 +541,29 @@ async function loadTerrainAltitude() {
   terrainAltitude = raw.map(row => row.map(h => terrainColors[h]));
 }
 
-async function preloadCreatureSheetAndSize(sheetUrl=CONFIG.CREATURE_SHEET_DIR, sizeUrl=CONFIG.CREATURE_SIZE_DIR) {
-  // 1. 이미지 로드
-  const img = new Image();
-  img.crossOrigin = "anonymous"; // CORS 대응용, 필요시
-  const imageLoaded = new Promise((resolve, reject) => {
-    img.onload = resolve;
-    img.onerror = reject;
-  });
-  img.src = sheetUrl;
-
-  try {
-    await imageLoaded;
-  } catch (e) {
-    console.error("이미지 로딩 실패:", sheetUrl, e);
+async function preloadCreatureSheetAndSize(atlasUrl=CONFIG.CREATURE_ATLAS_DIR) {
+  // 1. 아틀라스 배치 정보
+  const meta = await (await fetch(`${atlasUrl}atlas.json`)).json();
+  CreatureSheetCache.meta = meta;
+
+  // 2. index.bin (ID 마다 page u4, slot u4, size f4, stored u4) 로드. 페이지 이미지는 필요할 때 불러옴
+  const buffer = await (await fetch(`${atlasUrl}index.bin`)).arrayBuffer();
+  const recordSize = 16;
+  const count = Math.floor(buffer.byteLength / recordSize);
+  const view = new DataView(buffer);
+  const pageArray = new Array(count);
+  const slotArray = new Uint32Array(count);
+  const sizeArray = new Float32Array(count);
+  for (let id = 0; id < count; id++) {
+    const offset = id * recordSize;
+    if (view.getUint32(offset + 12, true) === 0) continue;   // 기록되지 않은 ID
+    pageArray[id] = view.getUint32(offset, true);
+    slotArray[id] = view.getUint32(offset + 4, true);
+    sizeArray[id] = view.getFloat32(offset + 8, true);
   }
-
-  CreatureSheetCache.sheetImage = img;
-
-  // 2. size.jsonl 로드
-  const response = await fetch(sizeUrl);
-  const text = await response.text();
-  CreatureSheetCache.sizeArray = text
-    .trim()
-    .split("\n")
-    .map(Number); // ← 실수 배열로 변환
+  CreatureSheetCache.pageArray = pageArray;
+  CreatureSheetCache.slotArray = slotArray;
+  CreatureSheetCache.sizeArray = sizeArray;
 
   CreatureSheetCache.ready = true;
 }
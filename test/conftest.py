@@ -0,0 +1,51 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 저장소 루트의 src 패키지를 테스트에서 바로 import 할 수 있게 함
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def run_dir(tmp_path, monkeypatch):
+    """tmp_path 아래 name 디렉터리(logs 포함)로 작업 디렉터리를 옮기는 함수.
+    World 는 상대 경로 logs/ 에 기록하므로 월드마다 다른 디렉터리에서 만들고 진행시킨다.
+    스프라이트 생성이 상대 경로 assets/ 를 읽으므로 저장소의 assets 를 연결해 둔다."""
+    def enter(name: str = "run"):
+        path = tmp_path / name
+        (path / "logs").mkdir(parents=True, exist_ok=True)
+        if not (path / "assets").exists():
+            (path / "assets").symlink_to(os.path.join(ROOT, "assets"), target_is_directory=True)
+        monkeypatch.chdir(path)
+        return path
+    return enter
+
+
+def world_state(world) -> dict:
+    """비교용 월드 상태: 생물 열(ID 순), 뇌 노드, 그리드별 생물/사체/울음소리/유기물, 활성 그리드"""
+    store = world.store
+    rows = store.live_rows()
+    rows = rows[np.argsort(store.id[rows], kind='stable')]
+    return {
+        'time'      : world.time,
+        'columns'   : {name: getattr(store, name)[rows].tolist() for name, _ in store.STATE_COLUMNS},
+        'brains'    : [store.creatures[row].brain_nodes.tolist() for row in rows],
+        'grids'     : [
+            (
+                sorted(creature.id for creature in grid.creatures),
+                sorted((corpse.position.x, corpse.position.y, corpse.energy) for corpse in grid.corpses),
+                sorted(grid.crying_sound_set),
+                list(grid.organics),
+            )
+            for row in world.world for grid in row
+        ],
+        'active'    : sorted((grid.pos.y, grid.pos.x) for grid in world.active_grids),
+    }
+
+
+@pytest.fixture
+def snapshot():
+    return world_state
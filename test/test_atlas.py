@@ -0,0 +1,125 @@
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import src.utils.creature_sprite_tool as sprite_tool
+from src.data.genome_store import GenomeStore
+from src.utils.creature_sprite_tool import (
+    ATLAS_INDEX_DTYPE, TILE_SIZE, CreatureAtlas, rebuild_creature_atlas, render_creatures,
+)
+
+
+@pytest.fixture
+def small_pages(run_dir, monkeypatch):
+    """2 x 2 칸 페이지로 줄여 몇 개체만으로 페이지가 넘어가게 함 (스프라이트 원본은 run_dir 의 assets 에서 읽음)"""
+    monkeypatch.setattr(sprite_tool, 'ATLAS_COLUMNS', 2)
+    monkeypatch.setattr(sprite_tool, 'ATLAS_ROWS', 2)
+    monkeypatch.setattr(sprite_tool, 'ATLAS_SLOTS', 4)
+    return run_dir()
+
+
+def random_genomes(count: int, seed: int = 0) -> list[bytes]:
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 256, 3000, dtype=np.uint8).tobytes() for _ in range(count)]
+
+
+def tiles(genomes: list[bytes]) -> list[np.ndarray]:
+    """빈 칸에 개체 이미지를 붙인 결과 (아틀라스 칸에서 잘라낸 이미지와 비교용)"""
+    result = []
+    for img, _ in render_creatures(genomes):
+        tile = Image.new("RGBA", (TILE_SIZE, TILE_SIZE * 2), (0, 0, 0, 0))
+        tile.paste(img, (0, 0), img)
+        result.append(np.asarray(tile))
+    return result
+
+
+def sprites(atlas: CreatureAtlas, ids: list[int]) -> dict[int, np.ndarray]:
+    return {creature_id: np.asarray(img) for creature_id, img in atlas.load_sprites(ids)}
+
+
+def assert_sprites(atlas: CreatureAtlas, genomes_by_id: dict[int, bytes]):
+    ids = list(genomes_by_id)
+    loaded = sprites(atlas, ids)
+    assert list(loaded) == ids
+    for creature_id, expected in zip(ids, tiles([genomes_by_id[i] for i in ids])):
+        assert expected[..., 3].any() and (loaded[creature_id] == expected).all(), f"creature {creature_id}"
+
+
+def test_pages_roll_over_and_full_pages_are_not_rewritten(small_pages):
+    atlas = CreatureAtlas(str(small_pages / "atlas"))
+    genomes = random_genomes(11)
+    ids = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 12]     # 12 는 건너뛴 ID 뒤에 기록
+
+    atlas.add(genomes[:5], ids[:5])
+    full_page = open(atlas.page_path(0), "rb").read()
+    atlas.add(genomes[5:], ids[5:])
+
+    assert sorted(os.listdir(atlas.atlas_dir)) == ["atlas.json", "index.bin", "page_00000.png", "page_00001.png", "page_00002.png"]
+    assert open(atlas.page_path(0), "rb").read() == full_page
+
+    index = atlas.index()
+    assert len(index) == 13
+    assert [divmod(i, 4) for i in range(11)] == list(zip(index['page'][ids].tolist(), index['slot'][ids].tolist()))
+    assert index['stored'].tolist() == [1] * 10 + [0, 0, 1]
+    sizes = [size for _, size in render_creatures(genomes)]
+    assert index['size'][ids].tolist() == np.array(sizes, dtype=np.float32).tolist()
+
+    assert_sprites(atlas, dict(zip(ids, genomes)))
+    assert atlas.load_sprites([10, 11, 13, -1]) == []
+
+
+def test_resume_continues_after_last_used_slot(small_pages):
+    atlas_dir = str(small_pages / "atlas")
+    genomes = random_genomes(9, seed=1)
+    ids = [4, 0, 7, 2, 9, 1, 3, 5, 6]               # ID 순서와 칸 순서가 다름 (병렬 실행의 블록 단위 ID)
+
+    CreatureAtlas(atlas_dir).add(genomes[:5], ids[:5])
+    resumed = CreatureAtlas(atlas_dir)
+    assert resumed.next_slot == 5
+    resumed.add(genomes[5:], ids[5:])
+
+    index = resumed.index()
+    assert (index['page'][ids].astype(int) * 4 + index['slot'][ids].astype(int)).tolist() == list(range(9))
+    assert_sprites(resumed, dict(zip(ids, genomes)))
+
+    # reset 하면 처음부터
+    assert CreatureAtlas(atlas_dir, reset=True).next_slot == 0
+    assert sorted(os.listdir(atlas_dir)) == ["atlas.json", "index.bin"]
+
+
+def test_truncated_index_reuses_and_clears_slots(small_pages):
+    """체크포인트에서 이어가며 색인을 잘라내면 그 뒤의 칸을 다시 쓰되, 칸에 남아 있던 이미지는 지운다"""
+    atlas = CreatureAtlas(str(small_pages / "atlas"))
+    before = random_genomes(10, seed=2)
+    atlas.add(before, list(range(10)))
+
+    os.truncate(atlas.index_path, 6 * ATLAS_INDEX_DTYPE.itemsize)
+    atlas.reload()
+    assert atlas.next_slot == 6
+
+    after = random_genomes(4, seed=3)
+    atlas.add(after, [6, 7, 8, 9])
+    index = atlas.index()
+    assert (index['page'][6:] * 4 + index['slot'][6:]).tolist() == [6, 7, 8, 9]
+    assert_sprites(atlas, dict(zip(range(10), before[:6] + after)))
+
+
+def test_rebuild_matches_incremental_atlas(small_pages):
+    log_dir = str(small_pages / "logs")
+    genomes = random_genomes(10, seed=4)
+    store = GenomeStore(log_dir)
+    incremental = CreatureAtlas(os.path.join(log_dir, "incremental"))
+    for batch in ([0, 1, 2], [3], [4, 5, 6, 7, 8, 9]):
+        store.append(batch, [genomes[i] for i in batch])
+        incremental.add([genomes[i] for i in batch], batch)
+
+    rebuild_creature_atlas(log_dir)
+    rebuilt = CreatureAtlas(os.path.join(log_dir, "creature_atlas"))
+
+    assert (rebuilt.index() == incremental.index()).all()
+    ids = list(range(10))
+    assert all((a == b).all() for a, b in zip(sprites(rebuilt, ids).values(), sprites(incremental, ids).values()))
+    for page in range(3):
+        assert (np.asarray(Image.open(rebuilt.page_path(page))) == np.asarray(Image.open(incremental.page_path(page)))).all()
@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import src.core.engine as engine
+from src.core.audio import AudioChannels
+from src.core.engine import World
+from src.utils.constants import CALL_CHANNEL_SIZE
+
+
+class Cell:
+    """AudioChannels 가 쓰는 속성(pos)만 가진 그리드 대용 객체 (해시 가능)"""
+
+    def __init__(self, y: int, x: int):
+        self.pos = SimpleNamespace(y=y, x=x)
+
+
+def test_speak_and_listen_swap():
+    audio = AudioChannels()
+    a, b = Cell(0, 0), Cell(0, 1)
+    audio.emit(a, 3)
+    audio.emit(a, 3)
+    audio.emit(b, 999)
+
+    # 말한 턴에는 아직 들리지 않음
+    assert audio.heard(a) is AudioChannels.SILENCE
+    audio.swap()
+    assert audio.heard(a)[3] == 2 and np.count_nonzero(audio.heard(a)) == 1
+    assert audio.heard(b)[999] == 1
+    assert audio.speak == {}
+
+    # 다음 턴에 말하는 소리는 듣기 채널과 다른 배열에 기록되고, 소리가 없던 그리드는 다시 조용해짐
+    heard = audio.heard(a)
+    audio.emit(a, 5)
+    assert heard[5] == 0 and audio.heard(a) is heard
+    audio.swap()
+    assert audio.heard(a)[5] == 1 and audio.heard(a)[3] == 0
+    assert audio.heard(b) is AudioChannels.SILENCE
+
+
+def test_silence_is_shared_and_never_written():
+    audio = AudioChannels()
+    quiet = Cell(2, 2)
+    silence = audio.heard(quiet)
+    assert silence is AudioChannels.SILENCE and not silence.flags.writeable
+    with pytest.raises(ValueError):
+        silence[0] = 1
+
+    # 조용했던 그리드에서 소리가 나도 새 배열을 만들 뿐 SILENCE 는 그대로
+    audio.emit(quiet, 0)
+    audio.swap()
+    assert audio.heard(quiet) is not AudioChannels.SILENCE
+    assert len(AudioChannels.SILENCE) == CALL_CHANNEL_SIZE and not AudioChannels.SILENCE.any()
+
+
+def test_audio_heard_matches_per_grid_channels(run_dir, monkeypatch):
+    """기존 Grid.crying_sound (그리드마다 [말하기, 듣기] 목록, 그리드 처리 직후 교체) 를 같은 진행에 나란히 유지하며
+    감각 단계에서 읽는 소리가 매번 같은지 확인한다. SILENCE 를 쓰려 하면 진행 중에 ValueError 가 난다."""
+    crying_sound, processed = {}, set()
+    reads = {'total': 0, 'loud': 0}
+
+    def channels(grid):
+        return crying_sound.setdefault(grid, [[0] * CALL_CHANNEL_SIZE, [0] * CALL_CHANNEL_SIZE])
+
+    def turn(grid):
+        channels(grid)[1] = channels(grid)[0]       # 말하기 채널 값을 듣기 채널로 이동
+        channels(grid)[0] = [0] * CALL_CHANNEL_SIZE
+
+    emit, heard, swap = AudioChannels.emit, AudioChannels.heard, AudioChannels.swap
+    process_creatures = engine.Grid.process_creatures
+
+    def checked_emit(self, grid, call):
+        channels(grid)[0][call] += 1
+        emit(self, grid, call)
+
+    def checked_heard(self, grid):
+        result = heard(self, grid)
+        assert result.tolist() == channels(grid)[1]
+        reads['total'] += 1
+        reads['loud'] += bool(result.any())
+        return result
+
+    def checked_process(grid, world):
+        process_creatures(grid, world)
+        turn(grid)
+        processed.add(grid)
+
+    def checked_swap(self):
+        # 기존 코드는 모든 그리드를 매 턴 교체했으므로 처리되지 않은 그리드도 교체
+        for grid in set(crying_sound) - processed:
+            turn(grid)
+        processed.clear()
+        swap(self)
+
+    monkeypatch.setattr(AudioChannels, 'emit', checked_emit)
+    monkeypatch.setattr(AudioChannels, 'heard', checked_heard)
+    monkeypatch.setattr(AudioChannels, 'swap', checked_swap)
+    monkeypatch.setattr(engine.Grid, 'process_creatures', checked_process)
+
+    run_dir()
+    world = World(seed=1)
+    for _ in range(30):
+        world.Trun()
+    world.logs.close()
+
+    assert reads['loud'] > 0 and reads['total'] > reads['loud']
+    assert not AudioChannels.SILENCE.any()
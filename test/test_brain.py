@@ -0,0 +1,116 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.entities.brain import BrainEngine, brain_calculation
+
+
+def random_brain(rng: np.random.Generator, cycles: int, threshold: bool = True) -> SimpleNamespace:
+    """무작위 시냅스를 가진 생물 대용 객체 (BrainEngine 이 쓰는 속성만 가짐)"""
+    n_nodes = int(rng.integers(3, 12))
+    n_synapses = int(rng.integers(1, 30))
+    synapses = np.column_stack([
+        rng.integers(0, n_nodes, n_synapses),
+        rng.uniform(-2, 2, n_synapses),
+        rng.integers(0, n_nodes, n_synapses),
+        rng.integers(0, 2, n_synapses) if threshold else np.zeros(n_synapses),
+    ]).astype(np.float64)
+    nodes = np.zeros((n_nodes, 3))
+    nodes[:, 1] = rng.uniform(0, 1, n_nodes)
+    nodes[:, 2] = rng.uniform(-1, 1, n_nodes)
+    inputs = {int(k): float(rng.uniform(-1, 1)) for k in rng.choice(n_nodes, int(rng.integers(0, 3)), replace=False)}
+    return SimpleNamespace(
+        traits=SimpleNamespace(brain_compute_cycles=cycles),
+        brain_nodes=nodes,
+        brain_synapses=synapses,
+        inputs=inputs,
+    )
+
+
+def reference(creature: SimpleNamespace) -> np.ndarray:
+    """생물별로 매 사이클 입력을 덮어쓰고 brain_calculation 을 반복하던 방식"""
+    nodes = creature.brain_nodes.copy()
+    for _ in range(creature.traits.brain_compute_cycles):
+        for k, v in creature.inputs.items():
+            nodes[k][0] = v
+        nodes = brain_calculation(nodes, creature.brain_synapses.tolist())
+    return nodes
+
+
+def test_batched_engine_matches_brain_calculation():
+    rng = np.random.default_rng(3)
+    creatures = [random_brain(rng, int(cycles)) for cycles in rng.integers(0, 8, 40)]
+    expected = [reference(c) for c in creatures]
+
+    BrainEngine(tolerance=None).run(creatures, [c.inputs for c in creatures])
+
+    for creature, nodes in zip(creatures, expected):
+        np.testing.assert_allclose(creature.brain_nodes, nodes, rtol=1e-12, atol=1e-12)
+
+
+def test_engine_reuses_buffers_across_runs():
+    rng = np.random.default_rng(5)
+    engine = BrainEngine(tolerance=None)
+    for _ in range(3):
+        creatures = [random_brain(rng, int(cycles)) for cycles in rng.integers(1, 6, 15)]
+        expected = [reference(c) for c in creatures]
+        engine.run(creatures, [c.inputs for c in creatures])
+        for creature, nodes in zip(creatures, expected):
+            np.testing.assert_allclose(creature.brain_nodes, nodes, rtol=1e-12, atol=1e-12)
+
+
+def test_tolerance_mode_matches_exact_mode_without_threshold_synapses():
+    rng = np.random.default_rng(7)
+    creatures = [random_brain(rng, int(cycles), threshold=False) for cycles in rng.integers(20, 60, 40)]
+    exact = [SimpleNamespace(**vars(c)) for c in creatures]
+
+    BrainEngine(tolerance=None).run(exact, [c.inputs for c in exact])
+    engine = BrainEngine(tolerance=1e-10)
+    skipped = engine.run(creatures, [c.inputs for c in creatures])
+
+    assert skipped > 0
+    for creature, reference_creature in zip(creatures, exact):
+        np.testing.assert_allclose(creature.brain_nodes, reference_creature.brain_nodes, atol=1e-6)
+
+
+def test_tolerance_mode_never_skips_threshold_networks():
+    rng = np.random.default_rng(11)
+    creatures = [random_brain(rng, 40) for _ in range(30)]
+    creatures = [c for c in creatures if c.brain_synapses[:, 3].any()]
+    expected = [reference(c) for c in creatures]
+
+    skipped = BrainEngine(tolerance=1e-3).run(creatures, [c.inputs for c in creatures])
+
+    assert skipped == 0
+    for creature, nodes in zip(creatures, expected):
+        np.testing.assert_allclose(creature.brain_nodes, nodes, rtol=1e-12, atol=1e-12)
+
+
+def test_default_tolerance_skips_cycles_close_to_exact():
+    rng = np.random.default_rng(13)
+    creatures = [random_brain(rng, int(cycles), threshold=False) for cycles in rng.integers(20, 60, 40)]
+    exact = [SimpleNamespace(**vars(c)) for c in creatures]
+
+    BrainEngine(tolerance=None).run(exact, [c.inputs for c in exact])
+    engine = BrainEngine()
+    assert engine.tolerance is not None     # 기본 설정에서 실제로 고정점 조기 종료가 동작하는지
+    skipped = engine.run(creatures, [c.inputs for c in creatures])
+
+    assert skipped > 0
+    for creature, reference_creature in zip(creatures, exact):
+        np.testing.assert_allclose(creature.brain_nodes, reference_creature.brain_nodes, atol=1e-4)
+
+
+def test_tolerance_results_do_not_depend_on_batch():
+    """고정점에 도달한 생물의 결과는 함께 계산된 생물(다시 패킹하는 시점)과 관계없이 같다"""
+    rng = np.random.default_rng(17)
+    creatures = [random_brain(rng, int(cycles), threshold=bool(i % 3 == 0))
+                 for i, cycles in enumerate(rng.integers(1, 60, 60))]
+    alone = [SimpleNamespace(**vars(c)) for c in creatures]
+
+    skipped_alone = sum(BrainEngine(tolerance=1e-6).run([c], [c.inputs]) for c in alone)
+    skipped = BrainEngine(tolerance=1e-6).run(creatures, [c.inputs for c in creatures])
+
+    assert skipped == skipped_alone > 0
+    for creature, single in zip(creatures, alone):
+        np.testing.assert_array_equal(creature.brain_nodes, single.brain_nodes)
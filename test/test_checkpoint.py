@@ -0,0 +1,44 @@
+from src.core.engine import World
+from src.data.checkpoint import read_checkpoint
+
+
+def test_save_load_round_trip(run_dir, snapshot):
+    """체크포인트에서 되살린 월드가 저장하지 않고 계속 진행한 월드와 매 턴 같은 상태가 된다"""
+    path = run_dir("saved")
+    world = World(seed=11)
+    for _ in range(100):
+        world.Trun()
+    world.save_checkpoint(str(path / "checkpoint.zst"))
+    saved = snapshot(world)
+    continued = []
+    for _ in range(50):
+        world.Trun()
+        continued.append(snapshot(world))
+    world.logs.close()
+
+    state = read_checkpoint(str(path / "checkpoint.zst"))
+    assert len(state['attention_targets']['genomes'])     # 죽은 개체를 주의 대상으로 둔 생물까지 저장되는지
+
+    loaded = World.load_checkpoint(str(path / "checkpoint.zst"))
+    assert snapshot(loaded) == saved
+    for turn, expected in enumerate(continued):
+        loaded.Trun()
+        assert snapshot(loaded) == expected, f"turn {turn}"
+    loaded.logs.close()
+
+
+def test_import_shares_identical_genomes(run_dir):
+    """내용이 같은 유전자는 되살릴 때 한 번만 해석해 Genome/Traits 를 공유한다"""
+    run_dir()
+    world = World(seed=11)
+    creatures = list(world.creatures_by_id().values())[:3]
+    payload = world.export_creatures(creatures)
+    payload['genomes'][1] = payload['genomes'][0]
+    world.logs.close()
+
+    target = World(seed=11, populate=False)
+    first, clone, other = target.import_creatures(payload)
+    assert clone.genome is first.genome and clone.traits is first.traits
+    assert other.genome is not first.genome
+    assert [creature.id for creature in (first, clone, other)] == [creature.id for creature in creatures]
+    target.logs.close()
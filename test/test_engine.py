@@ -0,0 +1,45 @@
+from src.core.engine import World
+from src.utils.constants import CREATURES_SIZE
+
+
+class FullSweepWorld(World):
+    """활성 그리드 대신 모든 그리드를 (y, x) 순서로 처리하던 방식"""
+
+    def active_sweep(self):
+        for row in self.world:
+            yield from row
+
+
+def run(world_class, turns: int, seed: int):
+    world = world_class(seed=seed)
+    for _ in range(turns):
+        world.Trun()
+    world.logs.close()
+    return world
+
+
+def test_active_sweep_matches_full_sweep(run_dir, snapshot):
+    run_dir("full")
+    full = run(FullSweepWorld, 90, seed=1)
+    run_dir("active")
+    active = run(World, 90, seed=1)
+
+    assert snapshot(active) == snapshot(full)
+    assert active.ids.issued > CREATURES_SIZE       # 번식으로 태어난 생물까지 포함되는지
+
+
+def test_turn_log_reads_only_active_grids(run_dir):
+    """활성 그리드만 훑어 모은 턴 기록이 전체 그리드를 훑은 기록과 같다"""
+    run_dir()
+    world = World(seed=1)
+    sounds = corpses = 0
+    for _ in range(90):
+        world.Trun()
+        active, full = world.logs.collect_turn(world.active_grids), world.logs.collect_turn()
+        assert active.sounds == full.sounds and active.corpses == full.corpses
+        assert all((active.columns[name] == full.columns[name]).all() for name in full.columns)
+        sounds += len(full.sounds)
+        corpses += len(full.corpses)
+    world.logs.close()
+
+    assert sounds and corpses       # 울음소리와 사체가 실제로 기록되는지
@@ -0,0 +1,181 @@
+import numpy as np
+import pytest
+
+from src.entities.genome import Genome
+
+
+def parse_reference(genome_bytes: bytes) -> dict:
+    """바이트마다 속성 전환/누적을 적용하던 기존 해석기"""
+    attributes = {name: 0 if fmt == 0 else [] for _, name, fmt, *_ in Genome.GENE_DEFINITIONS}
+    current, data_format = Genome.attribute_name_list[0]
+    for byte in genome_bytes:
+        data = byte & 0b01111111
+        if byte >> 7:
+            current, data_format = Genome.attribute_name_list[data]
+            attr = attributes[current]
+            if data_format == 1 and (not attr or attr[-1] != 0):
+                attr.append(0)
+            elif data_format == 2:
+                attr.append([])
+            continue
+        attr = attributes[current]
+        if data_format == 0:
+            attributes[current] = attr + data
+        elif data_format == 1:
+            if attr:
+                attr[-1] += data
+            else:
+                attr.append(data)
+        else:
+            if not attr:
+                attr.append([])
+            attr[-1].append(data)
+    return attributes
+
+
+def as_lists(attributes: dict) -> dict:
+    """형식 2 의 하위 바이트열을 리스트로 바꿔 기존 해석기 결과와 비교할 수 있게 함"""
+    return {
+        name: [list(sub) for sub in attributes[name]] if fmt == 2 else attributes[name]
+        for _, name, fmt, *_ in Genome.GENE_DEFINITIONS
+    }
+
+
+def sample_genomes() -> list[bytes]:
+    rng = np.random.default_rng(1)
+    genomes = [rng.integers(0, 256, int(n), dtype=np.uint8).tobytes() for n in rng.integers(1, 4000, 60)]
+    genomes += [
+        b'',
+        b'\x05',
+        b'\x85',
+        bytes(range(256)),
+        bytes([0x80 | 95] * 10),            # 명령만 있는 유전자
+        bytes([3] * 50),                    # 데이터만 있는 유전자
+        bytes([0x80 | 100, 0, 0, 5, 0x80 | 100, 0x80 | 100, 7]),   # 형식 1 의 0 항목 처리
+    ]
+    return genomes
+
+
+def test_parse_batch_matches_single_parse():
+    genomes = sample_genomes()
+    for batch, single in zip(Genome.parse_batch(genomes), [Genome(g) for g in genomes], strict=True):
+        assert batch.genome_bytes == single.genome_bytes
+        assert batch.attributes == single.attributes
+        assert batch.traits == single.traits
+
+
+def test_decode_matches_per_byte_parser():
+    genomes = sample_genomes()
+    for genome, attributes in zip(genomes, Genome.decode_attributes(genomes), strict=True):
+        assert as_lists(attributes) == parse_reference(genome)
+
+
+@pytest.mark.parametrize("batch_bytes", [1, 1000, 5000])
+def test_decode_is_independent_of_batch_size(monkeypatch, batch_bytes):
+    genomes = sample_genomes()
+    expected = Genome.decode_attributes(genomes)
+    monkeypatch.setattr(Genome, 'DECODE_BATCH_BYTES', batch_bytes)
+    assert Genome.decode_attributes(genomes) == expected
+
+
+class ScriptedRng:
+    """돌연변이 종류를 미리 정해 주는 난수 생성기. types 의 -1 은 돌연변이 없음,
+    무작위 바이트는 모두 RANDOM_BYTE, 비트 위치는 실제 생성기에서 뽑는다."""
+    RANDOM_BYTE = 0xAA
+
+    def __init__(self, types):
+        self.types = np.asarray(types)
+        self.rng = np.random.default_rng(0)
+
+    def random(self, shape):
+        return np.where(self.types >= 0, 0.0, 1.0)
+
+    def integers(self, low, high, size, dtype=np.int64):
+        if high == 4:
+            return np.maximum(self.types, 0)
+        if high == 256:
+            return np.full(size, self.RANDOM_BYTE, dtype=dtype)
+        return self.rng.integers(low, high, size, dtype=dtype)
+
+
+def test_fully_deleted_row_keeps_one_byte():
+    sequences = np.array([[1, 2, 3, 4], [5, 6, 7, 8]], dtype=np.uint8)
+    delete = Genome.MUTATION_DELETE_BYTE
+    rng = ScriptedRng([[delete] * 4, [delete, -1, delete, delete]])
+    assert Genome.mutate_batch(sequences, 0.5, rng) == [bytes([4]), bytes([6])]
+
+
+def test_insert_and_delete_placement():
+    """삽입은 원본 바이트 앞에 무작위 바이트를 두고(출력 2개), 삭제는 0개, 나머지는 1개"""
+    sequences = np.array([[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]], dtype=np.uint8)
+    insert, delete = Genome.MUTATION_INSERT_BYTE, Genome.MUTATION_DELETE_BYTE
+    rng = ScriptedRng([[-1, insert, delete, -1, insert], [delete, delete, -1, insert, -1]])
+    r = ScriptedRng.RANDOM_BYTE
+    children = Genome.mutate_batch(sequences, 0.5, rng)
+    assert children == [bytes([1, r, 2, 4, r, 5]), bytes([8, r, 9, 10])]
+    assert [len(child) for child in children] == [5 + 2 - 1, 5 + 1 - 2]
+
+
+def test_flip_changes_exactly_one_bit():
+    sequences = np.random.default_rng(3).integers(0, 256, (20, 300), dtype=np.uint8)
+    rng = ScriptedRng(np.full(sequences.shape, Genome.MUTATION_FLIP_BIT))
+    children = np.frombuffer(b''.join(Genome.mutate_batch(sequences, 0.5, rng)), dtype=np.uint8)
+    changed = np.unpackbits((children ^ sequences.ravel())[:, None], axis=1).sum(axis=1)
+    assert (changed == 1).all()
+
+
+def test_zero_rate_returns_parent():
+    genome = Genome(np.random.default_rng(4).integers(0, 256, 500, dtype=np.uint8).tobytes())
+    assert genome.mutated_copies(0, 5, np.random.default_rng(1)) == [genome.genome_bytes] * 5
+    assert genome.apply_mutation(list(genome.genome_bytes), 0) == genome.genome_bytes
+
+
+def test_mutated_copies_are_deterministic_for_a_generator():
+    genome = Genome(np.random.default_rng(5).integers(0, 256, 2000, dtype=np.uint8).tobytes())
+    first = genome.mutated_copies(0.01, 6, np.random.default_rng(9))
+    assert first == genome.mutated_copies(0.01, 6, np.random.default_rng(9))
+    assert first != genome.mutated_copies(0.01, 6, np.random.default_rng(10))
+    assert len(set(first)) == 6                                 # 사본마다 독립적인 돌연변이
+    assert all(child != genome.genome_bytes for child in first)
+
+
+def crossover_cuts(child: bytes, min_len: int) -> list[int]:
+    """부모1 = 0, 부모2 = 1 로 채운 교차 결과에서 출처가 바뀌는 지점(절단 지점) 목록"""
+    head = np.frombuffer(child[:min_len], dtype=np.uint8)
+    assert head[0] == 0                         # 첫 구간은 항상 부모1
+    return (np.flatnonzero(np.diff(head)) + 1).tolist()
+
+
+@pytest.mark.parametrize("num_cuts", [1, 3, 7])
+def test_crossover_cut_count_and_range(num_cuts):
+    parent1 = Genome(bytes([0]) * 40 + bytes([2]) * 10)     # 부모1 이 더 길면 꼬리가 그대로 이어짐
+    parent2 = bytes([1]) * 40
+    children = parent1.crossover_batch(parent2, 0, num_cuts, 200, np.random.default_rng(num_cuts))
+    cut_sets = set()
+    for child in children:
+        assert child[40:] == bytes([2]) * 10
+        cuts = crossover_cuts(child, 40)
+        assert len(cuts) == num_cuts
+        assert all(1 <= cut < 40 for cut in cuts)
+        cut_sets.add(tuple(cuts))
+    assert len(cut_sets) > 30                               # 자식마다 따로 뽑힌 절단 지점
+
+
+def test_crossover_keeps_parent1_length():
+    parent1 = Genome(bytes([0]) * 30)
+    children = parent1.crossover_batch(bytes([1]) * 80, 0, 3, 20, np.random.default_rng(1))
+    assert all(len(child) == 30 and len(crossover_cuts(child, 30)) == 3 for child in children)
+
+
+def test_crossover_clamps_cut_count_to_common_length():
+    """절단 수가 공통 길이 이상이면 min_len - 1 개(모든 지점)에서 자름"""
+    parent1 = Genome(bytes([0]) * 6)
+    for num_cuts in (6, 20):
+        for child in parent1.crossover_batch(bytes([1]) * 9, 0, num_cuts, 10, np.random.default_rng(2)):
+            assert child == bytes([0, 1, 0, 1, 0, 1])
+
+
+@pytest.mark.parametrize("parent1, parent2", [(b'\x05', b'\x07\x08\x09'), (b'\x05\x06\x07', b'\x09'), (b'\x05', b'')])
+def test_crossover_of_short_parents_copies_parent1(parent1, parent2):
+    children = Genome(parent1).crossover_batch(parent2, 0, 3, 4, np.random.default_rng(3))
+    assert children == [parent1] * 4
@@ -0,0 +1,84 @@
+import numpy as np
+
+from src.data.genome_store import GenomeStore, GenomeStoreReader
+
+
+def random_genomes(count: int, seed: int = 0) -> list[bytes]:
+    rng = np.random.default_rng(seed)
+    return [rng.integers(0, 256, int(rng.integers(1, 500)), dtype=np.uint8).tobytes() for _ in range(count)]
+
+
+def test_reader_sees_appended_genomes(tmp_path):
+    store = GenomeStore(str(tmp_path))
+    reader = GenomeStoreReader(str(tmp_path))
+    genomes = random_genomes(30)
+
+    store.append(list(range(10)), genomes[:10])
+    reader.refresh()
+    assert len(reader) == 10
+    assert [bytes(reader.get(i)) for i in range(10)] == genomes[:10]
+    assert reader.get(10) is None and reader.get(-1) is None
+
+    # 같은 읽기 도구를 다시 만들지 않고 refresh 만으로 새로 기록된 ID 를 읽음
+    index = reader.index
+    store.append(list(range(10, 30)), genomes[10:])
+    assert reader.get(20) is None
+    reader.refresh()
+    assert reader.index is not index
+    assert [bytes(reader.get(i)) for i in range(30)] == genomes
+    assert reader.ids().tolist() == list(range(30))
+
+    # 파일이 바뀌지 않았으면 다시 매핑하지 않음
+    index = reader.index
+    reader.refresh()
+    assert reader.index is index
+
+
+def test_reader_skips_unstored_ids_and_remaps_after_reset(tmp_path):
+    store = GenomeStore(str(tmp_path))
+    reader = GenomeStoreReader(str(tmp_path))
+    genomes = random_genomes(4, seed=1)
+
+    # 병렬 실행처럼 ID 사이에 빈 자리가 있는 경우
+    store.append([7, 2, 9], genomes[:3])
+    reader.refresh()
+    assert reader.ids().tolist() == [2, 7, 9]
+    assert bytes(reader.get(7)) == genomes[0] and bytes(reader.get(2)) == genomes[1]
+    assert reader.get(3) is None and reader.get(8) is None
+
+    # 시뮬레이션을 새로 시작해 파일이 줄어들면 잘린 영역을 읽지 않음
+    store = GenomeStore(str(tmp_path))
+    store.append([0], genomes[3:])
+    reader.refresh()
+    assert len(reader) == 1
+    assert bytes(reader.get(0)) == genomes[3]
+    assert reader.get(7) is None
+
+
+def test_identical_genomes_are_stored_once(tmp_path):
+    store = GenomeStore(str(tmp_path))
+    first, second = random_genomes(2, seed=2)
+
+    store.append([0, 1, 2], [first, second, first])
+    store.append([3], [first])       # 이후 청크의 복제도 원본에 다시 쓰지 않음
+    blob = (tmp_path / "genomes.bin").read_bytes()
+    assert blob == first + second
+
+    reader = GenomeStoreReader(str(tmp_path))
+    reader.refresh()
+    assert [bytes(reader.get(i)) for i in range(4)] == [first, second, first, first]
+    assert reader.index['offset'][3] == reader.index['offset'][0]
+
+
+def test_reload_keeps_deduplicating_after_resume(tmp_path):
+    """체크포인트에서 이어갈 때처럼 기존 파일을 열어도 해시 표로 중복을 찾음"""
+    first, second = random_genomes(2, seed=3)
+    GenomeStore(str(tmp_path)).append([0, 1], [first, second])
+
+    store = GenomeStore(str(tmp_path), reset=False)
+    store.append([2], [second])
+    assert (tmp_path / "genomes.bin").read_bytes() == first + second
+
+    reader = GenomeStoreReader(str(tmp_path))
+    reader.refresh()
+    assert bytes(reader.get(2)) == second
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from src.core.engine import World
+from src.simulation.parallel import ParallelWorld
+from src.utils.constants import CREATURES_SIZE
+
+COMPARED_COLUMNS = ('x', 'y', 'energy', 'health', 'grid_x', 'grid_y', 'birth_turn', 'move_speed',
+                    'move_dir_x', 'move_dir_y', 'attack_intent', 'reproduce_intent', 'eat_intent')
+
+
+def lineage_state(worlds: list[World]) -> dict:
+    """계보 키 → 생물 상태. ID 는 작업자 수에 따라 달라지므로 비교에서 뺀다."""
+    state = {}
+    for world in worlds:
+        store = world.store
+        for row in store.owned_rows().tolist():
+            creature = store.creatures[row]
+            state[int(store.lineage[row])] = (
+                tuple(getattr(store, name)[row].item() for name in COMPARED_COLUMNS),
+                creature.brain_nodes.tolist(),
+                creature.genome.genome_bytes,
+                creature.attention_creature.lineage,
+            )
+    return state
+
+
+def run_single(seed: int, turns: int) -> World:
+    world = World(seed=seed)
+    for _ in range(turns):
+        world.Trun()
+    world.logs.close()
+    return world
+
+
+def run_parallel(workers: int, seed: int, turns: int) -> ParallelWorld:
+    world = ParallelWorld(workers, seed, processes=False)
+    for _ in range(turns):
+        world.Trun()
+    world.close()
+    return world
+
+
+@pytest.mark.parametrize("workers", [2, 4])
+def test_worker_count_does_not_change_the_run(run_dir, workers):
+    run_dir("single")
+    single = run_single(seed=11, turns=100)
+    run_dir("parallel")
+    parallel = run_parallel(workers, seed=11, turns=100)
+
+    assert single.ids.issued > CREATURES_SIZE       # 번식으로 태어난 생물까지 비교되는지
+    assert lineage_state([node.world for node in parallel.nodes]) == lineage_state([single])
+    assert parallel.population() == single.population()
+
+
+def test_border_creatures_see_same_turn_ghosts(run_dir):
+    """경계 너머 개체를 보는 생물이 단일 프로세스와 같은 턴에 같은 상태를 본다 (seed 1 은 2턴째부터 경계 띠에서 상호작용)"""
+    turns = 30
+    run_dir("single")
+    world = World(seed=1)
+    single = []
+    for _ in range(turns):
+        world.Trun()
+        single.append(lineage_state([world]))
+    world.logs.close()
+
+    run_dir("parallel")
+    parallel = ParallelWorld(2, seed=1, processes=False)
+    watching_ghosts = 0
+    for turn in range(turns):
+        parallel.Trun()
+        worlds = [node.world for node in parallel.nodes]
+        for node in parallel.nodes:
+            store = node.world.store
+            watching_ghosts += sum(
+                store.creatures[row].attention_creature.id in node.ghosts for row in store.owned_rows().tolist()
+            )
+        assert lineage_state(worlds) == single[turn], f"turn {turn}"
+    parallel.close()
+
+    assert watching_ghosts > 0      # 경계 너머 개체를 주의 대상으로 삼은 경우가 실제로 있었는지
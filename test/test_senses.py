@@ -0,0 +1,95 @@
+from dataclasses import replace
+
+import numpy as np
+
+import src.core.engine as engine
+from src.core.engine import World
+from src.entities.organism import Creature
+from src.entities.senses import nearest_visible, sense_vision_batch
+from src.simulation.parallel import ParallelWorld
+from src.utils.constants import GRID_HIGHT_SCALE, GRID_WIDTH_SCALE
+from src.utils.datatypes import Vector2
+from src.utils.math_utils import get_grid_coords
+
+
+def assert_same_vision(world: World, creatures: list[Creature], batch) -> int:
+    """일괄 계산 결과가 개체별 nearest_visible 과 같은지 확인하고, 순서가 계보 키로 갈린 동률 쌍의 수를 반환"""
+    ties = 0
+    for i, creature in enumerate(creatures):
+        dxs, dys, sizes, seen = batch.detections(i, world.store)
+        expected = nearest_visible(creature, creature.traits.visible_entities, creature.traits.auditory_range)
+        assert (dxs.tolist(), dys.tolist(), sizes.tolist(), seen) == expected, f"creature {creature.id}"
+        ties += sum(
+            (a.position.x, a.position.y) == (b.position.x, b.position.y) and a.lineage < b.lineage
+            for a, b in zip(seen, seen[1:])
+        )
+    return ties
+
+
+def test_batch_matches_nearest_visible_on_crowded_world(run_dir):
+    """격자점에 몰려 있어 거리 동률(같은 위치 포함)이 많은 월드에서, 개체마다 다른 k 와 반경 0~4 로
+    그리드 경계와 월드 가장자리 근처의 개체까지 일괄 계산과 개별 계산이 같은 개체를 같은 순서로 본다"""
+    run_dir()
+    world = World(seed=6, populate=False)
+    rng = np.random.default_rng(6)
+    genomes = [rng.integers(0, 256, 3000, dtype=np.uint8).tobytes() for _ in range(8)]
+
+    step = 500      # 격자 간격: 대칭 위치의 같은 거리와 같은 위치의 중복 개체가 생김
+    centers = [
+        (GRID_WIDTH_SCALE * 10, GRID_HIGHT_SCALE * 10),     # 네 그리드가 만나는 점
+        (step, step),                                       # 월드 모서리
+        (GRID_WIDTH_SCALE * 3 + step, step),                # 월드 위쪽 가장자리의 그리드 경계
+    ]
+    creatures = []
+    for lineage in range(900):
+        cx, cy = centers[lineage % len(centers)]
+        x = max(0, cx + step * int(rng.integers(-12, 13)))
+        y = max(0, cy + step * int(rng.integers(-12, 13)))
+        position = Vector2(x, y)
+        gridPos = get_grid_coords(position)
+        grid = world.world[gridPos.y][gridPos.x]
+        creature = Creature(position, genomes[lineage % len(genomes)], world, grid, 0, lineage)
+        creature.traits = replace(creature.traits,
+                                  auditory_range=lineage % 5, visible_entities=1 + (lineage * 7) % 13)
+        world.place(creature, grid)
+        creatures.append(creature)
+    world.logs.close()
+
+    rng.shuffle(creatures)      # 입력 순서가 결과에 영향을 주지 않아야 함
+    batch = sense_vision_batch(world, creatures)
+    ties = assert_same_vision(world, creatures, batch)
+
+    assert ties > 0                                     # 같은 위치의 개체 순서가 실제로 계보 키로 갈렸는지
+    full = [c for i, c in enumerate(creatures) if batch.counts[i] == c.traits.visible_entities]
+    assert {c.traits.auditory_range for c in full} == {1, 2, 3, 4}
+    assert len({c.traits.visible_entities for c in full}) > 5
+
+
+def test_batch_matches_nearest_visible_in_runs(run_dir, monkeypatch):
+    """실제 진행 중 매 턴의 일괄 계산이 개별 계산과 같다. 병렬 실행에서는 도메인 경계의 ghost 를 보는 개체까지 확인한다"""
+    checked = {'creatures': 0, 'ghost_sightings': 0}
+
+    def checked_batch(world, creatures):
+        batch = sense_vision_batch(world, creatures)
+        assert_same_vision(world, creatures, batch)
+        checked['creatures'] += len(creatures)
+        seen = batch.detected_rows[batch.detected_rows >= 0]
+        checked['ghost_sightings'] += int(np.count_nonzero(world.store.ghost[seen]))
+        return batch
+
+    monkeypatch.setattr(engine, 'sense_vision_batch', checked_batch)
+
+    run_dir("single")
+    world = World(seed=1)
+    for _ in range(5):
+        world.Trun()
+    world.logs.close()
+
+    run_dir("parallel")
+    parallel = ParallelWorld(2, seed=1, processes=False)
+    for _ in range(5):
+        parallel.Trun()
+    parallel.close()
+
+    assert checked['creatures'] > 0
+    assert checked['ghost_sightings'] > 0
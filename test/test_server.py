@@ -0,0 +1,184 @@
+import gzip
+import json
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+
+import src.server.app as server
+from src.data.genome_store import GenomeStore, GenomeStoreReader
+from src.data.logger import WorldLog
+from src.data.turn_codec import decode_chunk, to_nested
+from src.data.turn_index import FrameCache, TurnLogReader
+from src.entities.genome import Genome
+from src.utils.trait_computer import compute_biological_traits
+from test_turn_log import HEIGHT, WIDTH, expected_nested, random_records
+
+TURNS = 45
+
+
+@pytest.fixture
+def logs(tmp_path, monkeypatch):
+    """임의의 턴 기록을 써 둔 로그 디렉터리를 서버가 읽도록 연결 (캐시는 테스트마다 새로)"""
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    records = random_records(TURNS, seed=2)
+    world_log = WorldLog(None, None, log_dir=str(log_dir), shape=(HEIGHT, WIDTH), flush_interval=20, keyframe_interval=5)
+    for record in records:
+        world_log.write_turn(record)
+    world_log.close()
+
+    frame_cache = FrameCache()
+    monkeypatch.setattr(server, 'LOGS_DIR', log_dir)
+    monkeypatch.setattr(server, 'LOGS_COMPRESSED_DIR', log_dir / "compressed")
+    monkeypatch.setattr(server, 'CREATURE_ATLAS_DIR', log_dir / "creature_atlas")
+    monkeypatch.setattr(server, 'frame_cache', frame_cache)
+    monkeypatch.setattr(server, 'turn_reader', TurnLogReader(str(log_dir / "compressed"), cache=frame_cache))
+    monkeypatch.setattr(server, 'response_cache', FrameCache())
+    monkeypatch.setattr(server, 'trait_cache', FrameCache())
+    monkeypatch.setattr(server, 'genome_store', GenomeStoreReader(str(log_dir)))
+    return log_dir, records
+
+
+@pytest.fixture
+def client(logs):
+    return server.app.test_client()
+
+
+def test_turn_endpoints(client, logs):
+    _, records = logs
+
+    response = client.get('/turns/7')
+    assert response.status_code == 200
+    assert response.get_json() == json.loads(json.dumps(expected_nested(7, records[7])))
+
+    response = client.get('/turns?from=18&to=23')
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        json.loads(json.dumps(expected_nested(turn, records[turn]))) for turn in range(18, 24)
+    ]
+
+    assert client.get(f'/turns/{TURNS}').status_code == 404
+    assert client.get('/turns?from=5&to=4').status_code == 400
+
+
+def test_turn_frames_are_cached(client):
+    client.get('/turns/11')
+    misses = client.get('/turns/cache').get_json()['misses']
+    assert client.get('/turns/12').status_code == 200      # 같은 키프레임 묶음이라 다시 해제하지 않음
+    stats = client.get('/turns/cache').get_json()
+    assert stats['misses'] == misses and stats['hits'] > 0
+
+
+def test_conditional_requests(client, logs):
+    log_dir, records = logs
+    np.save(log_dir / "terrain_altitude.npy", np.arange(12, dtype=np.float64).reshape(3, 4))
+
+    response = client.get('/logs/terrain')
+    assert response.status_code == 200 and response.get_json() == {'altitude': np.arange(12.0).reshape(3, 4).tolist()}
+    assert client.get('/logs/terrain', headers={'If-None-Match': response.headers['ETag']}).status_code == 304
+
+    # 청크 이름은 턴 범위만 나타내므로 다 기록된 청크도 매번 조건부 요청으로 확인하게 함
+    response = client.get('/logs/compressed/turn_logs_00000020.zst')
+    assert response.status_code == 200
+    assert response.cache_control.no_cache and response.cache_control.max_age is None
+    lines = response.get_data(as_text=True).splitlines()
+    assert [json.loads(line) for line in lines] == [
+        json.loads(json.dumps(expected_nested(turn, records[turn]))) for turn in range(20)
+    ]
+    response = client.get('/logs/compressed/turn_logs_00000020.zst',
+                          headers={'If-None-Match': response.headers['ETag']})
+    assert response.status_code == 304 and not response.data
+
+    columnar = client.get('/logs/compressed/turn_logs_00000020.zst?format=columnar', headers={'Accept-Encoding': 'zstd'})
+    assert columnar.cache_control.no_cache and columnar.cache_control.max_age is None
+    assert client.get('/logs/compressed/turn_logs_00000020.zst?format=columnar',
+                      headers={'Accept-Encoding': 'zstd', 'If-None-Match': columnar.headers['ETag']}).status_code == 304
+
+    assert client.get('/logs/compressed/turn_logs_00000100.zst').status_code == 404
+    assert client.get('/logs/compressed/turn_logs_00000020.txt').status_code == 400
+
+
+def test_content_encoding(client, logs):
+    log_dir, _ = logs
+    path = log_dir / "compressed" / "turn_logs_00000040.zst"
+
+    # zstd 를 받는 클라이언트에는 디스크의 청크를 그대로 보냄
+    response = client.get('/logs/compressed/turn_logs_00000040.zst?format=columnar', headers={'Accept-Encoding': 'zstd'})
+    assert response.headers['Content-Encoding'] == 'zstd'
+    assert response.get_data() == path.read_bytes()
+
+    # 받지 않으면 해제한 본문, gzip 이면 gzip 으로 압축한 변환 결과
+    plain = client.get('/logs/compressed/turn_logs_00000040.zst?format=columnar', headers={'Accept-Encoding': 'identity'})
+    assert 'Content-Encoding' not in plain.headers
+    _, frames = decode_chunk(plain.get_data())
+    assert [frame['turn'] for frame in frames] == list(range(20, 40))
+
+    response = client.get('/logs/compressed/turn_logs_00000040.zst', headers={'Accept-Encoding': 'gzip'})
+    assert response.headers['Content-Encoding'] == 'gzip'
+    identity = client.get('/logs/compressed/turn_logs_00000040.zst', headers={'Accept-Encoding': 'identity'})
+    assert gzip.decompress(response.get_data()) == identity.get_data()
+
+
+@pytest.fixture
+def genomes(logs):
+    """ID 0~2 의 유전자를 기록 (1 은 0 의 복제)"""
+    log_dir, _ = logs
+    rng = np.random.default_rng(3)
+    first, other = rng.integers(0, 256, (2, 3000), dtype=np.uint8)
+    stored = [first.tobytes(), first.tobytes(), other.tobytes()]
+    GenomeStore(str(log_dir), reset=False).append([0, 1, 2], stored)
+    return stored
+
+
+def test_gene_endpoints(client, genomes):
+    expected = [
+        asdict(compute_biological_traits(Genome(genome).traits)) for genome in genomes
+    ]
+    response = client.get('/logs/2')
+    assert response.status_code == 200
+    assert response.get_json() == json.loads(json.dumps(server.convert_ndarray_and_set(expected[2])))
+
+    response = client.get('/genes?ids=0,1,2,7')
+    documents = response.get_json()
+    assert list(documents) == ['0', '1', '2', '7']
+    assert documents['0'] == documents['1'] == client.get('/logs/0').get_json()
+    assert documents['2'] == client.get('/logs/2').get_json()
+    assert documents['7'] is None
+    assert client.get('/genes/cache').get_json()['entries'] == 2       # 복제된 유전자는 형질을 한 번만 계산
+
+
+def test_gene_endpoint_errors(client, genomes):
+    assert client.get('/logs/7').status_code == 404
+    assert client.get('/logs/-1').status_code == 404
+    assert client.get('/genes?ids=-1').status_code == 400
+    assert client.get('/genes?ids=0,-5,2').status_code == 400
+    assert client.get('/genes?ids=0,x').status_code == 400
+    ids = ",".join(map(str, range(server.MAX_GENE_BATCH + 1)))
+    assert client.get(f'/genes?ids={ids}').status_code == 400
+
+
+def test_gene_endpoints_are_conditional(client, genomes):
+    for url in ('/logs/0', '/genes?ids=0,2,7'):
+        response = client.get(url)
+        assert response.status_code == 200
+        again = client.get(url, headers={'If-None-Match': response.headers['ETag']})
+        assert again.status_code == 304 and not again.data
+
+
+def test_rewritten_chunk_is_not_served_from_old_etag(client, logs):
+    """새 실행이 같은 이름의 청크를 다시 쓰면 예전 ETag 로는 304 가 아니라 새 내용을 받음"""
+    log_dir, _ = logs
+    old = client.get('/logs/compressed/turn_logs_00000020.zst')
+
+    records = random_records(20, seed=9)
+    world_log = WorldLog(None, None, log_dir=str(log_dir), shape=(HEIGHT, WIDTH), flush_interval=20, keyframe_interval=5)
+    for record in records:
+        world_log.write_turn(record)
+    world_log.close()
+
+    response = client.get('/logs/compressed/turn_logs_00000020.zst', headers={'If-None-Match': old.headers['ETag']})
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.get_data(as_text=True).splitlines()] == [
+        json.loads(json.dumps(expected_nested(turn, records[turn]))) for turn in range(20)
+    ]
@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from src.core.engine import World
+from src.entities.genome import Genome
+from src.entities.organism import Creature
+from src.entities.similarity import SimilarityIndex
+from src.utils.constants import SPECIES_SIMILARITY_LENGTH
+from src.utils.datatypes import Vector2
+from src.utils.math_utils import gene_similarity, get_grid_coords
+
+
+def make_creatures(count: int) -> list[SimpleNamespace]:
+    """앞부분을 공유하되 일부 바이트가 다른 유전자를 가진 생물 대용 객체"""
+    rng = np.random.default_rng(2)
+    base = rng.integers(0, 128, 300, dtype=np.uint8)
+    creatures = []
+    for _ in range(count):
+        genome = base.copy()
+        changed = rng.choice(len(genome), int(rng.integers(0, 40)), replace=False)
+        genome[changed] = rng.integers(0, 256, len(changed), dtype=np.uint8)
+        creatures.append(SimpleNamespace(genome=Genome(genome.tobytes())))
+    return creatures
+
+
+def reference(a: SimpleNamespace, b: SimpleNamespace) -> float:
+    return gene_similarity(
+        a.genome.genome_bytes.decode('utf-8', errors='ignore'),
+        b.genome.genome_bytes.decode('utf-8', errors='ignore'),
+        SPECIES_SIMILARITY_LENGTH,
+    )
+
+
+def test_cached_similarity_matches_uncached_call():
+    creatures = make_creatures(30)
+    cached = SimilarityIndex()
+    uncached = SimilarityIndex(cache_size=0)
+
+    for creature in creatures:
+        first = cached.similarities(creature, creatures)
+        assert first == uncached.similarities(creature, creatures)
+        assert first == [1.0 if other is creature else reference(creature, other) for other in creatures]
+    assert not uncached.cache
+
+    # 두 번째 호출은 모두 캐시에서 (순서를 바꿔 대칭 키도 확인)
+    size = len(cached.cache)
+    for creature in creatures:
+        assert cached.similarities(creature, creatures[::-1]) == uncached.similarities(creature, creatures[::-1])
+    assert len(cached.cache) == size
+
+
+def test_cache_is_keyed_by_genome_content():
+    a, b = make_creatures(2)
+    index = SimilarityIndex()
+    value = index.similarity(a, b)
+
+    # 같은 내용의 새 Genome 객체도 같은 캐시 항목을 사용
+    a_copy = SimpleNamespace(genome=Genome(bytes(a.genome.genome_bytes)))
+    b_copy = SimpleNamespace(genome=Genome(bytes(b.genome.genome_bytes)))
+    assert index.similarity(b_copy, a_copy) == value
+    assert len(index.cache) == 1
+
+
+def test_breed_partner_is_nearest_candidate_of_same_species(run_dir):
+    """짝짓기 상대는 크기 이내 가장 가까운 후보이며, 그 후보가 다른 종이면 더 먼 같은 종을 찾지 않는다"""
+    run_dir()
+    world = World(seed=11, populate=False)
+    rng = np.random.default_rng(4)
+    genome = next(g for g in (rng.integers(0, 256, 3000, dtype=np.uint8).tobytes() for _ in range(200))
+                  if Genome(g).traits.size >= 8)
+    other_species = rng.integers(0, 256, 3000, dtype=np.uint8).tobytes()
+
+    def spawn(x: int, genome_bytes: bytes, lineage: int) -> Creature:
+        position = Vector2(x, 200)
+        gridPos = get_grid_coords(position)
+        grid = world.world[gridPos.y][gridPos.x]
+        creature = Creature(position, genome_bytes, world, grid, 0, lineage)
+        world.place(creature, grid)
+        return creature
+
+    creature = spawn(200, genome, 0)
+    size = creature.traits.size
+    mate = spawn(200 + int(size * 0.75), genome, 1)
+    stranger = spawn(200 + int(size * 0.25), other_species, 2)
+    assert creature.get_species_similarity(mate) > 0.9 >= creature.get_species_similarity(stranger)
+
+    assert creature.breed_partner([mate, stranger]) is None
+    stranger.position = Vector2(200 - int(size) - 5, 200)
+    assert creature.breed_partner([mate, stranger]) is mate
+    mate.position = Vector2(200 + int(size) + 1, 200)
+    assert creature.breed_partner([mate, stranger]) is None
+
+    # 거리가 같으면 계보 키가 작은 쪽
+    mate.position = Vector2(200 + int(size * 0.5), 200)
+    twin = spawn(200 - int(size * 0.5), genome, 3)
+    assert creature.breed_partner([twin, mate]) is mate
+    world.logs.close()
@@ -0,0 +1,186 @@
+import numpy as np
+
+from src.core.engine import World
+from src.entities.organism import Creature
+from src.core.spatial import SpatialHash
+from src.utils.constants import CREATURES_SIZE, GRID_HIGHT_SCALE, GRID_WIDTH_SCALE
+from src.utils.datatypes import Vector2
+from src.utils.math_utils import get_grid_coords
+
+
+class Point:
+    """SpatialHash 가 쓰는 속성(_row, position)만 가진 생물 대용 객체"""
+
+    def __init__(self, row: int, store):
+        self._row = row
+        self.store = store
+
+    @property
+    def position(self) -> Vector2:
+        return Vector2(int(self.store.x[self._row]), int(self.store.y[self._row]))
+
+
+class PointStore:
+    def __init__(self, capacity: int):
+        self.x = np.zeros(capacity, dtype=np.int64)
+        self.y = np.zeros(capacity, dtype=np.int64)
+        self.lineage = np.arange(capacity, dtype=np.int64)
+
+
+def expected_cells(index: SpatialHash, creatures) -> dict:
+    cells = {}
+    for creature in creatures:
+        cells.setdefault(index._cell(creature.position.x, creature.position.y), set()).add(creature)
+    return cells
+
+
+def brute_radius(creatures, origin: Vector2, radius: float, exclude=None) -> set:
+    return {
+        c for c in creatures
+        if c is not exclude and (c.position.x - origin.x) ** 2 + (c.position.y - origin.y) ** 2 <= radius * radius
+    }
+
+
+def assert_queries_match(index: SpatialHash, creatures, rng, queries: int = 200):
+    """셀/그리드 경계 위와 근처의 원점, 여러 셀에 걸치는 반경으로 전수 거리 계산과 비교"""
+    creatures = list(creatures)
+    for _ in range(queries):
+        base = int(rng.integers(0, 6)) * (index.cell_size if rng.random() < 0.5 else GRID_WIDTH_SCALE)
+        origin = Vector2(base + int(rng.integers(-3, 4)), base + int(rng.integers(-3, 4)))
+        radius = float(rng.choice([0, 1, index.cell_size - 1, index.cell_size, 2.5 * index.cell_size, GRID_WIDTH_SCALE]))
+        exclude = creatures[int(rng.integers(len(creatures)))] if creatures and rng.random() < 0.5 else None
+
+        expected = brute_radius(creatures, origin, radius, exclude)
+        found = index.query_radius(origin, radius, exclude=exclude)
+        assert len(found) == len(set(found)) and set(found) == expected
+
+        nearest = index.nearest(origin, radius, exclude=exclude)
+        if not expected:
+            assert nearest is None
+        else:
+            dist = lambda c: (c.position.x - origin.x) ** 2 + (c.position.y - origin.y) ** 2
+            assert nearest in expected and dist(nearest) == min(map(dist, expected))
+
+
+def test_spatial_hash_tracks_spawn_death_and_move():
+    rng = np.random.default_rng(4)
+    store = PointStore(600)
+    index = SpatialHash(store, cell_size=1000)
+    live, free = set(), list(range(600))
+
+    def place(creature):
+        # 셀/그리드 경계 근처에 몰리게 배치
+        for axis in (store.x, store.y):
+            axis[creature._row] = max(0, int(rng.integers(0, 6)) * int(rng.choice([1000, GRID_WIDTH_SCALE]))
+                                      + int(rng.integers(-20, 21)))
+
+    for step in range(1500):
+        action = rng.random()
+        if action < 0.4 and free:                       # 탄생
+            creature = Point(free.pop(), store)
+            place(creature)
+            index.insert(creature)
+            live.add(creature)
+        elif action < 0.6 and live:                     # 죽음
+            creature = list(live)[int(rng.integers(len(live)))]
+            index.remove(creature)
+            live.discard(creature)
+            free.append(creature._row)
+        elif live:                                      # 이동 (셀이 바뀌지 않는 작은 이동 포함)
+            creature = list(live)[int(rng.integers(len(live)))]
+            if rng.random() < 0.5:
+                store.x[creature._row] += int(rng.integers(-2, 3))
+            else:
+                place(creature)
+            index.move(creature)
+
+        if step % 100 == 0:
+            assert index.cells == expected_cells(index, live)
+            assert all(index.cells.values())            # 빈 셀은 남지 않음
+            assert index.cell_of == {c: index._cell(c.position.x, c.position.y) for c in live}
+            assert_queries_match(index, live, rng, queries=20)
+
+    assert len(index) == len(live) > 0
+    assert_queries_match(index, live, rng)
+
+
+def test_spatial_hash_large_radius_scans_occupied_cells():
+    """경계 상자가 점유된 셀 수보다 많은 셀을 덮으면 점유된 셀만 훑는 경로를 탄다"""
+    rng = np.random.default_rng(5)
+    store = PointStore(300)
+    store.x[:] = rng.integers(0, 40000, 300)
+    store.y[:] = rng.integers(0, 40000, 300)
+    index = SpatialHash(store, cell_size=1000)
+    creatures = [Point(row, store) for row in range(300)]
+    for creature in creatures:
+        index.insert(creature)
+
+    for origin, radius in [(Vector2(20000, 20000), 15000.0), (Vector2(0, 0), 30000.0), (Vector2(3999, 4000), 1e6)]:
+        x0, y0 = index._cell(origin.x - radius, origin.y - radius)
+        x1, y1 = index._cell(origin.x + radius, origin.y + radius)
+        assert (x1 - x0 + 1) * (y1 - y0 + 1) > len(index.cells)
+        assert set(index.query_radius(origin, radius)) == brute_radius(creatures, origin, radius)
+        nearest = index.nearest(origin, radius, exclude=creatures[0])
+        dist = lambda c: (c.position.x - origin.x) ** 2 + (c.position.y - origin.y) ** 2
+        assert dist(nearest) == min(dist(c) for c in creatures[1:])
+
+
+def test_world_spatial_hash_matches_live_creatures(run_dir):
+    """실제 진행 중 탄생/죽음/이동 후에도 셀 내용이 살아있는 생물의 위치와 일치한다"""
+    run_dir()
+    world = World(seed=5)          # seed 5 는 52턴째에 첫 탄생
+    rng = np.random.default_rng(5)
+    for turn in range(60):
+        world.Trun()
+        store = world.store
+        live = [store.creatures[row] for row in store.live_rows().tolist()]
+        assert world.spatial.cells == expected_cells(world.spatial, live)
+        if turn % 10 == 9:
+            assert_queries_match(world.spatial, live, rng, queries=50)
+    world.logs.close()
+    assert world.ids.issued > CREATURES_SIZE and len(live) < world.ids.issued     # 탄생/죽음이 실제로 있었는지
+
+
+def test_vision_index_stays_current(run_dir):
+    """그리드 간 이동/탄생/죽음이 있는 진행 중 매 턴 그리드별 개수와 주변 생물 질의가 그리드의 실제 생물과 일치한다.
+    매 턴 그리드 경계 바로 옆에 생물을 더 태어나게 하고(경계를 넘는 이동이 잦도록) 몇 개체를 죽인다."""
+    run_dir()
+    world = World(seed=5)
+    vision = world.vision
+    rng = np.random.default_rng(5)
+    grid_of, grid_moves, births, deaths = {}, 0, 0, 0
+    for turn in range(40):
+        store = world.store
+        for lineage in range(3):
+            position = Vector2(GRID_WIDTH_SCALE * int(rng.integers(20, 30)) + int(rng.integers(-2, 3)),
+                               GRID_HIGHT_SCALE * int(rng.integers(20, 30)) + int(rng.integers(-2, 3)))
+            gridPos = get_grid_coords(position)
+            grid = world.world[gridPos.y][gridPos.x]
+            genome = rng.integers(0, 256, 3000, dtype=np.uint8).tobytes()
+            world.place(Creature(position, genome, world, grid, 1000, 10 ** 6 + turn * 3 + lineage), grid)
+        rows = store.live_rows()
+        for row in rng.choice(rows, 2, replace=False).tolist():
+            world.detach(store.creatures[row])
+        world.Trun()
+        live = [store.creatures[row] for row in store.live_rows().tolist()]
+        current = {creature: (creature.grid.pos.y, creature.grid.pos.x) for creature in live}
+        grid_moves += sum(grid_of[c] != pos for c, pos in current.items() if c in grid_of)
+        births += sum(c not in grid_of for c in current) if turn else 0
+        deaths += sum(c not in current for c in grid_of)
+        grid_of = current
+
+        assert (vision.counts == [[len(grid.creatures) for grid in row] for row in world.world]).all()
+        assert all(creature in creature.grid.creatures for creature in live)
+
+        for y, x in list(set(current.values()))[:10] + [(vision.y_min, vision.x_min), (vision.y_max - 1, vision.x_max - 1)]:
+            grid = world.world[y][x]
+            for radius in (1, 2, 3, 4):
+                around = list(vision.creatures_around(grid, radius))
+                assert len(around) == len(set(around))
+                assert set(around) == {
+                    c for c, (cy, cx) in current.items()
+                    if abs(cy - y) <= radius and abs(cx - x) <= radius
+                    and vision.y_min <= cy < vision.y_max and vision.x_min <= cx < vision.x_max
+                }
+    world.logs.close()
+    assert grid_moves > 0 and births > 0 and deaths > 0
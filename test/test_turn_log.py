@@ -0,0 +1,151 @@
+import os
+
+import numpy as np
+
+from src.data.logger import TurnRecord, WorldLog
+from src.data.turn_codec import TurnEncoder, decode_chunk, to_nested
+from src.data.turn_index import INDEX_DTYPE, INDEX_FILENAME, TurnLogReader
+
+HEIGHT, WIDTH = 6, 7
+
+
+def random_records(turns: int, seed: int = 0) -> list[TurnRecord]:
+    """생물이 태어나고 죽고 움직이며 사체/울음소리가 생기는 임의의 턴 기록"""
+    rng = np.random.default_rng(seed)
+    creatures, next_id = {}, 0
+    records = []
+    for _ in range(turns):
+        for creature_id in list(creatures):
+            if rng.random() < 0.1:
+                del creatures[creature_id]
+        for _ in range(rng.integers(0, 4)):
+            creatures[next_id] = [int(rng.integers(0, WIDTH * 16)), int(rng.integers(0, HEIGHT * 16)),
+                                  int(rng.integers(1, 1000)), float(rng.random() * 1e6)]
+            next_id += 1
+        for state in creatures.values():
+            if rng.random() < 0.5:
+                state[0] = int(np.clip(state[0] + rng.integers(-3, 4), 0, WIDTH * 16 - 1))
+                state[1] = int(np.clip(state[1] + rng.integers(-3, 4), 0, HEIGHT * 16 - 1))
+            if rng.random() < 0.3:
+                state[2] += int(rng.integers(-5, 6))
+            state[3] -= float(rng.random())
+
+        ids = list(creatures)       # 삽입 순서: 로그 형식이 ID 순서에 의존하지 않는지 확인
+        rng.shuffle(ids)
+        rows = np.array([creatures[i] for i in ids], dtype=object).reshape(len(ids), 4)
+        xs, ys = rows[:, 0].astype(np.int64), rows[:, 1].astype(np.int64)
+        cells = [(int(rng.integers(0, HEIGHT)), int(rng.integers(0, WIDTH))) for _ in range(rng.integers(0, 4))]
+        records.append(TurnRecord(
+            columns={
+                'id'    : np.array(ids, dtype=np.int64),
+                'x'     : xs,
+                'y'     : ys,
+                'health': rows[:, 2].astype(np.int64),
+                'energy': rows[:, 3].astype(np.float64),
+                'grid_x': xs // 16,
+                'grid_y': ys // 16,
+            },
+            sounds={cell: sorted({int(rng.integers(0, 100)) for _ in range(2)}) for cell in cells[:2]},
+            corpses={cell: [[int(rng.integers(0, 100)), int(rng.integers(0, 100)), float(rng.random())]] for cell in cells[2:]},
+        ))
+    return records
+
+
+def expected_nested(turn: int, record: TurnRecord) -> list:
+    """TurnRecord 를 to_nested 형식으로 직접 변환 (그리드 안의 생물은 ID 순, 울음소리는 번호 순)"""
+    grids = [[[sorted(record.sounds.get((y, x), [])), [], list(record.corpses.get((y, x), []))]
+              for x in range(WIDTH)] for y in range(HEIGHT)]
+    columns = record.columns
+    for i in np.argsort(columns['id'], kind='stable'):
+        grids[columns['grid_y'][i]][columns['grid_x'][i]][1].append(
+            tuple(columns[name][i].item() for name in ('id', 'x', 'y', 'health', 'energy'))
+        )
+    return [turn, grids]
+
+
+def test_codec_round_trip():
+    records = random_records(20)
+    encoder = TurnEncoder(HEIGHT, WIDTH, keyframe_interval=1)
+    data = encoder.header() + b"".join(encoder.encode(turn, record) for turn, record in enumerate(records))
+
+    _, frames = decode_chunk(data)
+    assert [frame['turn'] for frame in frames] == list(range(20))
+    for turn, (frame, record) in enumerate(zip(frames, records)):
+        assert to_nested(frame, HEIGHT, WIDTH) == expected_nested(turn, record), f"turn {turn}"
+
+
+def test_codec_round_trip_across_keyframes():
+    records = random_records(35)
+    encoder = TurnEncoder(HEIGHT, WIDTH, keyframe_interval=10)
+    data = encoder.header() + b"".join(encoder.encode(turn, record) for turn, record in enumerate(records))
+
+    header, frames = decode_chunk(data)
+    assert [frame['turn'] for frame in frames] == list(range(35))
+    for turn, (frame, record) in enumerate(zip(frames, records)):
+        assert to_nested(frame, HEIGHT, WIDTH) == expected_nested(turn, record), f"turn {turn}"
+
+    # 일부 턴만 요청해도 가장 가까운 키프레임부터 델타를 적용한 같은 결과
+    _, frames = decode_chunk(data, turns={9, 10, 11, 27})
+    assert [frame['turn'] for frame in frames] == [9, 10, 11, 27]
+    for frame in frames:
+        assert to_nested(frame, HEIGHT, WIDTH) == expected_nested(frame['turn'], records[frame['turn']])
+
+
+def test_reader_returns_written_turns(tmp_path):
+    log_dir = str(tmp_path / "logs")
+    os.makedirs(log_dir)
+    records = random_records(60, seed=1)
+    logs = WorldLog(None, None, log_dir=log_dir, shape=(HEIGHT, WIDTH), flush_interval=25, keyframe_interval=10)
+    for record in records:
+        logs.write_turn(record)
+    logs.close()
+
+    reader = TurnLogReader(os.path.join(log_dir, "compressed"))
+    assert reader.turn_count() == 60
+
+    # 키프레임이 아닌 한 턴만 읽기
+    header, frames = reader.read_turns(13, 13)
+    assert header['shape'] == [HEIGHT, WIDTH]
+    assert [to_nested(frame, HEIGHT, WIDTH) for frame in frames] == [expected_nested(13, records[13])]
+
+    # 청크 경계를 넘는 구간 읽기
+    _, frames = reader.read_turns(18, 52)
+    assert [to_nested(frame, HEIGHT, WIDTH) for frame in frames] == [
+        expected_nested(turn, records[turn]) for turn in range(18, 53)
+    ]
+
+
+def test_reader_remaps_index_only_when_size_changes(tmp_path):
+    log_dir = str(tmp_path / "logs")
+    os.makedirs(log_dir)
+    records = random_records(40, seed=2)
+    logs = WorldLog(None, None, log_dir=log_dir, shape=(HEIGHT, WIDTH), flush_interval=25, keyframe_interval=10)
+    for record in records:
+        logs.write_turn(record)
+    logs.close()
+
+    compressed_dir = os.path.join(log_dir, "compressed")
+    reader = TurnLogReader(compressed_dir)
+    index = reader.index()
+    assert isinstance(index, np.memmap) and len(index) == 40
+    assert reader.index() is index
+
+    # 크기가 같으면 다시 매핑하지 않아도 제자리 수정이 보임
+    path = os.path.join(compressed_dir, INDEX_FILENAME)
+    with open(path, "r+b") as f:
+        f.seek(39 * INDEX_DTYPE.itemsize + INDEX_DTYPE.fields['keyframe'][1])
+        f.write(np.array([1], dtype='<u4').tobytes())
+    assert reader.index() is index and index['keyframe'][39] == 1
+
+    # 크기가 바뀌면 다시 매핑 (새 시뮬레이션이 색인을 비운 경우 포함)
+    with open(path, "ab") as f:
+        f.write(np.asarray(index[39:40]).tobytes())
+    assert len(reader.index()) == 41
+    os.truncate(path, 20 * INDEX_DTYPE.itemsize)
+    assert len(reader.index()) == 20 and reader.turn_count() == 20
+    _, frames = reader.read_turns(15, 30)
+    assert [to_nested(frame, HEIGHT, WIDTH) for frame in frames] == [
+        expected_nested(turn, records[turn]) for turn in range(15, 20)
+    ]
+    os.truncate(path, 0)
+    assert len(reader.index()) == 0 and reader.read_turns(0, 5) == (None, [])